@@ -0,0 +1,408 @@
+# analitico.py
+"""
+Estimación analítica (sin simular) de pérdidas y esperas por pool, para filtrar una
+grilla de dotaciones (miles en decenas de milisegundos) antes de pasarla a
+correr_barrido_dotacion.
+- Cada pool es una cadena de nacimiento y muerte M/M/c/2c: c operadores atendiendo y
+  un slot de agenda por operador como capacidad finita. El estado n cuenta trabajos
+  en servicio más agendados; con n = 2c lo que llega se pierde.
+- Con su pool ocupado, IT/TEC toman un DEV libre si hay (derivación) y si no se agendan.
+  DEV recibe sus trabajos y los derivados mientras tiene libres: la probabilidad de DEV
+  libre, la carga derivada y la duración media mezclada de DEV salen de un punto fijo.
+- Abandono de IT/TEC: la espera a la agenda con j slots ocupados se aproxima por la
+  j+1-ésima salida de c servicios exponenciales; si pasa de 30 min (o la espera cruza
+  el cierre) se va con probabilidad 0.5, como en el simulador.
+- La espera media sale por Little (slots ocupados / atendidos) en minutos laborales y
+  se pasa a minutos de reloj: en promedio cada minuto laboral de espera arrastra
+  900/540 minutos de noche.
+- Supone interarribos y servicios exponenciales, el horario 9-18 de todos los días y
+  régimen estacionario (sin calendario, cola de pendientes ni tasa por hora). El error
+  contra la simulación se mide con benchmarks/bench_analitico.py.
+- estimar_dotaciones resuelve toda la grilla junta con NumPy (sin NumPy, una por una).
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from simulacion import MINUTOS_LABORALES_POR_DIA, MINUTOS_POR_DIA, POOLS, TIPO_DEV, ConfiguracionSimulador
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (sin él se resuelve dotación por dotación)
+    np = None
+
+Dotacion = Tuple[int, int, int]  # (IT, TEC, DEV)
+
+PROBABILIDADES_CATEDRA: Dict[str, float] = {"IT": 0.70, "TEC": 0.20, "DEV": 0.10}
+
+ESPERA_MAXIMA_SIN_ABANDONO_MIN: float = 30.0
+PROBABILIDAD_ABANDONO: float = 0.5
+# Minutos de reloj por minuto laboral de espera (la noche que se cruza en promedio)
+RELOJ_POR_MINUTO_LABORAL: float = MINUTOS_POR_DIA / MINUTOS_LABORALES_POR_DIA
+
+TOLERANCIA_PUNTO_FIJO: float = 1e-10
+LOG_MINIMO: float = 1e-300
+ITERACIONES_MAXIMAS: int = 200
+
+
+@dataclass(frozen=True)
+class ParametrosAnaliticos:
+    """Tasa de arribos, mezcla de tipos y duraciones medias (todo en minutos laborales)."""
+    media_interarribo_min: float
+    medias_servicio_min: Dict[str, float]
+    probabilidades_tipo: Dict[str, float] = field(default_factory=lambda: dict(PROBABILIDADES_CATEDRA))
+
+    @property
+    def arribos_por_minuto(self) -> List[float]:
+        """Tasa de arribos de cada tipo, en el orden de POOLS."""
+        return [self.probabilidades_tipo.get(tipo, 0.0) / self.media_interarribo_min for tipo in POOLS]
+
+    @classmethod
+    def desde_config(cls, config: ConfiguracionSimulador) -> ParametrosAnaliticos:
+        """
+        Lee los parámetros de una configuración con los muestreadores exponenciales de
+        muestreadores.py. ValueError si la configuración se sale del modelo.
+        """
+        if config.calendario is not None or config.cola_pendientes or config.tasa_arribos is not None:
+            raise ValueError("la estimación analítica cubre el 9-18 sin calendario, cola de pendientes ni tasa por hora")
+        interarribo = config.muestrear_interarribo_min
+        duracion = config.muestrear_duracion_servicio_min
+        tipo = config.muestrear_tipo_servicio or TipoServicioCategorico()
+        if not (
+            isinstance(interarribo, InterarriboExponencial)
+            and isinstance(duracion, DuracionExponencialPorTipo)
+            and isinstance(tipo, TipoServicioCategorico)
+        ):
+            raise ValueError(
+                "la estimación analítica requiere InterarriboExponencial, DuracionExponencialPorTipo "
+                "y TipoServicioCategorico"
+            )
+        return cls(interarribo.media_min, dict(duracion.medias_min), dict(tipo.probabilidades))
+
+
+@dataclass
+class EstimacionAnalitica:
+    """Una dotación; valores por día (jornada de 9 horas) y espera en minutos de reloj."""
+    dotacion: Dotacion
+    arribos_por_dia: Dict[str, float]
+    perdidos_por_dia: Dict[str, float]
+    atendidos_por_dia: Dict[str, float]
+    derivados_a_dev_por_dia: Dict[str, float]
+    espera_promedio_min: Dict[str, float]
+
+    @property
+    def tasa_perdida(self) -> float:
+        """Fracción de todos los arribos que se pierde."""
+        arribos = sum(self.arribos_por_dia.values())
+        return sum(self.perdidos_por_dia.values()) / arribos if arribos > 0 else 0.0
+
+
+# ------------------------------------------------------------
+# Una dotación (Python puro)
+# ------------------------------------------------------------
+def _aceptacion_agenda(operadores: int, media_servicio: float, abandona: bool) -> List[float]:
+    """Probabilidad de quedarse en la agenda con j = 0..c-1 slots ocupados."""
+    if not abandona:
+        return [1.0] * operadores
+    aceptacion = []
+    espera_media = 0.0
+    for j in range(operadores):
+        espera_media += media_servicio / (operadores - j)  # j+1-ésima salida de c exponenciales
+        supera = math.exp(-ESPERA_MAXIMA_SIN_ABANDONO_MIN / espera_media)
+        cruza_cierre = (1.0 - supera) * espera_media / MINUTOS_LABORALES_POR_DIA
+        aceptacion.append(1.0 - PROBABILIDAD_ABANDONO * (supera + cruza_cierre))
+    return aceptacion
+
+
+def _cadena_pool(operadores: int, tasa_libre: float, tasa_agenda: float, media_servicio: float, aceptacion: List[float]) -> List[float]:
+    """Distribución estacionaria de n = 0..2c (en servicio + agendados)."""
+    pesos = [1.0]
+    for n in range(1, 2 * operadores + 1):
+        tasa = tasa_libre if n <= operadores else tasa_agenda * aceptacion[n - 1 - operadores]
+        pesos.append(pesos[-1] * tasa * media_servicio / min(n, operadores))
+        if pesos[-1] > 1e200:  # pools grandes: se reescala antes de desbordar
+            pesos = [peso / pesos[-1] for peso in pesos]
+    total = sum(pesos)
+    return [peso / total for peso in pesos]
+
+
+def _raiz_dev_libre(libre_dado: Callable[[float], float]) -> float:
+    """
+    Probabilidad de DEV libre consistente: raíz de libre_dado(f) - f en [0, 1] por
+    regula falsi (Illinois). Siempre hay raíz: en 0 la diferencia es >= 0 y en 1, <= 0.
+    """
+    a, b = 0.0, 1.0
+    ha, hb = libre_dado(a) - a, libre_dado(b) - b
+    if abs(ha) < TOLERANCIA_PUNTO_FIJO:
+        return a
+    for _ in range(ITERACIONES_MAXIMAS):
+        if abs(hb) < TOLERANCIA_PUNTO_FIJO or hb == ha:
+            break
+        f = b - hb * (b - a) / (hb - ha)
+        hf = libre_dado(f) - f
+        if hf * hb < 0:
+            a, ha = b, hb
+        else:
+            ha /= 2
+        b, hb = f, hf
+    return b
+
+
+def estimar_dotacion(parametros: ParametrosAnaliticos, dotacion: Dotacion) -> EstimacionAnalitica:
+    operadores = list(dotacion)
+    tasas = parametros.arribos_por_minuto
+    medias = [parametros.medias_servicio_min[tipo] for tipo in POOLS]
+    aceptacion = [_aceptacion_agenda(c, media, codigo != TIPO_DEV) for codigo, (c, media) in enumerate(zip(operadores, medias))]
+    c_dev = operadores[TIPO_DEV]
+
+    def cadenas_con(dev_libre: float) -> List[List[float]]:
+        cadenas = [
+            _cadena_pool(operadores[codigo], tasas[codigo], tasas[codigo] * (1.0 - dev_libre), medias[codigo], aceptacion[codigo])
+            for codigo in range(TIPO_DEV)
+        ]
+        # DEV atiende lo suyo y, mientras tiene libres, lo derivado: duración media mezclada
+        a_dev = [tasas[codigo] * sum(cadena[operadores[codigo]:]) for codigo, cadena in enumerate(cadenas)]
+        total = tasas[TIPO_DEV] + dev_libre * sum(a_dev)
+        carga = tasas[TIPO_DEV] * medias[TIPO_DEV] + dev_libre * sum(t * m for t, m in zip(a_dev, medias))
+        media_dev = carga / total if total > 0 else medias[TIPO_DEV]
+        cadenas.append(_cadena_pool(c_dev, tasas[TIPO_DEV] + sum(a_dev), tasas[TIPO_DEV], media_dev, aceptacion[TIPO_DEV]))
+        return cadenas
+
+    dev_libre = _raiz_dev_libre(lambda f: sum(cadenas_con(f)[TIPO_DEV][:c_dev]))
+    cadenas = cadenas_con(dev_libre)
+
+    perdidos, atendidos, derivados, esperas = [], [], [], []
+    for codigo, cadena in enumerate(cadenas):
+        c = operadores[codigo]
+        pasa_a_agenda = 1.0 if codigo == TIPO_DEV else 1.0 - dev_libre
+        rechazo = sum(p * (1.0 - q) for p, q in zip(cadena[c:], aceptacion[codigo])) + cadena[-1]
+        perdido = tasas[codigo] * pasa_a_agenda * rechazo
+        atendido = tasas[codigo] - perdido
+        agendados = sum(j * p for j, p in enumerate(cadena[c:]))
+        perdidos.append(perdido)
+        atendidos.append(atendido)
+        derivados.append(0.0 if codigo == TIPO_DEV else tasas[codigo] * sum(cadena[c:]) * dev_libre)
+        esperas.append(agendados / atendido * RELOJ_POR_MINUTO_LABORAL if atendido > 0 else 0.0)
+
+    por_dia = MINUTOS_LABORALES_POR_DIA
+    return EstimacionAnalitica(
+        dotacion=tuple(dotacion),
+        arribos_por_dia={tipo: tasa * por_dia for tipo, tasa in zip(POOLS, tasas)},
+        perdidos_por_dia={tipo: valor * por_dia for tipo, valor in zip(POOLS, perdidos)},
+        atendidos_por_dia={tipo: valor * por_dia for tipo, valor in zip(POOLS, atendidos)},
+        derivados_a_dev_por_dia={tipo: valor * por_dia for tipo, valor in zip(POOLS, derivados)},
+        espera_promedio_min=dict(zip(POOLS, esperas)),
+    )
+
+
+# ------------------------------------------------------------
+# Grilla de dotaciones (NumPy: todas las cadenas de un pool juntas)
+# ------------------------------------------------------------
+def _aceptacion_agenda_array(operadores, media_servicio: float, abandona: bool):
+    """(M x cmax): aceptación con j slots ocupados; 1 donde j >= c (no se usa)."""
+    j = np.arange(int(operadores.max(initial=0)))
+    if not abandona or j.size == 0:
+        return np.ones((operadores.size, j.size))
+    restantes = operadores[:, None] - j[None, :]
+    with np.errstate(divide="ignore"):
+        espera_media = np.cumsum(np.where(restantes > 0, media_servicio / restantes, 0.0), axis=1)
+        supera = np.exp(-ESPERA_MAXIMA_SIN_ABANDONO_MIN / espera_media)
+    cruza_cierre = (1.0 - supera) * espera_media / MINUTOS_LABORALES_POR_DIA
+    return np.where(restantes > 0, 1.0 - PROBABILIDAD_ABANDONO * (supera + cruza_cierre), 1.0)
+
+
+class _CadenasPool:
+    """
+    Cadenas de un pool para M dotaciones en forma cerrada (logaritmos, para c grandes):
+    log w_n = m log(tasa_libre * s) - log m! + j log(tasa_agenda * s / c) + sum_{i<j} log q_i,
+    con m = min(n, c) y j = max(n - c, 0). Solo las tasas cambian entre iteraciones.
+    """
+
+    def __init__(self, operadores, aceptacion):
+        c = operadores[:, None]
+        n = np.arange(2 * aceptacion.shape[1] + 1)[None, :]
+        en_servicio = np.minimum(n, c)
+        agendados = np.maximum(n - c, 0)
+        self.operadores = operadores
+        self.todos_ocupados = en_servicio == c
+        self.en_servicio = en_servicio.astype(float)
+        self.agendados = agendados.astype(float)
+        log_factorial = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, aceptacion.shape[1] + 1)))])
+        log_aceptacion = np.concatenate([np.zeros((c.shape[0], 1)), np.cumsum(np.log(aceptacion), axis=1)], axis=1)
+        log_c = np.log(np.maximum(c, 1))
+        fijo = (
+            -log_factorial[en_servicio]
+            + np.take_along_axis(log_aceptacion, np.minimum(agendados, aceptacion.shape[1]), axis=1)
+            - agendados * log_c
+        )
+        self.fijo = np.where(n <= 2 * c, fijo, -np.inf)  # estados que no existen: peso 0
+
+    def distribucion(self, tasa_libre, tasa_agenda, media_servicio):
+        """(M x 2cmax+1): distribución estacionaria de n por fila."""
+        # Tasas nulas: log finito muy negativo (0 * log no da NaN y el peso igual es 0)
+        log_libre = np.log(np.maximum(tasa_libre * media_servicio, LOG_MINIMO))[:, None]
+        log_agenda = np.log(np.maximum(tasa_agenda * media_servicio, LOG_MINIMO))[:, None]
+        log_pesos = self.fijo + self.en_servicio * log_libre + self.agendados * log_agenda
+        pesos = np.exp(log_pesos - log_pesos.max(axis=1, keepdims=True))
+        return pesos / pesos.sum(axis=1, keepdims=True)
+
+    def ocupados(self, distribucion):
+        """P(n >= c): todos los operadores atendiendo."""
+        return (distribucion * self.todos_ocupados).sum(axis=1)
+
+
+def _raiz_dev_libre_array(libre_dado: Callable, filas: int):
+    """_raiz_dev_libre para todas las filas juntas (cada una con su intervalo)."""
+    a, b = np.zeros(filas), np.ones(filas)
+    ha, hb = libre_dado(a) - a, libre_dado(b) - b
+    en_cero = np.abs(ha) < TOLERANCIA_PUNTO_FIJO
+    b, hb = np.where(en_cero, a, b), np.where(en_cero, ha, hb)
+    for _ in range(ITERACIONES_MAXIMAS):
+        activas = (np.abs(hb) >= TOLERANCIA_PUNTO_FIJO) & (hb != ha)
+        if not activas.any():
+            break
+        f = np.where(activas, b - hb * (b - a) / np.where(activas, hb - ha, 1.0), b)
+        hf = libre_dado(f) - f
+        cambia = activas & (hf * hb < 0)
+        a, ha = np.where(cambia, b, a), np.where(cambia, hb, np.where(activas, ha / 2, ha))
+        b, hb = np.where(activas, f, b), np.where(activas, hf, hb)
+    return b
+
+
+@dataclass
+class TablaAnalitica:
+    """
+    Estimaciones de M dotaciones en arreglos (M x 3), columnas en el orden de POOLS.
+    fila(i) arma la EstimacionAnalitica de una.
+    """
+    dotaciones: np.ndarray  # (M x 3) enteros
+    arribos_por_dia: np.ndarray  # (3,)
+    perdidos_por_dia: np.ndarray
+    atendidos_por_dia: np.ndarray
+    derivados_a_dev_por_dia: np.ndarray
+    espera_promedio_min: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dotaciones)
+
+    @property
+    def tasa_perdida(self):
+        return self.perdidos_por_dia.sum(axis=1) / self.arribos_por_dia.sum()
+
+    def fila(self, i: int) -> EstimacionAnalitica:
+        return EstimacionAnalitica(
+            dotacion=tuple(int(c) for c in self.dotaciones[i]),
+            arribos_por_dia=dict(zip(POOLS, self.arribos_por_dia.tolist())),
+            perdidos_por_dia=dict(zip(POOLS, self.perdidos_por_dia[i].tolist())),
+            atendidos_por_dia=dict(zip(POOLS, self.atendidos_por_dia[i].tolist())),
+            derivados_a_dev_por_dia=dict(zip(POOLS, self.derivados_a_dev_por_dia[i].tolist())),
+            espera_promedio_min=dict(zip(POOLS, self.espera_promedio_min[i].tolist())),
+        )
+
+
+def estimar_dotaciones(parametros: ParametrosAnaliticos, dotaciones: Iterable[Dotacion]) -> TablaAnalitica:
+    """Mismas cuentas que estimar_dotacion para toda la grilla a la vez (requiere NumPy)."""
+    if np is None:
+        raise ImportError("estimar_dotaciones requiere NumPy (sin él, estimar_dotacion de a una)")
+    operadores = np.array([tuple(d) for d in dotaciones], dtype=np.int64).reshape(-1, 3)
+    filas = operadores.shape[0]
+    tasas = np.array(parametros.arribos_por_minuto)
+    medias = np.array([parametros.medias_servicio_min[tipo] for tipo in POOLS])
+    aceptacion = [_aceptacion_agenda_array(operadores[:, codigo], medias[codigo], codigo != TIPO_DEV) for codigo in range(3)]
+
+    pools = [_CadenasPool(operadores[:, codigo], aceptacion[codigo]) for codigo in range(3)]
+    tasa_propia = [np.full(filas, tasa) for tasa in tasas]
+    media = [np.full(filas, m) for m in medias]
+
+    def cadenas_con(dev_libre):
+        cadenas = [
+            pools[codigo].distribucion(tasa_propia[codigo], tasas[codigo] * (1.0 - dev_libre), media[codigo])
+            for codigo in range(TIPO_DEV)
+        ]
+        a_dev = [tasas[codigo] * pools[codigo].ocupados(cadena) for codigo, cadena in enumerate(cadenas)]
+        total = tasas[TIPO_DEV] + dev_libre * sum(a_dev)
+        carga = tasas[TIPO_DEV] * medias[TIPO_DEV] + dev_libre * sum(t * m for t, m in zip(a_dev, medias))
+        media_dev = np.where(total > 0, carga / np.where(total > 0, total, 1.0), medias[TIPO_DEV])
+        cadenas.append(pools[TIPO_DEV].distribucion(tasas[TIPO_DEV] + sum(a_dev), tasa_propia[TIPO_DEV], media_dev))
+        return cadenas
+
+    def libre_dado(dev_libre):
+        return 1.0 - pools[TIPO_DEV].ocupados(cadenas_con(dev_libre)[TIPO_DEV])
+
+    dev_libre = _raiz_dev_libre_array(libre_dado, filas)
+    cadenas = cadenas_con(dev_libre)
+    ocupados = [pools[codigo].ocupados(cadenas[codigo]) for codigo in range(TIPO_DEV)]
+
+    perdidos = np.empty((filas, 3))
+    derivados_a_dev = np.zeros((filas, 3))
+    esperas = np.empty((filas, 3))
+    for codigo, cadena in enumerate(cadenas):
+        c = operadores[:, codigo, None]
+        columnas = np.arange(cadena.shape[1])[None, :]
+        j = columnas - c
+        en_agenda = (j >= 0) & (j < c)
+        q = np.take_along_axis(aceptacion[codigo], np.clip(j, 0, max(aceptacion[codigo].shape[1] - 1, 0)), axis=1) \
+            if aceptacion[codigo].shape[1] else np.ones_like(cadena)
+        rechazo = (cadena * np.where(en_agenda, 1.0 - q, 0.0)).sum(axis=1) + np.take_along_axis(cadena, 2 * c, axis=1)[:, 0]
+        pasa_a_agenda = 1.0 if codigo == TIPO_DEV else 1.0 - dev_libre
+        perdidos[:, codigo] = tasas[codigo] * pasa_a_agenda * rechazo
+        if codigo != TIPO_DEV:
+            derivados_a_dev[:, codigo] = tasas[codigo] * ocupados[codigo] * dev_libre
+        atendidos = tasas[codigo] - perdidos[:, codigo]
+        agendados = (cadena * np.where(j > 0, j, 0)).sum(axis=1)
+        esperas[:, codigo] = np.where(atendidos > 0, agendados / np.where(atendidos > 0, atendidos, 1.0), 0.0) * RELOJ_POR_MINUTO_LABORAL
+
+    por_dia = MINUTOS_LABORALES_POR_DIA
+    return TablaAnalitica(
+        dotaciones=operadores,
+        arribos_por_dia=tasas * por_dia,
+        perdidos_por_dia=perdidos * por_dia,
+        atendidos_por_dia=(tasas[None, :] - perdidos) * por_dia,
+        derivados_a_dev_por_dia=derivados_a_dev * por_dia,
+        espera_promedio_min=esperas,
+    )
+
+
+# ------------------------------------------------------------
+# Poda de la grilla antes de simular
+# ------------------------------------------------------------
+def podar_dotaciones(
+    config: ConfiguracionSimulador,
+    dotaciones: Iterable[Dotacion],
+    perdida_maxima: float,
+    espera_maxima_min: Optional[Dict[str, float]] = None,
+    holgura: float = 0.5,
+    maximo: Optional[int] = None,
+) -> List[Dotacion]:
+    """
+    Dotaciones que según la estimación podrían cumplir 'perdida_maxima' (fracción de
+    arribos perdidos) y 'espera_maxima_min' por tipo, con 'holgura' relativa a favor
+    por el error del modelo. Ordenadas de menos a más operadores (hasta 'maximo'),
+    listas para correr_barrido_dotacion.
+    """
+    parametros = ParametrosAnaliticos.desde_config(config)
+    dotaciones = [tuple(d) for d in dotaciones]
+    if not dotaciones:
+        return []
+    if np is not None:
+        tabla = estimar_dotaciones(parametros, dotaciones)
+        tasas_perdida = tabla.tasa_perdida.tolist()
+        esperas = [dict(zip(POOLS, fila)) for fila in tabla.espera_promedio_min.tolist()]
+    else:
+        estimaciones = [estimar_dotacion(parametros, d) for d in dotaciones]
+        tasas_perdida = [e.tasa_perdida for e in estimaciones]
+        esperas = [e.espera_promedio_min for e in estimaciones]
+
+    factor = 1.0 + holgura
+    candidatas = [
+        dotacion
+        for dotacion, tasa, espera in zip(dotaciones, tasas_perdida, esperas)
+        if tasa <= perdida_maxima * factor
+        and all(espera[tipo] <= limite * factor for tipo, limite in (espera_maxima_min or {}).items())
+    ]
+    candidatas.sort(key=sum)
+    return candidatas[:maximo] if maximo is not None else candidatas
+
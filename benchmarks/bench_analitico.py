@@ -0,0 +1,147 @@
+# bench_analitico.py
+"""
+Error de la estimación analítica (analitico.py) contra la simulación en los escenarios
+de bench_simulacion (ejes de operadores por pool y factor de carga), y tiempo de
+estimar una grilla de dotaciones.
+- La simulación se promedia sobre réplicas independientes (correr_replicaciones).
+- Por escenario y tipo reporta pérdidas por día y espera media: simulado (± semi-ancho
+  del IC), estimado y error.
+- Guarda JSON para comparar cambios del modelo.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_analitico --salida analitico.json
+    python -m benchmarks.bench_analitico --rapido --replicaciones 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from analitico import ParametrosAnaliticos, estimar_dotacion, estimar_dotaciones
+from benchmarks.bench_simulacion import (
+    EJES,
+    EJES_RAPIDO,
+    MEDIAS_SERVICIO_MIN,
+    Escenario,
+    escenarios,
+    media_interarribo_para_carga,
+)
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from replicacion import correr_replicaciones
+from simulacion import POOLS, ConfiguracionSimulador
+
+LADO_GRILLA: int = 20  # grilla de tiempo: 1..LADO_GRILLA operadores por pool
+
+
+@dataclass
+class ErrorAnalitico:
+    escenario: Dict
+    tipo_servicio: str
+    perdidos_por_dia_simulado: float
+    perdidos_por_dia_semi_ancho: float
+    perdidos_por_dia_estimado: float
+    espera_promedio_simulada_min: float
+    espera_promedio_semi_ancho_min: float
+    espera_promedio_estimada_min: float
+
+    @property
+    def error_perdidos_por_dia(self) -> float:
+        return self.perdidos_por_dia_estimado - self.perdidos_por_dia_simulado
+
+    @property
+    def error_espera_min(self) -> float:
+        return self.espera_promedio_estimada_min - self.espera_promedio_simulada_min
+
+
+def crear_config(escenario: Escenario) -> ConfiguracionSimulador:
+    n = escenario.operadores_por_pool
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=n,
+        cantidad_operadores_tecnico=n,
+        cantidad_operadores_dev=n,
+        muestrear_interarribo_min=InterarriboExponencial(media_interarribo_para_carga(n, escenario.carga)),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo(MEDIAS_SERVICIO_MIN),
+        muestrear_tipo_servicio=TipoServicioCategorico(),
+        dias=escenario.dias,
+    )
+
+
+def medir_error(escenario: Escenario, replicaciones: int, workers: Optional[int] = None) -> List[ErrorAnalitico]:
+    config = crear_config(escenario)
+    n = escenario.operadores_por_pool
+    estimacion = estimar_dotacion(ParametrosAnaliticos.desde_config(config), (n, n, n))
+    lote = correr_replicaciones(config, replicaciones, workers=workers)
+    errores = []
+    for tipo in POOLS:
+        perdidos = lote.perdidos_por_tipo[tipo]
+        espera = lote.espera_promedio_por_tipo_min[tipo]
+        errores.append(ErrorAnalitico(
+            escenario=asdict(escenario),
+            tipo_servicio=tipo,
+            perdidos_por_dia_simulado=perdidos.media / escenario.dias,
+            perdidos_por_dia_semi_ancho=perdidos.semi_ancho / escenario.dias,
+            perdidos_por_dia_estimado=estimacion.perdidos_por_dia[tipo],
+            espera_promedio_simulada_min=espera.media,
+            espera_promedio_semi_ancho_min=espera.semi_ancho,
+            espera_promedio_estimada_min=estimacion.espera_promedio_min[tipo],
+        ))
+    return errores
+
+
+def medir_grilla(lado: int = LADO_GRILLA) -> Dict[str, float]:
+    """Segundos para estimar las lado^3 dotaciones de 1..lado operadores por pool."""
+    parametros = ParametrosAnaliticos(media_interarribo_para_carga(10, 0.8), dict(MEDIAS_SERVICIO_MIN))
+    grilla = [(i, j, k) for i in range(1, lado + 1) for j in range(1, lado + 1) for k in range(1, lado + 1)]
+    inicio = time.perf_counter()
+    estimar_dotaciones(parametros, grilla)
+    segundos = time.perf_counter() - inicio
+    return {"dotaciones": len(grilla), "segundos": segundos, "us_por_dotacion": segundos / len(grilla) * 1e6}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rapido", action="store_true", help="ejes reducidos (sin 1000 operadores)")
+    parser.add_argument("--replicaciones", type=int, default=16)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    args = parser.parse_args(argv)
+
+    ejes = EJES_RAPIDO if args.rapido else EJES
+    errores = []
+    # Solo los ejes de dotación y carga: la estimación es estacionaria y no depende de los días
+    for escenario in escenarios({eje: ejes[eje] for eje in ("operadores_por_pool", "carga")}):
+        for e in medir_error(escenario, args.replicaciones, args.workers):
+            errores.append(e)
+            nombre = escenario.nombre
+            print(
+                f"{nombre:<36} {e.tipo_servicio:<4}"
+                f" perdidos/día {e.perdidos_por_dia_simulado:9.2f} ±{e.perdidos_por_dia_semi_ancho:6.2f}"
+                f" est {e.perdidos_por_dia_estimado:9.2f} ({e.error_perdidos_por_dia:+8.2f})"
+                f" | espera {e.espera_promedio_simulada_min:8.2f} ±{e.espera_promedio_semi_ancho_min:6.2f}"
+                f" est {e.espera_promedio_estimada_min:8.2f} ({e.error_espera_min:+8.2f})"
+            )
+
+    grilla = medir_grilla()
+    print(f"grilla: {grilla['dotaciones']} dotaciones en {grilla['segundos'] * 1e3:.1f} ms ({grilla['us_por_dotacion']:.1f} us c/u)")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "replicaciones": args.replicaciones,
+                    "errores": [
+                        {**asdict(e), "error_perdidos_por_dia": e.error_perdidos_por_dia, "error_espera_min": e.error_espera_min}
+                        for e in errores
+                    ],
+                    "grilla": grilla,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
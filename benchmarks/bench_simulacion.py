@@ -0,0 +1,184 @@
+# bench_simulacion.py
+"""
+Benchmarks de SimuladorMesaAyuda.correr a lo largo de tres ejes:
+- días simulados (1 a 3650)
+- operadores por pool (1 a 1000, igual cantidad en IT, TEC y DEV)
+- factor de carga (trabajo ofrecido / capacidad total, de liviano a saturado)
+Se varía un eje por vez dejando los otros en el escenario base.
+Reporta eventos/s, ns/evento y memoria pico (tracemalloc, en una segunda corrida
+para no inflar los tiempos) y guarda JSON para comparar entre commits.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_simulacion --salida bench.json
+    python -m benchmarks.bench_simulacion --rapido --comparar bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from simulacion import MOTOR_CALENDARIO, MOTORES, SimuladorMesaAyuda
+
+MEDIAS_SERVICIO_MIN = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+PROBABILIDADES_TIPO = {"IT": 0.70, "TEC": 0.20, "DEV": 0.10}
+
+BASE = {"dias": 30, "operadores_por_pool": 10, "carga": 0.8}
+EJES = {
+    "dias": [1, 10, 100, 365, 3650],
+    "operadores_por_pool": [1, 10, 100, 1000],
+    "carga": [0.3, 0.6, 0.8, 0.95, 1.2],
+}
+EJES_RAPIDO = {
+    "dias": [1, 10, 100],
+    "operadores_por_pool": [1, 10, 100],
+    "carga": [0.3, 0.8, 1.2],
+}
+
+
+@dataclass
+class Escenario:
+    dias: int
+    operadores_por_pool: int
+    carga: float
+
+    @property
+    def nombre(self) -> str:
+        return f"dias={self.dias} ops={self.operadores_por_pool} carga={self.carga}"
+
+
+@dataclass
+class Medicion:
+    escenario: Dict
+    motor: str
+    eventos: int
+    segundos: float
+    eventos_por_segundo: float
+    ns_por_evento: float
+    memoria_pico_bytes: Optional[int]
+
+
+def media_interarribo_para_carga(operadores_por_pool: int, carga: float) -> float:
+    """Interarribo medio tal que trabajo ofrecido / (3 * operadores) == carga."""
+    trabajo_por_arribo = sum(PROBABILIDADES_TIPO[t] * MEDIAS_SERVICIO_MIN[t] for t in PROBABILIDADES_TIPO)
+    return trabajo_por_arribo / (carga * 3 * operadores_por_pool)
+
+
+def crear_simulador(escenario: Escenario, motor: str, seed: int) -> SimuladorMesaAyuda:
+    n = escenario.operadores_por_pool
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=n,
+        cantidad_operadores_tecnico=n,
+        cantidad_operadores_dev=n,
+        muestrear_interarribo_min=InterarriboExponencial(media_interarribo_para_carga(n, escenario.carga)),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo(MEDIAS_SERVICIO_MIN),
+        muestrear_tipo_servicio=TipoServicioCategorico(),
+        seed=seed,
+        motor=motor,
+    )
+
+
+def medir(escenario: Escenario, motor: str, seed: int = 1, memoria: bool = True) -> Medicion:
+    sim = crear_simulador(escenario, motor, seed)
+    inicio = time.perf_counter_ns()
+    sim.correr(escenario.dias)
+    transcurrido_ns = time.perf_counter_ns() - inicio
+    eventos = sim.eventos_procesados
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        crear_simulador(escenario, motor, seed).correr(escenario.dias)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return Medicion(
+        escenario=asdict(escenario),
+        motor=motor,
+        eventos=eventos,
+        segundos=transcurrido_ns / 1e9,
+        eventos_por_segundo=eventos / (transcurrido_ns / 1e9) if transcurrido_ns else 0.0,
+        ns_por_evento=transcurrido_ns / eventos if eventos else 0.0,
+        memoria_pico_bytes=pico,
+    )
+
+
+def escenarios(ejes: Dict[str, List]) -> List[Escenario]:
+    vistos, salida = set(), []
+    for eje, valores in ejes.items():
+        for valor in valores:
+            escenario = Escenario(**{**BASE, eje: valor})
+            if escenario.nombre not in vistos:
+                vistos.add(escenario.nombre)
+                salida.append(escenario)
+    return salida
+
+
+def _commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual: List[dict], anterior: List[dict]):
+    previas = {(json.dumps(m["escenario"], sort_keys=True), m["motor"]): m for m in anterior}
+    for m in actual:
+        previa = previas.get((json.dumps(m["escenario"], sort_keys=True), m["motor"]))
+        if previa is None:
+            continue
+        nombre = Escenario(**m["escenario"]).nombre
+        cambio = previa["ns_por_evento"] / m["ns_por_evento"] if m["ns_por_evento"] else float("nan")
+        print(f"{nombre:<40} {m['motor']:<11} {previa['ns_por_evento']:>10.0f} -> {m['ns_por_evento']:>10.0f} ns/ev  x{cambio:.2f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--motor", choices=MOTORES, action="append", help="repetible; por defecto calendario")
+    parser.add_argument("--rapido", action="store_true", help="ejes reducidos (sin 3650 días ni 1000 operadores)")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir memoria pico")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--salida", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    args = parser.parse_args(argv)
+
+    motores = args.motor or [MOTOR_CALENDARIO]
+    mediciones = []
+    for escenario in escenarios(EJES_RAPIDO if args.rapido else EJES):
+        for motor in motores:
+            m = medir(escenario, motor, seed=args.seed, memoria=not args.sin_memoria)
+            mediciones.append(asdict(m))
+            memoria = f"{m.memoria_pico_bytes / 2**20:8.1f} MiB" if m.memoria_pico_bytes is not None else ""
+            print(
+                f"{escenario.nombre:<40} {motor:<11} {m.eventos:>10} ev "
+                f"{m.eventos_por_segundo:>12.0f} ev/s {m.ns_por_evento:>10.0f} ns/ev {memoria}"
+            )
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "commit": _commit_actual(),
+                    "python": platform.python_version(),
+                    "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "mediciones": mediciones,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            comparar(mediciones, json.load(f)["mediciones"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# cache_resultados.py
+"""
+Cache en disco de resultados de réplicas (SQLite), para notebooks y tableros que
+vuelven a correr las mismas configuraciones.
+- Clave: hash estable de (configuración completa, semilla, antitético, versión del código).
+  Los muestreadores entran por su huella: dataclasses por tipo y parámetros (dicts
+  ordenados), funciones por módulo, nombre y bytecode (con constantes, defaults,
+  closure y los valores actuales de los globales que leen; las funciones auxiliares
+  que llaman, por su propia huella). Los módulos y clases que usan entran por nombre.
+- La versión del código es el hash de los fuentes que deciden el resultado: cambiar
+  el simulador invalida todo lo guardado sin borrar nada a mano.
+- Tamaño acotado: al pasar de 'tamano_maximo_bytes' se desalojan las entradas usadas
+  hace más tiempo (LRU).
+- Varios procesos pueden usar el mismo archivo: WAL + transacciones inmediatas para
+  escribir; cada proceso abre su propia conexión (el objeto viaja por pickle sin ella).
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+import types
+import zlib
+from typing import Any, Callable, Optional
+
+import distribucion
+import muestreadores
+import simulacion
+from simulacion import ConfiguracionSimulador, ResultadoSimulacion
+
+TAMANO_MAXIMO_POR_DEFECTO: int = 256 * 1024 * 1024
+ESPERA_BLOQUEO_S: float = 30.0
+
+# Módulos cuyo código decide el resultado de una réplica
+MODULOS_DEL_RESULTADO = (simulacion, muestreadores, distribucion)
+
+_version_codigo: Optional[str] = None
+
+
+def version_codigo() -> str:
+    global _version_codigo
+    if _version_codigo is None:
+        digest = hashlib.sha256()
+        for modulo in MODULOS_DEL_RESULTADO:
+            with open(modulo.__file__, "rb") as archivo:
+                digest.update(archivo.read())
+        _version_codigo = digest.hexdigest()
+    return _version_codigo
+
+
+def _nombres_codigo(codigo) -> set:
+    """Nombres globales o de atributos que usa el código (incluye funciones anidadas)."""
+    nombres = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if hasattr(constante, "co_code"):
+            nombres |= _nombres_codigo(constante)
+    return nombres
+
+
+def _huella_codigo(codigo, digest):
+    digest.update(codigo.co_code)
+    for constante in codigo.co_consts:
+        if hasattr(constante, "co_code"):
+            _huella_codigo(constante, digest)  # funciones anidadas / lambdas
+        else:
+            digest.update(repr(constante).encode())
+    digest.update(repr(codigo.co_names).encode())
+
+
+def _huella_funcion(funcion: Callable, visitadas: set) -> str:
+    """
+    Bytecode, defaults, closure y los globales que lee (valores actuales; las funciones
+    que llama entran por su propia huella, recursivamente).
+    """
+    nombre = f"{funcion.__module__}.{funcion.__qualname__}"
+    if id(funcion) in visitadas:  # recursión: el código ya está en la huella
+        return nombre
+    visitadas = visitadas | {id(funcion)}
+    codigo = funcion.__code__
+    digest = hashlib.sha256()
+    _huella_codigo(codigo, digest)
+    digest.update(_huella_dato(getattr(funcion, "__defaults__", None), visitadas).encode())
+    digest.update(_huella_dato(getattr(funcion, "__kwdefaults__", None), visitadas).encode())
+    for celda in getattr(funcion, "__closure__", None) or ():
+        digest.update(_huella_dato(celda.cell_contents, visitadas).encode())
+    if hasattr(funcion, "__self__"):  # método ligado: también cuenta la instancia
+        digest.update(_huella_dato(funcion.__self__, visitadas).encode())
+    globales = getattr(funcion, "__globals__", {})
+    for nombre_global in sorted(_nombres_codigo(codigo)):
+        if nombre_global in globales:
+            digest.update(f"{nombre_global}={_huella_dato(globales[nombre_global], visitadas)}".encode())
+    return f"{nombre}:{digest.hexdigest()}"
+
+
+def _huella_dato(valor: Any, visitadas: set) -> str:
+    """
+    Texto estable para un valor: diccionarios y conjuntos ordenados, dataclasses campo por
+    campo, funciones por _huella_funcion, módulos y clases por nombre; el resto por su
+    repr propio o, si no tiene, por pickle.
+    """
+    if valor is None or isinstance(valor, (bool, int, float, complex, str, bytes)):
+        return repr(valor)
+    if isinstance(valor, dict):
+        items = sorted(f"{_huella_dato(k, visitadas)}: {_huella_dato(v, visitadas)}" for k, v in valor.items())
+        return "{" + ", ".join(items) + "}"
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        partes = [_huella_dato(elemento, visitadas) for elemento in valor]
+        if isinstance(valor, (set, frozenset)):
+            partes.sort()
+        return f"{type(valor).__name__}({', '.join(partes)})"
+    if isinstance(valor, types.ModuleType):
+        return f"<módulo {valor.__name__}>"
+    tipo = type(valor)
+    if isinstance(valor, type):
+        return f"<clase {valor.__module__}.{valor.__qualname__}>"
+    if dataclasses.is_dataclass(valor):
+        campos = ", ".join(f"{campo.name}={_huella_dato(getattr(valor, campo.name), visitadas)}" for campo in dataclasses.fields(valor))
+        return f"{tipo.__module__}.{tipo.__qualname__}({campos}){_huella_llamada(tipo, visitadas)}"
+    if getattr(valor, "__code__", None) is not None:
+        return _huella_funcion(valor, visitadas)
+    if hasattr(valor, "dtype") and hasattr(valor, "tobytes"):  # arreglos: el repr se abrevia
+        return f"{tipo.__qualname__}({valor.dtype}, {getattr(valor, 'shape', None)}, {hashlib.sha256(valor.tobytes()).hexdigest()})"
+    if tipo.__repr__ is not object.__repr__ and not callable(valor):
+        return repr(valor)
+    try:
+        estado = hashlib.sha256(pickle.dumps(valor)).hexdigest()
+    except Exception as error:
+        raise ValueError(f"no se puede identificar {valor!r} para la cache") from error
+    return f"{tipo.__module__}.{tipo.__qualname__}:{estado}{_huella_llamada(tipo, visitadas)}"
+
+
+def _huella_llamada(tipo: type, visitadas: set) -> str:
+    """Código de __call__ de las clases fuera de MODULOS_DEL_RESULTADO (p. ej. de un notebook)."""
+    llamada = getattr(tipo, "__call__", None)
+    if getattr(llamada, "__code__", None) is None or tipo.__module__ in {m.__name__ for m in MODULOS_DEL_RESULTADO}:
+        return ""
+    return f"/{_huella_funcion(llamada, visitadas)}"
+
+
+def huella_muestreador(muestreador: Optional[Callable]) -> str:
+    """
+    Texto estable que identifica a un muestreador entre procesos y corridas.
+    ValueError si no hay forma de identificarlo (objetos sin dataclass ni pickle, o que
+    leen un global así).
+    """
+    return _huella_dato(muestreador, set())
+
+
+def clave_resultado(config: ConfiguracionSimulador, semilla: int, antitetico: bool = False) -> str:
+    partes = [f"{campo.name}={_huella_dato(getattr(config, campo.name), set())}" for campo in dataclasses.fields(config)]
+    partes += [f"semilla={semilla!r}", f"antitetico={antitetico!r}", f"codigo={version_codigo()}"]
+    return hashlib.sha256("\n".join(partes).encode()).hexdigest()
+
+
+class CacheResultados:
+    """
+    Uso:
+        cache = CacheResultados("resultados.sqlite")
+        resultado = cache.correr(config, semilla)      # corre solo si no estaba
+        correr_replicaciones(config, 100, cache=cache)
+    """
+
+    def __init__(self, ruta: str, tamano_maximo_bytes: int = TAMANO_MAXIMO_POR_DEFECTO):
+        self.ruta = ruta
+        self.tamano_maximo_bytes = tamano_maximo_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self._conexion: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def __getstate__(self) -> dict:
+        estado = self.__dict__.copy()
+        estado["_conexion"] = None
+        estado["_pid"] = None
+        return estado
+
+    def _conectar(self) -> sqlite3.Connection:
+        # Una conexión por proceso: una heredada por fork no se puede usar
+        if self._conexion is None or self._pid != os.getpid():
+            conexion = sqlite3.connect(self.ruta, timeout=ESPERA_BLOQUEO_S, isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute(
+                "CREATE TABLE IF NOT EXISTS resultados ("
+                " clave TEXT PRIMARY KEY, valor BLOB NOT NULL, tamano INTEGER NOT NULL, ultimo_uso INTEGER NOT NULL)"
+            )
+            conexion.execute("CREATE INDEX IF NOT EXISTS resultados_ultimo_uso ON resultados (ultimo_uso)")
+            self._conexion, self._pid = conexion, os.getpid()
+        return self._conexion
+
+    def cerrar(self):
+        if self._conexion is not None and self._pid == os.getpid():
+            self._conexion.close()
+        self._conexion = self._pid = None
+
+    def __enter__(self) -> CacheResultados:
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # -----------------------------
+    # Lectura / escritura
+    # -----------------------------
+    def obtener(self, config: ConfiguracionSimulador, semilla: int, antitetico: bool = False) -> Optional[ResultadoSimulacion]:
+        clave = clave_resultado(config, semilla, antitetico)
+        conexion = self._conectar()
+        fila = conexion.execute("SELECT valor FROM resultados WHERE clave = ?", (clave,)).fetchone()
+        if fila is None:
+            self.fallos += 1
+            return None
+        conexion.execute("UPDATE resultados SET ultimo_uso = ? WHERE clave = ?", (time.time_ns(), clave))
+        self.aciertos += 1
+        return pickle.loads(zlib.decompress(fila[0]))
+
+    def guardar(self, config: ConfiguracionSimulador, semilla: int, resultado: ResultadoSimulacion, antitetico: bool = False):
+        clave = clave_resultado(config, semilla, antitetico)
+        valor = zlib.compress(pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL))
+        conexion = self._conectar()
+        conexion.execute("BEGIN IMMEDIATE")
+        try:
+            conexion.execute(
+                "INSERT OR REPLACE INTO resultados (clave, valor, tamano, ultimo_uso) VALUES (?, ?, ?, ?)",
+                (clave, valor, len(valor), time.time_ns()),
+            )
+            self._desalojar(conexion)
+            conexion.execute("COMMIT")
+        except BaseException:
+            conexion.execute("ROLLBACK")
+            raise
+
+    def _desalojar(self, conexion: sqlite3.Connection):
+        """Borra las menos usadas hasta volver bajo el tamaño máximo (dentro de la transacción)."""
+        total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM resultados").fetchone()[0]
+        if total <= self.tamano_maximo_bytes:
+            return
+        sobrante = total - self.tamano_maximo_bytes
+        borrar = []
+        for clave, tamano in conexion.execute("SELECT clave, tamano FROM resultados ORDER BY ultimo_uso"):
+            if sobrante <= 0:
+                break
+            borrar.append((clave,))
+            sobrante -= tamano
+        conexion.executemany("DELETE FROM resultados WHERE clave = ?", borrar)
+
+    def correr(self, config: ConfiguracionSimulador, semilla: int, antitetico: bool = False) -> ResultadoSimulacion:
+        """config.correr(semilla, antitetico), salvo que ya esté guardado."""
+        resultado = self.obtener(config, semilla, antitetico)
+        if resultado is None:
+            resultado = config.correr(semilla, antitetico)
+            self.guardar(config, semilla, resultado, antitetico)
+        return resultado
+
+    # -----------------------------
+    # Estado
+    # -----------------------------
+    def __len__(self) -> int:
+        return self._conectar().execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    @property
+    def tamano_bytes(self) -> int:
+        return self._conectar().execute("SELECT COALESCE(SUM(tamano), 0) FROM resultados").fetchone()[0]
+
+    def limpiar(self):
+        self._conectar().execute("DELETE FROM resultados")
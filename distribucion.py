@@ -0,0 +1,267 @@
+# distribucion.py
+"""
+Estimadores en línea de la distribución de la espera, con memoria acotada.
+- Welford: media y varianza sin guardar muestras; se combinan entre réplicas (Chan et al.).
+- TDigest: sketch de cuantiles (t-digest con fusión, Dunning 2019); O(compresion) centroides
+  y se combina fusionando centroides, así que p90/p99 salen de varias réplicas juntas.
+- DistribucionEspera junta ambos detrás de un buffer: en el loop solo se hace un append.
+  Con NumPy el volcado del buffer (orden y momentos) es vectorizado; sin NumPy, Python puro.
+"""
+from __future__ import annotations
+
+import copy
+import math
+import operator
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+# Con 100 el p99 de esperas con cola pesada salía corrido ~5% de la cola (siempre hacia
+# arriba: la media de un centroide de la cola queda sobre su cuantil central); con 200 ~1%
+COMPRESION_POR_DEFECTO: float = 200.0
+TAMANO_BUFFER_ESPERAS: int = 4096  # el volcado cuesta ~ por centroide: buffer grande lo amortiza
+
+
+@dataclass
+class Welford:
+    n: int = 0
+    media: float = 0.0
+    m2: float = 0.0  # suma de cuadrados de desvíos respecto de la media
+
+    def agregar_lote(self, valores: Sequence[float]):
+        if valores:
+            n = len(valores)
+            media = math.fsum(valores) / n
+            # Dos pasadas (desvíos respecto de la media del lote, como la rama NumPy de
+            # DistribucionEspera.vaciar): sin cancelación si las esperas comparten un offset
+            desvios = [valor - media for valor in valores]
+            m2 = math.fsum(map(operator.mul, desvios, desvios))
+            self.combinar(Welford(n, media, m2))
+
+    def combinar(self, otro: Welford):
+        """Fórmula paralela de Chan: mismo resultado que agregar los valores de a uno."""
+        if otro.n == 0:
+            return
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / n
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.n = n
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (n - 1); 0 con menos de dos valores."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desvio(self) -> float:
+        return math.sqrt(self.varianza)
+
+
+def _k(q: float, compresion: float) -> float:
+    # Escala k1: centroides finos en las colas, gruesos en el medio
+    return compresion / (2 * math.pi) * math.asin(2 * q - 1)
+
+
+def _q_limite(q: float, compresion: float) -> float:
+    # Mayor q alcanzable por un centroide que empieza en q sin pasar de una unidad de k
+    k = _k(q, compresion) + 1
+    if k >= compresion / 4:
+        return 1.0
+    return (math.sin(2 * math.pi * k / compresion) + 1) / 2
+
+
+@dataclass
+class TDigest:
+    compresion: float = COMPRESION_POR_DEFECTO
+    medias: List[float] = field(default_factory=list)
+    pesos: List[float] = field(default_factory=list)
+    minimo: float = math.inf
+    maximo: float = -math.inf
+
+    @property
+    def total(self) -> float:
+        return math.fsum(self.pesos)
+
+    def agregar_lote(self, valores: Sequence[float]):
+        if valores:
+            self.agregar_ordenados(sorted(valores))
+
+    def agregar_ordenados(self, ordenados: List[float]):
+        if ordenados:
+            self.minimo = min(self.minimo, ordenados[0])
+            self.maximo = max(self.maximo, ordenados[-1])
+            self._fusionar(ordenados, None, unitarios=True)
+
+    def combinar(self, otro: TDigest):
+        if otro.pesos:
+            self.minimo = min(self.minimo, otro.minimo)
+            self.maximo = max(self.maximo, otro.maximo)
+            self._fusionar(otro.medias, otro.pesos, unitarios=False)
+
+    def _fusionar(self, medias_nuevas: List[float], pesos_nuevos: Optional[List[float]], unitarios: bool):
+        """
+        Recorre en orden los centroides propios y los nuevos (ambos ordenados) y los
+        vuelve a agrupar: un grupo acepta puntos mientras no pase el límite de la escala k.
+        Con puntos unitarios las tiradas entre dos centroides se toman de a rebanadas
+        (sum en C), así el costo por volcado es por centroide y no por punto.
+        """
+        compresion = self.compresion
+        viejas, pesos_viejos = self.medias, self.pesos
+        total = math.fsum(pesos_viejos) + (len(medias_nuevas) if unitarios else math.fsum(pesos_nuevos))
+        medias: List[float] = []
+        pesos: List[float] = []
+
+        suma_actual = peso_actual = 0.0
+        acumulado = 0.0
+        limite = total * _q_limite(0.0, compresion)
+        i = j = 0
+        cantidad_nuevos, cantidad_viejos = len(medias_nuevas), len(viejas)
+        while i < cantidad_nuevos or j < cantidad_viejos:
+            proxima_vieja = viejas[j] if j < cantidad_viejos else math.inf
+            if i < cantidad_nuevos and medias_nuevas[i] <= proxima_vieja:
+                if unitarios:
+                    fin = bisect_right(medias_nuevas, proxima_vieja, i) if j < cantidad_viejos else cantidad_nuevos
+                    cabe = int(limite - acumulado - peso_actual)
+                    if cabe < 1 and peso_actual == 0:
+                        cabe = 1  # un grupo vacío siempre toma al menos un punto
+                    tomar = min(cabe, fin - i)
+                    if tomar > 0:
+                        suma_actual += sum(medias_nuevas[i:i + tomar])
+                        peso_actual += tomar
+                        i += tomar
+                        continue
+                else:
+                    media, peso = medias_nuevas[i], pesos_nuevos[i]
+                    if peso_actual == 0 or acumulado + peso_actual + peso <= limite:
+                        suma_actual += media * peso
+                        peso_actual += peso
+                        i += 1
+                        continue
+            else:
+                media, peso = viejas[j], pesos_viejos[j]
+                if peso_actual == 0 or acumulado + peso_actual + peso <= limite:
+                    suma_actual += media * peso
+                    peso_actual += peso
+                    j += 1
+                    continue
+
+            # El próximo punto no entra: se cierra el grupo
+            medias.append(suma_actual / peso_actual)
+            pesos.append(peso_actual)
+            acumulado += peso_actual
+            limite = total * _q_limite(acumulado / total, compresion)
+            suma_actual = peso_actual = 0.0
+
+        if peso_actual:
+            medias.append(suma_actual / peso_actual)
+            pesos.append(peso_actual)
+        self.medias, self.pesos = medias, pesos
+
+    def cuantil(self, q: float) -> float:
+        """Interpola linealmente entre centros de centroides; las puntas van a mínimo/máximo."""
+        if not 0 <= q <= 1:
+            raise ValueError("q debe estar en [0, 1]")
+        if not self.pesos:
+            return math.nan
+        medias, pesos = self.medias, self.pesos
+        if len(medias) == 1:
+            return medias[0]
+
+        objetivo = q * self.total
+        if objetivo <= pesos[0] / 2:
+            return self.minimo + (medias[0] - self.minimo) * objetivo / (pesos[0] / 2)
+
+        centro = pesos[0] / 2
+        for i in range(len(medias) - 1):
+            siguiente = centro + (pesos[i] + pesos[i + 1]) / 2
+            if objetivo <= siguiente:
+                return medias[i] + (medias[i + 1] - medias[i]) * (objetivo - centro) / (siguiente - centro)
+            centro = siguiente
+
+        resto = self.total - centro
+        if resto <= 0:
+            return self.maximo
+        return medias[-1] + (self.maximo - medias[-1]) * min((objetivo - centro) / resto, 1.0)
+
+
+@dataclass
+class DistribucionEspera:
+    """
+    Espera de un tipo de trabajo: n, media, varianza (Welford) y cuantiles (t-digest).
+    agregar() solo acumula en un buffer; el buffer se vuelca de a TAMANO_BUFFER_ESPERAS.
+    """
+    welford: Welford = field(default_factory=Welford)
+    digest: TDigest = field(default_factory=TDigest)
+    buffer: List[float] = field(default_factory=list)
+
+    def agregar(self, espera: float):
+        buffer = self.buffer
+        buffer.append(espera)
+        if len(buffer) >= TAMANO_BUFFER_ESPERAS:
+            self.vaciar()
+
+    def vaciar(self):
+        buffer = self.buffer
+        if not buffer:
+            return
+        self.buffer = []
+        if np is None:
+            self.welford.agregar_lote(buffer)
+            self.digest.agregar_lote(buffer)
+            return
+        ordenados = np.sort(np.asarray(buffer, dtype=float))
+        media = float(ordenados.mean())
+        desvios = ordenados - media
+        self.welford.combinar(Welford(len(buffer), media, float(desvios @ desvios)))
+        self.digest.agregar_ordenados(ordenados.tolist())
+
+    def combinar(self, otra: DistribucionEspera):
+        self.vaciar()
+        otra.vaciar()
+        self.welford.combinar(otra.welford)
+        self.digest.combinar(otra.digest)
+
+    def copia(self) -> DistribucionEspera:
+        """
+        Copia con el buffer ya volcado (la que se entrega en los resultados). El original
+        no se vuelca: los lotes siguen cortando igual y continuar() da el mismo sketch.
+        """
+        copia = copy.deepcopy(self)
+        copia.vaciar()
+        return copia
+
+    @property
+    def n(self) -> int:
+        return self.welford.n + len(self.buffer)
+
+    @property
+    def media(self) -> float:
+        self.vaciar()
+        return self.welford.media
+
+    @property
+    def varianza(self) -> float:
+        self.vaciar()
+        return self.welford.varianza
+
+    @property
+    def desvio(self) -> float:
+        return math.sqrt(self.varianza)
+
+    def cuantil(self, q: float) -> float:
+        self.vaciar()
+        return self.digest.cuantil(q)
+
+
+def combinar_distribuciones(distribuciones: Sequence[DistribucionEspera]) -> DistribucionEspera:
+    """Distribución conjunta de varias réplicas (no modifica las originales salvo vaciar buffers)."""
+    combinada = DistribucionEspera()
+    for distribucion in distribuciones:
+        combinada.combinar(distribucion)
+    return combinada
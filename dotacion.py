@@ -0,0 +1,278 @@
+# dotacion.py
+"""
+Barrido de dotaciones (IT, TEC, DEV) con números aleatorios comunes.
+- Por réplica se pre-sortea UNA vez el flujo de interarribos, tipos y duraciones
+  (los mismos bloques que sortearían los cursores del simulador con esa semilla)
+  y se reproduce en todas las dotaciones: las diferencias entre dotaciones salen
+  de la dotación y no del ruido de muestreo.
+- Requiere muestreadores con 'muestrear_bloque'. Si la configuración no trae
+  muestrear_tipo_servicio se usa TipoServicioCategorico() (70/20/10).
+- Con tasa_arribos los arribos salen de la tasa por hora (cursor "arribos", igual en
+  todas las dotaciones con la misma semilla): no se pre-sortean interarribos y los
+  tipos y duraciones se dimensionan con los arribos de la tasa.
+- Para achicar una grilla grande antes de simularla: analitico.podar_dotaciones.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from estadisticas import intervalo_confianza
+from muestreadores import TipoServicioCategorico
+from replicacion import derivar_semillas
+from simulacion import (
+    FIN_TURNO_MIN,
+    MINUTOS_LABORALES_POR_DIA,
+    MINUTOS_POR_DIA,
+    POOLS,
+    ArribosNoHomogeneos,
+    ConfiguracionSimulador,
+    CursorBloques,
+    ResultadoSimulacion,
+    admite_bloques,
+    rng_de_cursor,
+)
+
+Dotacion = Tuple[int, int, int]  # (IT, TEC, DEV)
+
+
+# ------------------------------------------------------------
+# Flujo pre-sorteado y su reproducción
+# ------------------------------------------------------------
+class ReproduccionBloques:
+    """
+    Envuelve un muestreador con bloques: el primer pedido de cada clave devuelve
+    todo lo pre-sorteado; después sigue con el muestreador base desde el estado
+    en que quedó el rng al pre-sortear. Se crea una por simulador (tiene estado).
+    """
+
+    def __init__(self, base, valores: Dict[tuple, list], estados_rng: Dict[tuple, tuple]):
+        self.base = base
+        self.valores = valores
+        self.estados_rng = estados_rng
+        self._entregadas = set()
+
+    def __call__(self, *argumentos):
+        return self.base(*argumentos)
+
+    def muestrear_bloque(self, *argumentos_rng_n):
+        *argumentos, rng, n = argumentos_rng_n
+        clave = tuple(argumentos)
+        if clave not in self._entregadas:
+            self._entregadas.add(clave)
+            return self.valores[clave]
+        if clave in self.estados_rng:
+            rng.setstate(self.estados_rng.pop(clave))
+        return self.base.muestrear_bloque(*argumentos, rng, n)
+
+
+@dataclass
+class FlujoPremuestreado:
+    semilla: int
+    interarribos: List[float]  # vacío con tasa_arribos
+    tipos: List[str]
+    duraciones_por_tipo: Dict[str, List[float]]
+    estados_rng: Dict[str, tuple]  # por nombre de cursor, para continuar si se agota
+
+    def muestreadores(self, config: ConfiguracionSimulador):
+        """Muestreadores (interarribo, duración, tipo) que reproducen este flujo."""
+        interarribo = config.muestrear_interarribo_min
+        if "interarribo" in self.estados_rng:
+            interarribo = ReproduccionBloques(interarribo, {(): self.interarribos}, {(): self.estados_rng["interarribo"]})
+        tipo = ReproduccionBloques(
+            _muestreador_tipo(config), {(): self.tipos}, {(): self.estados_rng["tipo"]}
+        )
+        duracion = ReproduccionBloques(
+            config.muestrear_duracion_servicio_min,
+            {(t,): self.duraciones_por_tipo[t] for t in POOLS},
+            {(t,): self.estados_rng[f"duracion/{t}"] for t in POOLS},
+        )
+        return interarribo, duracion, tipo
+
+
+def _muestreador_tipo(config: ConfiguracionSimulador):
+    return config.muestrear_tipo_servicio or TipoServicioCategorico()
+
+
+def _tomar_bloques(cursor: CursorBloques, alcanza) -> list:
+    valores: list = []
+    while not alcanza(valores):
+        valores.extend(cursor.siguiente_bloque())
+    return valores
+
+
+def _arribos_con_tasa(config: ConfiguracionSimulador, semilla: int) -> int:
+    """Arribos de la tasa por hora hasta el cierre del último día (mismo rng que el simulador), más dos."""
+    if config.calendario is None:
+        fin = (config.dias - 1) * MINUTOS_POR_DIA + FIN_TURNO_MIN
+    else:
+        fin = config.calendario.fin_de_dia(config.dias - 1)
+    arribos = ArribosNoHomogeneos(config.tasa_arribos, rng_de_cursor(semilla, "arribos"), lambda tiempo: tiempo)
+    cantidad = 0
+    while arribos.siguiente_arribo() <= fin:
+        cantidad += 1
+    return cantidad + 2  # como con interarribos: el que llega después del cierre y el siguiente
+
+
+def premuestrear_flujo(config: ConfiguracionSimulador, semilla: int) -> FlujoPremuestreado:
+    """
+    Sortea con los mismos cursores (y rngs) que usaría el simulador hasta cubrir
+    config.dias jornadas de arribos, más el arribo que cae después del cierre.
+    Con tasa_arribos solo tipos y duraciones (los interarribos no se usan).
+    """
+    muestreadores = [config.muestrear_duracion_servicio_min, _muestreador_tipo(config)]
+    if config.tasa_arribos is None:
+        muestreadores.append(config.muestrear_interarribo_min)
+    if not all(admite_bloques(m) for m in muestreadores):
+        raise ValueError("el barrido con números comunes requiere muestreadores con 'muestrear_bloque'")
+
+    rngs = {"tipo": rng_de_cursor(semilla, "tipo")}
+    if config.tasa_arribos is not None:
+        interarribos: List[float] = []
+        necesarios = _arribos_con_tasa(config, semilla)
+    else:
+        horizonte = config.dias * MINUTOS_LABORALES_POR_DIA
+        if config.calendario is not None:
+            calendario = config.calendario
+            horizonte = calendario.minutos_laborales_acumulados(calendario.fin_de_dia(config.dias - 1))
+
+        def arribos_necesarios(interarribos) -> int:
+            acumulado = 0.0
+            for k, interarribo in enumerate(interarribos):
+                acumulado += interarribo
+                if acumulado > horizonte:
+                    return k + 2  # el arribo que puede procesarse después del cierre y el siguiente TPLL
+            return len(interarribos) + 1
+
+        rngs["interarribo"] = rng_de_cursor(semilla, "interarribo")
+        cursor = CursorBloques(config.muestrear_interarribo_min.muestrear_bloque, (), rngs["interarribo"])
+        interarribos = _tomar_bloques(cursor, lambda v: arribos_necesarios(v) <= len(v))
+        necesarios = arribos_necesarios(interarribos)
+
+    cursor = CursorBloques(_muestreador_tipo(config).muestrear_bloque, (), rngs["tipo"])
+    tipos = _tomar_bloques(cursor, lambda v: len(v) >= necesarios)
+
+    duraciones_por_tipo = {}
+    for tipo in POOLS:
+        nombre = f"duracion/{tipo}"
+        rngs[nombre] = rng_de_cursor(semilla, nombre)
+        cantidad = tipos[:necesarios].count(tipo)
+        cursor = CursorBloques(config.muestrear_duracion_servicio_min.muestrear_bloque, (tipo,), rngs[nombre])
+        duraciones_por_tipo[tipo] = _tomar_bloques(cursor, lambda v: len(v) >= max(cantidad, 1))
+
+    return FlujoPremuestreado(
+        semilla=semilla,
+        interarribos=interarribos,
+        tipos=tipos,
+        duraciones_por_tipo=duraciones_por_tipo,
+        estados_rng={nombre: rng.getstate() for nombre, rng in rngs.items()},
+    )
+
+
+def correr_con_flujo(config: ConfiguracionSimulador, flujo: FlujoPremuestreado) -> ResultadoSimulacion:
+    interarribo, duracion, tipo = flujo.muestreadores(config)
+    config_flujo = replace(
+        config,
+        muestrear_interarribo_min=interarribo,
+        muestrear_duracion_servicio_min=duracion,
+        muestrear_tipo_servicio=tipo,
+    )
+    return config_flujo.correr(flujo.semilla)
+
+
+# ------------------------------------------------------------
+# Barrido
+# ------------------------------------------------------------
+@dataclass
+class FilaDotacion:
+    """Una fila por (dotación, tipo): tabla 'tidy'."""
+    cantidad_operadores_it: int
+    cantidad_operadores_tecnico: int
+    cantidad_operadores_dev: int
+    tipo_servicio: str
+    replicaciones: int
+    perdidos_media: float
+    perdidos_semi_ancho: float
+    atendidos_media: float
+    atendidos_semi_ancho: float
+    espera_promedio_media_min: float
+    espera_promedio_semi_ancho_min: float
+
+
+def _correr_tarea(argumentos) -> List[ResultadoSimulacion]:
+    config_base, dotaciones, semilla = argumentos
+    flujo = premuestrear_flujo(config_base, semilla)
+    return [correr_con_flujo(_con_dotacion(config_base, d), flujo) for d in dotaciones]
+
+
+def _con_dotacion(config: ConfiguracionSimulador, dotacion: Dotacion) -> ConfiguracionSimulador:
+    it, tec, dev = dotacion
+    return replace(config, cantidad_operadores_it=it, cantidad_operadores_tecnico=tec, cantidad_operadores_dev=dev)
+
+
+def _partir(dotaciones: List[Dotacion], partes: int) -> List[List[Dotacion]]:
+    tamano = -(-len(dotaciones) // max(1, partes))
+    return [dotaciones[i:i + tamano] for i in range(0, len(dotaciones), tamano)]
+
+
+def correr_barrido_dotacion(
+    config_base: ConfiguracionSimulador,
+    dotaciones: Iterable[Dotacion],
+    replicaciones: int,
+    workers: Optional[int] = None,
+    semilla_maestra: int = 1,
+    nivel_confianza: float = 0.95,
+) -> List[FilaDotacion]:
+    """
+    Evalúa cada dotación (IT, TEC, DEV) con las mismas 'replicaciones' semillas.
+    Las tareas son (réplica, grupo de dotaciones): cada una pre-sortea su flujo una vez.
+    """
+    dotaciones = [tuple(d) for d in dotaciones]
+    if replicaciones < 1:
+        raise ValueError("replicaciones debe ser >= 1")
+    if not dotaciones:
+        return []
+
+    semillas = derivar_semillas(semilla_maestra, replicaciones)
+    workers = workers or os.cpu_count() or 1
+    grupos = _partir(dotaciones, -(-4 * workers // replicaciones))
+    tareas = [(config_base, grupo, semilla) for semilla in semillas for grupo in grupos]
+
+    if workers == 1:
+        salidas = [_correr_tarea(t) for t in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            salidas = list(pool.map(_correr_tarea, tareas))
+
+    # resultados[dotacion] = una ResultadoSimulacion por réplica (en orden de semillas)
+    resultados: Dict[Dotacion, List[ResultadoSimulacion]] = {d: [] for d in dotaciones}
+    for (_, grupo, _), salida in zip(tareas, salidas):
+        for dotacion, resultado in zip(grupo, salida):
+            resultados[dotacion].append(resultado)
+
+    return [
+        _fila(dotacion, tipo, resultados[dotacion], nivel_confianza)
+        for dotacion in dotaciones
+        for tipo in POOLS
+    ]
+
+
+def _fila(dotacion: Dotacion, tipo: str, resultados: Sequence[ResultadoSimulacion], nivel: float) -> FilaDotacion:
+    perdidos = intervalo_confianza([r.perdidos_por_tipo[tipo] for r in resultados], nivel)
+    atendidos = intervalo_confianza([r.atendidos_por_tipo[tipo] for r in resultados], nivel)
+    espera = intervalo_confianza([r.espera_promedio_por_tipo_min[tipo] for r in resultados], nivel)
+    return FilaDotacion(
+        cantidad_operadores_it=dotacion[0],
+        cantidad_operadores_tecnico=dotacion[1],
+        cantidad_operadores_dev=dotacion[2],
+        tipo_servicio=tipo,
+        replicaciones=len(resultados),
+        perdidos_media=perdidos.media,
+        perdidos_semi_ancho=perdidos.semi_ancho,
+        atendidos_media=atendidos.media,
+        atendidos_semi_ancho=atendidos.semi_ancho,
+        espera_promedio_media_min=espera.media,
+        espera_promedio_semi_ancho_min=espera.semi_ancho,
+    )
@@ -0,0 +1,121 @@
+# estadisticas.py
+"""
+Estadística de salida para réplicas: intervalos de confianza con t de Student
+y detección del transitorio inicial (MSER-5).
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Sequence
+
+
+def cuantil_t(probabilidad: float, grados_libertad: int) -> float:
+    """
+    Cuantil 'probabilidad' (0.5 < p < 1) de la t de Student.
+    Aproximación de Hill (1970, Algorithm 396): error < 1e-5 para gl >= 1.
+    """
+    if not 0.5 < probabilidad < 1:
+        raise ValueError("probabilidad debe estar en (0.5, 1)")
+    if grados_libertad < 1:
+        raise ValueError("grados_libertad debe ser >= 1")
+
+    n = grados_libertad
+    p = 2 * (1 - probabilidad)  # probabilidad de las dos colas
+    if n == 1:
+        return math.cos(p * math.pi / 2) / math.sin(p * math.pi / 2)
+    if n == 2:
+        return math.sqrt(2 / (p * (2 - p)) - 2)
+
+    a = 1 / (n - 0.5)
+    b = 48 / (a * a)
+    c = ((20700 * a / b - 98) * a - 16) * a + 96.36
+    d = ((94.5 / (b + c) - 3) / b + 1) * math.sqrt(a * math.pi / 2) * n
+    x = d * p
+    y = x ** (2 / n)
+    if y > 0.05 + a:
+        x = NormalDist().inv_cdf(p * 0.5)
+        y = x * x
+        if n < 5:
+            c += 0.3 * (n - 4.5) * (x + 0.6)
+        c = (((0.05 * d * x - 5) * x - 7) * x - 2) * x + b + c
+        y = (((((0.4 * y + 6.3) * y + 36) * y + 94.5) / c - y - 3) / b + 1) * x
+        y = a * y * y
+        y = math.expm1(y) if y > 0.1 else ((y + 4) * y + 12) * y * y / 24 + y
+    else:
+        y = ((1 / (((n + 6) / (n * y) - 0.089 * d - 0.822) * (n + 2) * 3)
+              + 0.5 / (n + 4)) * y - 1) * (n + 1) / (n + 2) + 1 / y
+    return math.sqrt(n * y)
+
+
+@dataclass
+class IntervaloConfianza:
+    media: float
+    desvio: float       # desvío estándar muestral (n - 1)
+    semi_ancho: float   # media ± semi_ancho
+    n: int
+
+    @property
+    def inferior(self) -> float:
+        return self.media - self.semi_ancho
+
+    @property
+    def superior(self) -> float:
+        return self.media + self.semi_ancho
+
+    @property
+    def semi_ancho_relativo(self) -> float:
+        if self.media == 0:
+            return 0.0 if self.semi_ancho == 0 else math.inf
+        return self.semi_ancho / abs(self.media)
+
+
+def intervalo_confianza(valores: Sequence[float], nivel: float = 0.95) -> IntervaloConfianza:
+    """
+    IC para la media de réplicas independientes: media ± t(1-α/2, n-1) * s / sqrt(n).
+    Con una sola réplica el semi-ancho es infinito.
+    """
+    n = len(valores)
+    if n == 0:
+        raise ValueError("se necesita al menos un valor")
+    media = math.fsum(valores) / n
+    if n == 1:
+        return IntervaloConfianza(media=media, desvio=0.0, semi_ancho=math.inf, n=1)
+
+    varianza = math.fsum((v - media) ** 2 for v in valores) / (n - 1)
+    desvio = math.sqrt(varianza)
+    semi_ancho = cuantil_t(1 - (1 - nivel) / 2, n - 1) * desvio / math.sqrt(n)
+    return IntervaloConfianza(media=media, desvio=desvio, semi_ancho=semi_ancho, n=n)
+
+
+def truncamiento_mser(serie: Sequence[float], tamano_lote: int = 5) -> int:
+    """
+    Cantidad de observaciones iniciales a descartar según MSER (MSER-5 con el lote por defecto).
+    - Se promedia la serie en lotes de 'tamano_lote' (el resto final se ignora).
+    - Para cada d se calcula sum_{j>=d} (Z_j - media_d)^2 / (k - d)^2 y se elige el mínimo,
+      buscando solo en la primera mitad de los lotes (White, 1997).
+    """
+    if tamano_lote < 1:
+        raise ValueError("tamano_lote debe ser >= 1")
+    k = len(serie) // tamano_lote
+    if k < 2:
+        return 0
+    lotes = [math.fsum(serie[j * tamano_lote:(j + 1) * tamano_lote]) / tamano_lote for j in range(k)]
+
+    # Sumas de cola: para cada d, suma y suma de cuadrados de Z_d..Z_{k-1}
+    mejor_d, mejor_valor = 0, math.inf
+    suma = cuadrados = 0.0
+    colas = []
+    for z in reversed(lotes):
+        suma += z
+        cuadrados += z * z
+        colas.append((suma, cuadrados))
+    colas.reverse()
+    for d in range(k // 2 + 1):
+        restantes = k - d
+        suma, cuadrados = colas[d]
+        valor = max(cuadrados - suma * suma / restantes, 0.0) / (restantes * restantes)
+        if valor < mejor_valor:
+            mejor_d, mejor_valor = d, valor
+    return mejor_d * tamano_lote
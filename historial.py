@@ -0,0 +1,122 @@
+# historial.py
+"""
+Historiales de tickets reales para reproducir con SimuladorMesaAyuda(historial_arribos=...).
+- Un registro es (tiempo_min, tipo, duracion_min): minutos absolutos desde el Día 0 00:00
+  (o un instante con 'origen'), "IT" | "TEC" | "DEV" y la duración del servicio.
+- HistorialCSV y HistorialBinario se recorren de a lotes: nunca cargan el archivo
+  entero, así que un historial de millones de tickets se reproduce en memoria constante.
+- Ambos se pueden recorrer más de una vez (cada iteración reabre el archivo): es lo que
+  usa reanudar() para saltear lo ya reproducido.
+- El binario (registros de ancho fijo, como traza.py) evita parsear texto en cada corrida;
+  convertir_csv_a_binario lo arma una vez.
+"""
+from __future__ import annotations
+
+import csv
+import struct
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple
+
+from simulacion import CODIGO_TIPO, POOLS
+
+Registro = Tuple[float, str, float]
+
+# tiempo, duración, código de tipo, relleno
+REGISTRO_ARRIBO = struct.Struct("<ddb7x")
+REGISTROS_POR_LOTE: int = 65536
+
+COLUMNAS_CSV = ("tiempo_min", "tipo", "duracion_min")
+
+
+class HistorialCSV:
+    """
+    CSV con encabezado y columnas tiempo_min, tipo, duracion_min (en cualquier orden;
+    otras columnas se ignoran). Con 'origen', tiempo_min es un instante ISO 8601 y se
+    convierte a minutos desde 'origen' (que pasa a ser el Día 0 00:00).
+    """
+
+    def __init__(self, ruta: str, origen: Optional[datetime] = None, columnas: Tuple[str, str, str] = COLUMNAS_CSV):
+        self.ruta = ruta
+        self.origen = origen
+        self.columnas = columnas
+
+    def __iter__(self) -> Iterator[Registro]:
+        origen = self.origen
+        with open(self.ruta, newline="") as archivo:
+            lector = csv.reader(archivo)
+            encabezado = next(lector, None)
+            if encabezado is None:
+                return
+            try:
+                i_tiempo, i_tipo, i_duracion = (encabezado.index(columna) for columna in self.columnas)
+            except ValueError:
+                raise ValueError(f"{self.ruta}: faltan columnas {self.columnas} en el encabezado") from None
+            for fila in lector:
+                if origen is None:
+                    tiempo = float(fila[i_tiempo])
+                else:
+                    tiempo = (datetime.fromisoformat(fila[i_tiempo]) - origen).total_seconds() / 60
+                yield tiempo, fila[i_tipo], float(fila[i_duracion])
+
+
+class HistorialBinario:
+    """Registros REGISTRO_ARRIBO leídos de a REGISTROS_POR_LOTE con un solo buffer reutilizado."""
+
+    def __init__(self, ruta: str, registros_por_lote: int = REGISTROS_POR_LOTE):
+        self.ruta = ruta
+        self.registros_por_lote = registros_por_lote
+
+    def __len__(self) -> int:
+        with open(self.ruta, "rb") as archivo:
+            return archivo.seek(0, 2) // REGISTRO_ARRIBO.size
+
+    def __iter__(self) -> Iterator[Registro]:
+        buffer = bytearray(REGISTRO_ARRIBO.size * self.registros_por_lote)
+        with open(self.ruta, "rb") as archivo:
+            while True:
+                leidos = archivo.readinto(buffer)
+                if not leidos:
+                    return
+                if leidos % REGISTRO_ARRIBO.size:
+                    # readinto puede quedarse corto: se completa el último registro
+                    faltan = REGISTRO_ARRIBO.size - leidos % REGISTRO_ARRIBO.size
+                    resto = archivo.read(faltan)
+                    if len(resto) != faltan:
+                        raise ValueError(f"{self.ruta}: registro incompleto al final del archivo")
+                    buffer[leidos:leidos + faltan] = resto
+                    leidos += faltan
+                with memoryview(buffer)[:leidos] as vista:
+                    for tiempo, duracion, codigo in REGISTRO_ARRIBO.iter_unpack(vista):
+                        yield tiempo, POOLS[codigo], duracion
+
+
+def escribir_historial_binario(ruta: str, registros: Iterable[Registro], registros_por_lote: int = REGISTROS_POR_LOTE) -> int:
+    """Escribe los registros (de a lotes, sin acumularlos) y devuelve cuántos fueron."""
+    buffer = bytearray(REGISTRO_ARRIBO.size * registros_por_lote)
+    desplazamiento = 0
+    cantidad = 0
+    with open(ruta, "wb") as archivo:
+        for tiempo, tipo, duracion in registros:
+            if desplazamiento == len(buffer):
+                archivo.write(buffer)
+                desplazamiento = 0
+            REGISTRO_ARRIBO.pack_into(buffer, desplazamiento, tiempo, duracion, CODIGO_TIPO[tipo])
+            desplazamiento += REGISTRO_ARRIBO.size
+            cantidad += 1
+        archivo.write(memoryview(buffer)[:desplazamiento])
+    return cantidad
+
+
+def escribir_historial_csv(ruta: str, registros: Iterable[Registro]) -> int:
+    cantidad = 0
+    with open(ruta, "w", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(COLUMNAS_CSV)
+        for tiempo, tipo, duracion in registros:
+            escritor.writerow((repr(tiempo), tipo, repr(duracion)))
+            cantidad += 1
+    return cantidad
+
+
+def convertir_csv_a_binario(ruta_csv: str, ruta_binario: str, origen: Optional[datetime] = None) -> int:
+    return escribir_historial_binario(ruta_binario, HistorialCSV(ruta_csv, origen))
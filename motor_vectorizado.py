@@ -0,0 +1,254 @@
+# motor_vectorizado.py
+"""
+Motor alternativo que avanza R réplicas independientes de una misma configuración
+en paso sincronizado (lockstep) con NumPy.
+- El estado de cátedra queda en arreglos (R x operadores): TPS, AG (ocupado, arribo,
+  duración) y el tipo en servicio. Columnas en el orden IT | TEC | DEV, así que el
+  argmin por fila respeta el desempate de cátedra (IT > TEC > DEV, menor índice).
+- En cada paso cada réplica activa procesa SU próximo evento (salida o arribo);
+  los arribos y salidas de todas las filas se resuelven con máscaras.
+- Mismas reglas que SimuladorMesaAyuda (derivación a DEV, agenda de 1 por operador,
+  abandono 50% si la espera pasa de 30 min), pero con otra corriente de números:
+  los resultados coinciden en distribución, no réplica a réplica.
+- Requiere NumPy y muestreadores con 'muestrear_array' (los de muestreadores.py);
+  el horario es el 9-18 de todos los días (no admite CalendarioLaboral) y sin
+  cola de pendientes.
+"""
+from __future__ import annotations
+
+from typing import List
+
+from muestreadores import TipoServicioCategorico
+from simulacion import (
+    FIN_TURNO_MIN,
+    INICIO_TURNO_MIN,
+    MINUTOS_LABORALES_POR_DIA,
+    MINUTOS_POR_DIA,
+    POOLS,
+    TIPO_DEV,
+    ConfiguracionSimulador,
+    ResultadoSimulacion,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (sin él no hay motor vectorizado)
+    np = None
+
+# Por encima de esto la espera hace sortear el abandono (IT/TEC)
+ESPERA_MAXIMA_SIN_ABANDONO_MIN: float = 30.0
+
+
+# ------------------------------------------------------------
+# Horario laboral vectorizado (mismo criterio que simulacion.py)
+# ------------------------------------------------------------
+def normalizar_a_horario_laboral_array(tiempos):
+    dia = np.floor_divide(tiempos, MINUTOS_POR_DIA)
+    minuto_del_dia = np.mod(tiempos, MINUTOS_POR_DIA)
+    return np.where(
+        minuto_del_dia < INICIO_TURNO_MIN,
+        dia * MINUTOS_POR_DIA + INICIO_TURNO_MIN,
+        np.where(minuto_del_dia >= FIN_TURNO_MIN, (dia + 1) * MINUTOS_POR_DIA + INICIO_TURNO_MIN, tiempos),
+    )
+
+
+def sumar_minutos_laborales_array(tiempos_inicio, duraciones):
+    """Versión por arreglos de simulacion.sumar_minutos_laborales (forma cerrada con divmod)."""
+    tiempo_actual = normalizar_a_horario_laboral_array(tiempos_inicio)
+    dia = np.floor_divide(tiempo_actual, MINUTOS_POR_DIA)
+    minutos_disponibles_hoy = dia * MINUTOS_POR_DIA + FIN_TURNO_MIN - tiempo_actual
+
+    jornadas_completas, minutos_ultimo_dia = np.divmod(duraciones - minutos_disponibles_hoy, MINUTOS_LABORALES_POR_DIA)
+    justo_al_cierre = minutos_ultimo_dia == 0
+    jornadas_completas = np.where(justo_al_cierre, jornadas_completas - 1, jornadas_completas)
+    minutos_ultimo_dia = np.where(justo_al_cierre, MINUTOS_LABORALES_POR_DIA, minutos_ultimo_dia)
+    otro_dia = (dia + 1 + jornadas_completas) * MINUTOS_POR_DIA + INICIO_TURNO_MIN + minutos_ultimo_dia
+
+    return np.where(
+        duraciones <= 0,
+        tiempo_actual,
+        np.where(duraciones <= minutos_disponibles_hoy, tiempo_actual + duraciones, otro_dia),
+    )
+
+
+# ------------------------------------------------------------
+# Lote de réplicas
+# ------------------------------------------------------------
+class LoteVectorizado:
+    """
+    Estado de R réplicas de 'config'. Se corre una sola vez con correr().
+    """
+
+    def __init__(self, config: ConfiguracionSimulador, replicaciones: int, semilla: int = 1):
+        if np is None:
+            raise ImportError("el motor vectorizado requiere NumPy")
+        if replicaciones < 1:
+            raise ValueError("replicaciones debe ser >= 1")
+        if config.calendario is not None:
+            raise ValueError("el motor vectorizado solo cubre el horario 9-18 de todos los días (sin calendario)")
+        if config.cola_pendientes:
+            raise ValueError("el motor vectorizado no modela la cola de pendientes")
+        if config.tasa_arribos is not None:
+            raise ValueError("el motor vectorizado solo cubre interarribos en minutos laborales (sin tasa_arribos)")
+        self.muestrear_tipo = config.muestrear_tipo_servicio or TipoServicioCategorico()
+        muestreadores = (config.muestrear_interarribo_min, config.muestrear_duracion_servicio_min, self.muestrear_tipo)
+        if not all(callable(getattr(m, "muestrear_array", None)) for m in muestreadores):
+            raise ValueError("el motor vectorizado requiere muestreadores con 'muestrear_array'")
+
+        self.config = config
+        self.replicaciones = replicaciones
+        self.generador = np.random.default_rng(semilla)
+
+        cantidades = (config.cantidad_operadores_it, config.cantidad_operadores_tecnico, config.cantidad_operadores_dev)
+        self.pool_de_columna = np.repeat(np.arange(len(POOLS)), cantidades)
+        forma = (replicaciones, len(self.pool_de_columna))
+
+        self.tps = np.full(forma, np.inf)
+        self.ag_ocupado = np.zeros(forma, dtype=bool)
+        self.ag_arribo = np.zeros(forma)
+        self.ag_duracion = np.zeros(forma)
+        self.tipo_en_servicio = np.broadcast_to(self.pool_de_columna, forma).copy()
+
+        # Contadores por réplica y código de tipo
+        self.perdidos = np.zeros((replicaciones, len(POOLS)), dtype=np.int64)
+        self.atendidos = np.zeros((replicaciones, len(POOLS)), dtype=np.int64)
+        self.suma_espera_min = np.zeros((replicaciones, len(POOLS)))
+        self.derivados_a_dev = np.zeros((replicaciones, len(POOLS)), dtype=np.int64)
+        self.perdidos_espera_mas_30 = np.zeros((replicaciones, len(POOLS)), dtype=np.int64)
+        self.eventos = np.zeros(replicaciones, dtype=np.int64)
+
+    # -----------------------------
+    # Loop sincronizado
+    # -----------------------------
+    def correr(self) -> List[ResultadoSimulacion]:
+        config = self.config
+        if config.dias < 1:
+            raise ValueError("dias debe ser >= 1")
+        tiempo_fin_sim = (config.dias - 1) * MINUTOS_POR_DIA + FIN_TURNO_MIN
+        # Como resultado_estacionario: los contadores se toman al cruzar la medianoche del día de corte
+        corte_calentamiento = config.dias_calentamiento * MINUTOS_POR_DIA if config.dias_calentamiento else np.inf
+        base = [np.zeros_like(c) for c in self._contadores()]
+        base_tomada = np.zeros(self.replicaciones, dtype=bool)
+
+        self.T = np.full(self.replicaciones, float(INICIO_TURNO_MIN))
+        self.TPLL = sumar_minutos_laborales_array(
+            self.T, self.config.muestrear_interarribo_min.muestrear_array(self.generador, self.replicaciones)
+        )
+
+        activas = np.arange(self.replicaciones)
+        while activas.size:
+            tps = self.tps[activas]
+            columna = tps.argmin(axis=1)
+            minimo = tps[np.arange(activas.size), columna]
+            tpll = self.TPLL[activas]
+
+            # Decisión de cátedra: si TPLL >= minTiempoTrabajoProgramado -> SALIDA
+            es_salida = (minimo != np.inf) & (tpll >= minimo)
+            t = np.where(es_salida, minimo, tpll)
+            self.T[activas] = t
+            self.eventos[activas] += 1
+
+            cruzan = activas[(t >= corte_calentamiento) & ~base_tomada[activas]]
+            if cruzan.size:
+                for acumulado, contador in zip(base, self._contadores()):
+                    acumulado[cruzan] = contador[cruzan]
+                base_tomada[cruzan] = True
+
+            self._procesar_salidas(activas[es_salida], columna[es_salida], t[es_salida])
+            self._procesar_arribos(activas[~es_salida], t[~es_salida])
+            activas = activas[t < tiempo_fin_sim]
+
+        return self._resultados(base)
+
+    def _contadores(self):
+        return self.perdidos, self.atendidos, self.suma_espera_min
+
+    # -----------------------------
+    # Eventos (una fila = una réplica, a lo sumo un evento por fila en cada paso)
+    # -----------------------------
+    def _iniciar_servicio(self, filas, columnas, tiempos, arribos, duraciones, tipos):
+        inicio = normalizar_a_horario_laboral_array(tiempos)
+        self.suma_espera_min[filas, tipos] += inicio - arribos
+        self.tps[filas, columnas] = sumar_minutos_laborales_array(inicio, duraciones)
+        self.tipo_en_servicio[filas, columnas] = tipos
+
+    def _procesar_salidas(self, filas, columnas, tiempos):
+        if not filas.size:
+            return
+        self.atendidos[filas, self.tipo_en_servicio[filas, columnas]] += 1
+        self.tps[filas, columnas] = np.inf
+
+        con_agenda = self.ag_ocupado[filas, columnas]
+        filas, columnas, tiempos = filas[con_agenda], columnas[con_agenda], tiempos[con_agenda]
+        self.ag_ocupado[filas, columnas] = False
+        self._iniciar_servicio(
+            filas, columnas, tiempos,
+            self.ag_arribo[filas, columnas], self.ag_duracion[filas, columnas], self.pool_de_columna[columnas],
+        )
+
+    def _procesar_arribos(self, filas, tiempos):
+        n = filas.size
+        if not n:
+            return
+        generador = self.generador
+        tipos = self.muestrear_tipo.muestrear_array(generador, n, POOLS)
+        duraciones = self.config.muestrear_duracion_servicio_min.muestrear_array(generador, tipos, POOLS)
+        abandono = generador.random(n) < 0.5  # se usa solo donde la cátedra sortea
+        interarribos = self.config.muestrear_interarribo_min.muestrear_array(generador, n)
+
+        # Operador libre: primero en el propio pool, IT/TEC caen a DEV
+        tps = self.tps[filas]
+        libres = (tps == np.inf) & ~self.ag_ocupado[filas]
+        del_pool = self.pool_de_columna == tipos[:, None]
+        propios = libres & del_pool
+        hay_propio = propios.any(axis=1)
+        devs = libres & (self.pool_de_columna == TIPO_DEV)
+        derivado = ~hay_propio & (tipos != TIPO_DEV) & devs.any(axis=1)
+        atiende = hay_propio | derivado
+        columna_libre = np.where(hay_propio, propios.argmax(axis=1), devs.argmax(axis=1))
+
+        self.derivados_a_dev[filas[derivado], tipos[derivado]] += 1
+        self._iniciar_servicio(
+            filas[atiende], columna_libre[atiende], tiempos[atiende], tiempos[atiende], duraciones[atiende], tipos[atiende]
+        )
+
+        # Agenda: ocupado del propio pool con slot libre que termina antes
+        resto = ~atiende
+        filas_r, tipos_r, tiempos_r = filas[resto], tipos[resto], tiempos[resto]
+        candidatos = (tps[resto] != np.inf) & ~self.ag_ocupado[filas_r] & del_pool[resto]
+        tps_candidatos = np.where(candidatos, tps[resto], np.inf)
+        columna_agenda = tps_candidatos.argmin(axis=1)
+        mejor_tps = tps_candidatos[np.arange(filas_r.size), columna_agenda]
+
+        # Como en la cátedra: sin candidato mejor_tps = HV, también sortea (y cuenta) el abandono
+        abandona = (tipos_r != TIPO_DEV) & (mejor_tps - tiempos_r > ESPERA_MAXIMA_SIN_ABANDONO_MIN) & abandono[resto]
+        self.perdidos_espera_mas_30[filas_r[abandona], tipos_r[abandona]] += 1
+        agenda = (mejor_tps != np.inf) & ~abandona
+
+        filas_a, columnas_a = filas_r[agenda], columna_agenda[agenda]
+        self.ag_ocupado[filas_a, columnas_a] = True
+        self.ag_arribo[filas_a, columnas_a] = tiempos_r[agenda]
+        self.ag_duracion[filas_a, columnas_a] = duraciones[resto][agenda]
+        self.perdidos[filas_r[~agenda], tipos_r[~agenda]] += 1
+
+        self.TPLL[filas] = sumar_minutos_laborales_array(tiempos, interarribos)
+
+    # -----------------------------
+    # Resultados
+    # -----------------------------
+    def _resultados(self, base) -> List[ResultadoSimulacion]:
+        perdidos, atendidos, suma_espera = (c - b for c, b in zip(self._contadores(), base))
+        espera_promedio = np.divide(suma_espera, atendidos, out=np.zeros_like(suma_espera), where=atendidos > 0)
+        return [
+            ResultadoSimulacion(
+                perdidos_por_tipo=dict(zip(POOLS, perdidos[r].tolist())),
+                atendidos_por_tipo=dict(zip(POOLS, atendidos[r].tolist())),
+                espera_promedio_por_tipo_min=dict(zip(POOLS, espera_promedio[r].tolist())),
+            )
+            for r in range(self.replicaciones)
+        ]
+
+
+def correr_lote_vectorizado(config: ConfiguracionSimulador, replicaciones: int, semilla: int = 1) -> List[ResultadoSimulacion]:
+    """R réplicas de 'config' en un solo proceso; sin distribución de la espera por réplica."""
+    return LoteVectorizado(config, replicaciones, semilla).correr()
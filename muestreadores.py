@@ -0,0 +1,193 @@
+# muestreadores.py
+"""
+Muestreadores listos para inyectar en SimuladorMesaAyuda.
+- Son dataclasses (no lambdas) para poder mandarlos con pickle a otros procesos.
+- Además de la llamada de a uno implementan 'muestrear_bloque', que el simulador
+  consume con un CursorBloques. Con NumPy el bloque sale vectorizado; sin NumPy
+  se arma con el mismo rng en un loop de Python.
+- Con NumPy las exponenciales salen por inversión de uniformes (no ziggurat) para
+  que un rng antitético (simulacion.RandomAntitetico) dé el bloque pareja 1-U.
+- 'muestrear_array' sortea un valor por réplica con un Generator de NumPy para el
+  motor vectorizado (motor_vectorizado.py); los tipos van como códigos según 'tipos'.
+- TasaArribosPorHora no es un interarribo: es la tasa por hora de la semana que el
+  simulador usa con tasa_arribos=... (arribos no homogeneos).
+"""
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+from simulacion import MINUTOS_POR_DIA
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+
+def _uniformes_numpy(rng: random.Random, n: int):
+    # Un generador NumPy por bloque, sembrado desde el rng del cursor
+    u = np.random.default_rng(rng.getrandbits(64)).random(n)
+    if getattr(rng, "antitetico", False):
+        u = np.where(u > 0.0, 1.0 - u, 0.0)  # igual que RandomAntitetico.random
+    return u
+
+
+def _exponenciales_numpy(rng: random.Random, media: float, n: int) -> List[float]:
+    # Inversión, como random.expovariate: -media * log(1 - U)
+    return (-media * np.log1p(-_uniformes_numpy(rng, n))).tolist()
+
+
+@dataclass(frozen=True)
+class InterarriboExponencial:
+    """Interarribo exponencial (en minutos laborales) con media 'media_min'."""
+    media_min: float
+
+    def __call__(self, rng: random.Random) -> float:
+        return rng.expovariate(1.0 / self.media_min)
+
+    def muestrear_bloque(self, rng: random.Random, n: int) -> List[float]:
+        if np is None:
+            return [rng.expovariate(1.0 / self.media_min) for _ in range(n)]
+        return _exponenciales_numpy(rng, self.media_min, n)
+
+    def muestrear_array(self, generador, n: int):
+        return generador.exponential(self.media_min, n)
+
+
+@dataclass(frozen=True)
+class DuracionExponencialPorTipo:
+    """Duración de servicio exponencial con una media por tipo ("IT" | "TEC" | "DEV")."""
+    medias_min: Dict[str, float]
+
+    def __call__(self, tipo_servicio: str, rng: random.Random) -> float:
+        return rng.expovariate(1.0 / self.medias_min[tipo_servicio])
+
+    def muestrear_bloque(self, tipo_servicio: str, rng: random.Random, n: int) -> List[float]:
+        media = self.medias_min[tipo_servicio]
+        if np is None:
+            return [rng.expovariate(1.0 / media) for _ in range(n)]
+        return _exponenciales_numpy(rng, media, n)
+
+    def muestrear_array(self, generador, codigos, tipos: Sequence[str]):
+        """Una duración por código de tipo (posición en 'tipos')."""
+        medias = np.array([self.medias_min[tipo] for tipo in tipos])
+        return generador.exponential(medias[codigos])
+
+
+@dataclass(frozen=True)
+class TipoServicioCategorico:
+    """Tipo de servicio según probabilidades (por defecto el 70/20/10 de cátedra)."""
+    probabilidades: Tuple[Tuple[str, float], ...] = (("IT", 0.70), ("TEC", 0.20), ("DEV", 0.10))
+
+    @property
+    def _acumuladas(self) -> List[float]:
+        return list(accumulate(p for _, p in self.probabilidades))
+
+    def _tipo_para(self, u: float, acumuladas: List[float]) -> str:
+        for (tipo, _), limite in zip(self.probabilidades, acumuladas):
+            if u < limite:
+                return tipo
+        return self.probabilidades[-1][0]
+
+    def __call__(self, rng: random.Random) -> str:
+        return self._tipo_para(rng.random(), self._acumuladas)
+
+    def muestrear_bloque(self, rng: random.Random, n: int) -> List[str]:
+        acumuladas = self._acumuladas
+        if np is None:
+            return [self._tipo_para(rng.random(), acumuladas) for _ in range(n)]
+        tipos = [tipo for tipo, _ in self.probabilidades]
+        indices = np.searchsorted(acumuladas[:-1], _uniformes_numpy(rng, n), side="right")
+        return [tipos[i] for i in indices.tolist()]
+
+    def muestrear_array(self, generador, n: int, tipos: Sequence[str]):
+        """n códigos de tipo (posición en 'tipos')."""
+        codigos = np.array([list(tipos).index(tipo) for tipo, _ in self.probabilidades])
+        indices = np.searchsorted(self._acumuladas[:-1], generador.random(n), side="right")
+        return codigos[indices]
+
+
+# ------------------------------------------------------------
+# Arribos no homogéneos (tasa por hora del día y día de la semana)
+# ------------------------------------------------------------
+HORAS_POR_SEMANA: int = 7 * 24
+MINUTOS_POR_SEMANA: int = HORAS_POR_SEMANA * 60
+
+
+@dataclass(frozen=True)
+class TasaArribosPorHora:
+    """
+    Poisson no homogéneo con tasa constante por hora: tasas_por_hora[h] son arribos por hora
+    en la hora h de la semana (h = 24 * dia_semana + hora, dia_semana 0 = lunes).
+    El Día 0 de la simulación es el día de semana 'dia_semana_inicial'.
+    - Se sortea por inversión de la intensidad acumulada Λ: el próximo arribo después de t
+      es Λ⁻¹(Λ(t) + E), E ~ Exp(1). Λ se precalcula una vez por hora de la semana (168
+      valores) y es periódica, así que cada arribo es un bisect sobre esa tabla.
+    - Las horas con tasa 0 no reciben arribos (no hace falta rechazo como en thinning).
+    - tiempos_desde invierte un bloque entero de exponenciales (vectorizado con NumPy).
+    - El simulador la usa con tasa_arribos=...: los tiempos son de reloj; lo que cae fuera
+      de horario arriba en la próxima apertura (ver ArribosNoHomogeneos en simulacion.py).
+    """
+    tasas_por_hora: Tuple[float, ...]
+    dia_semana_inicial: int = 0
+
+    def __post_init__(self):
+        if len(self.tasas_por_hora) != HORAS_POR_SEMANA:
+            raise ValueError(f"tasas_por_hora necesita {HORAS_POR_SEMANA} valores (7 días x 24 horas)")
+        if any(tasa < 0 for tasa in self.tasas_por_hora) or not any(self.tasas_por_hora):
+            raise ValueError("las tasas deben ser >= 0 y alguna > 0")
+        object.__setattr__(self, "tasas_por_hora", tuple(float(tasa) for tasa in self.tasas_por_hora))
+        # Λ al comienzo de cada hora de la semana (desde el lunes 00:00)
+        object.__setattr__(self, "_acumulada", [0.0, *accumulate(self.tasas_por_hora)])
+        object.__setattr__(self, "_desplazamiento", (self.dia_semana_inicial % 7) * MINUTOS_POR_DIA)
+
+    @classmethod
+    def por_dia(cls, tasas_del_dia: Sequence[float], dias_semana: Sequence[int] = range(7), dia_semana_inicial: int = 0):
+        """Mismo perfil de 24 tasas en los días de semana indicados; 0 el resto."""
+        if len(tasas_del_dia) != 24:
+            raise ValueError("tasas_del_dia necesita 24 valores")
+        tasas = [0.0] * HORAS_POR_SEMANA
+        for dia in dias_semana:
+            tasas[24 * dia:24 * (dia + 1)] = tasas_del_dia
+        return cls(tuple(tasas), dia_semana_inicial)
+
+    @property
+    def arribos_por_semana(self) -> float:
+        return self._acumulada[-1]
+
+    def intensidad_acumulada(self, tiempo_minutos: float) -> float:
+        """Λ(t): arribos esperados entre el Día 0 00:00 y 't'."""
+        return self._intensidad_semanal(tiempo_minutos + self._desplazamiento) - self._intensidad_semanal(self._desplazamiento)
+
+    def _intensidad_semanal(self, minutos: float) -> float:
+        semanas, resto = divmod(minutos, MINUTOS_POR_SEMANA)
+        hora = int(resto // 60)
+        return semanas * self._acumulada[-1] + self._acumulada[hora] + self.tasas_por_hora[hora] * (resto - 60 * hora) / 60
+
+    def _inversa_semanal(self, intensidad: float) -> float:
+        semanas, resto = divmod(intensidad, self._acumulada[-1])
+        # Mayor hora que empieza en o antes de 'resto': saltea las horas con tasa 0
+        hora = bisect_right(self._acumulada, resto) - 1
+        return semanas * MINUTOS_POR_SEMANA + 60 * hora + 60 * (resto - self._acumulada[hora]) / self.tasas_por_hora[hora]
+
+    def tiempos_desde(self, tiempo_minutos: float, exponenciales: Sequence[float]) -> List[float]:
+        """Tiempos de los próximos len(exponenciales) arribos después de 't' (Exp(1) ya sorteadas)."""
+        base = self._intensidad_semanal(tiempo_minutos + self._desplazamiento)
+        if np is None:
+            return [self._inversa_semanal(y) - self._desplazamiento for y in accumulate(exponenciales, initial=base)][1:]
+        acumulada = np.asarray(self._acumulada)
+        semanas, resto = np.divmod(base + np.cumsum(exponenciales), acumulada[-1])
+        hora = np.searchsorted(acumulada, resto, side="right") - 1
+        tasas = np.asarray(self.tasas_por_hora)[hora]
+        minutos = semanas * MINUTOS_POR_SEMANA + 60 * hora + 60 * (resto - acumulada[hora]) / tasas
+        return (minutos - self._desplazamiento).tolist()
+
+    def exponenciales_bloque(self, rng: random.Random, n: int) -> List[float]:
+        """n Exp(1) para tiempos_desde (por inversión, como los demás bloques)."""
+        if np is None:
+            return [rng.expovariate(1.0) for _ in range(n)]
+        return _exponenciales_numpy(rng, 1.0, n)
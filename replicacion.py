@@ -0,0 +1,402 @@
+# replicacion.py
+"""
+Réplicas independientes de SimuladorMesaAyuda en un pool de procesos.
+- Cada réplica i usa una semilla derivada de (semilla_maestra, i): el resultado no
+  depende de cuántos workers se usen ni del orden en que terminan.
+- correr_hasta_precision agrega lotes de réplicas hasta que el IC relativo de las
+  métricas elegidas cae bajo un objetivo.
+- correr_pares_antiteticos corre cada semilla dos veces (U y 1-U) y mide la
+  reducción de varianza lograda.
+- correr_replicaciones_vectorizadas corre todo el lote en paso sincronizado con
+  NumPy (motor_vectorizado.py): mismas reglas, otra corriente de números.
+- Con cache=CacheResultados(...) las réplicas ya corridas se leen de disco.
+- estimar_calentamiento detecta el transitorio inicial (MSER-5 sobre la serie diaria
+  promediada entre réplicas piloto) y sugiere cuántos días correr.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import statistics
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from cache_resultados import CacheResultados
+from distribucion import DistribucionEspera, combinar_distribuciones
+from estadisticas import IntervaloConfianza, intervalo_confianza, truncamiento_mser
+from motor_vectorizado import correr_lote_vectorizado
+from simulacion import POOLS, ConfiguracionSimulador, ResultadoSimulacion
+
+
+def derivar_semillas(semilla_maestra: int, cantidad: int, inicio: int = 0) -> List[int]:
+    """
+    Semillas de 64 bits para las réplicas inicio..inicio+cantidad-1.
+    Se hashea (semilla_maestra, i) para que las corrientes no se solapen.
+    """
+    semillas = []
+    for i in range(inicio, inicio + cantidad):
+        digest = hashlib.blake2b(f"{semilla_maestra}:{i}".encode(), digest_size=8).digest()
+        semillas.append(int.from_bytes(digest, "little"))
+    return semillas
+
+
+def _correr(config: ConfiguracionSimulador, semilla: int, cache: Optional[CacheResultados], antitetico: bool = False):
+    if cache is None:
+        return config.correr(semilla, antitetico)
+    return cache.correr(config, semilla, antitetico)
+
+
+def _correr_replica(argumentos: Tuple[ConfiguracionSimulador, int, Optional[CacheResultados]]) -> ResultadoSimulacion:
+    config, semilla, cache = argumentos
+    return _correr(config, semilla, cache)
+
+
+def _correr_par_antitetico(
+    argumentos: Tuple[ConfiguracionSimulador, int, Optional[CacheResultados]],
+) -> Tuple[ResultadoSimulacion, ResultadoSimulacion]:
+    config, semilla, cache = argumentos
+    return _correr(config, semilla, cache), _correr(config, semilla, cache, antitetico=True)
+
+
+def _mapear(funcion: Callable, trabajos: List, workers: Optional[int] = None, pool: Optional[Executor] = None) -> List:
+    """
+    funcion sobre cada trabajo, en orden. workers=1 (o un solo trabajo) corre en este
+    proceso; si no, en 'pool' si se pasa o en un ProcessPoolExecutor propio.
+    """
+    if workers == 1 or len(trabajos) <= 1:
+        return [funcion(t) for t in trabajos]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(trabajos) // (4 * workers))
+    if pool is not None:
+        return list(pool.map(funcion, trabajos, chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(funcion, trabajos, chunksize=chunksize))
+
+
+def correr_lote(
+    config: ConfiguracionSimulador,
+    semillas: List[int],
+    workers: Optional[int] = None,
+    pool: Optional[Executor] = None,
+    cache: Optional[CacheResultados] = None,
+) -> List[ResultadoSimulacion]:
+    """
+    Corre una réplica por semilla y devuelve los resultados en el orden de 'semillas'.
+    workers=1 corre en este proceso (sin pool).
+    'pool' permite reusar un executor ya abierto entre lotes sucesivos.
+    Con 'cache' solo se corren las réplicas que no estén guardadas (ver cache_resultados.py).
+    """
+    return _mapear(_correr_replica, [(config, semilla, cache) for semilla in semillas], workers, pool)
+
+
+@dataclass
+class ResultadoReplicaciones:
+    resultados: List[ResultadoSimulacion]
+    semillas: List[int]
+    perdidos_por_tipo: Dict[str, IntervaloConfianza]
+    atendidos_por_tipo: Dict[str, IntervaloConfianza]
+    espera_promedio_por_tipo_min: Dict[str, IntervaloConfianza]
+    # esperas de todas las réplicas juntas (sketches combinados): p90/p99 del lote
+    distribucion_espera_por_tipo: Optional[Dict[str, DistribucionEspera]] = None
+
+    @property
+    def replicaciones(self) -> int:
+        return len(self.resultados)
+
+
+def resumir_replicaciones(
+    resultados: List[ResultadoSimulacion],
+    semillas: List[int],
+    nivel_confianza: float = 0.95,
+) -> ResultadoReplicaciones:
+    def resumir(campo: str) -> Dict[str, IntervaloConfianza]:
+        return {
+            tipo: intervalo_confianza([getattr(r, campo)[tipo] for r in resultados], nivel_confianza)
+            for tipo in POOLS
+        }
+
+    distribuciones = None
+    if all(r.distribucion_espera_por_tipo is not None for r in resultados):
+        distribuciones = {
+            tipo: combinar_distribuciones([r.distribucion_espera_por_tipo[tipo] for r in resultados])
+            for tipo in POOLS
+        }
+
+    return ResultadoReplicaciones(
+        resultados=resultados,
+        semillas=semillas,
+        perdidos_por_tipo=resumir("perdidos_por_tipo"),
+        atendidos_por_tipo=resumir("atendidos_por_tipo"),
+        espera_promedio_por_tipo_min=resumir("espera_promedio_por_tipo_min"),
+        distribucion_espera_por_tipo=distribuciones,
+    )
+
+
+def correr_replicaciones(
+    config: ConfiguracionSimulador,
+    replicaciones: int,
+    workers: Optional[int] = None,
+    semilla_maestra: int = 1,
+    nivel_confianza: float = 0.95,
+    cache: Optional[CacheResultados] = None,
+) -> ResultadoReplicaciones:
+    """
+    Corre 'replicaciones' réplicas independientes de 'config' y devuelve
+    medias e intervalos de confianza por tipo.
+    """
+    if replicaciones < 1:
+        raise ValueError("replicaciones debe ser >= 1")
+    semillas = derivar_semillas(semilla_maestra, replicaciones)
+    resultados = correr_lote(config, semillas, workers, cache=cache)
+    return resumir_replicaciones(resultados, semillas, nivel_confianza)
+
+
+def correr_replicaciones_vectorizadas(
+    config: ConfiguracionSimulador,
+    replicaciones: int,
+    semilla_maestra: int = 1,
+    nivel_confianza: float = 0.95,
+) -> ResultadoReplicaciones:
+    """
+    Como correr_replicaciones pero con el motor vectorizado (todas las réplicas en un
+    solo proceso, requiere NumPy). Conviene con muchas réplicas chicas. Las réplicas
+    comparten un generador: 'semillas' queda como [semilla_maestra].
+    """
+    resultados = correr_lote_vectorizado(config, replicaciones, semilla_maestra)
+    return resumir_replicaciones(resultados, [semilla_maestra], nivel_confianza)
+
+
+# ------------------------------------------------------------
+# Réplicas secuenciales hasta una precisión objetivo
+# ------------------------------------------------------------
+# Métrica = (campo de ResultadoSimulacion, tipo)
+Metrica = Tuple[str, str]
+METRICAS_POR_DEFECTO: Tuple[Metrica, ...] = (
+    ("perdidos_por_tipo", "IT"),
+    ("espera_promedio_por_tipo_min", "IT"),
+)
+
+
+@dataclass
+class ResultadoPrecision:
+    resumen: ResultadoReplicaciones
+    intervalos: Dict[Metrica, IntervaloConfianza]
+    precision_relativa: float
+    alcanzada: bool  # False si se cortó por replicaciones_maximas
+
+    @property
+    def replicaciones(self) -> int:
+        return self.resumen.replicaciones
+
+
+def _replicaciones_estimadas(n: int, semi_ancho_relativo: float, objetivo: float) -> float:
+    """
+    n * (h / objetivo)^2: el semi-ancho escala ~ 1/sqrt(n) (Law & Kelton, procedimiento secuencial).
+    """
+    if math.isinf(semi_ancho_relativo):
+        return math.inf
+    return n * (semi_ancho_relativo / objetivo) ** 2
+
+
+def correr_hasta_precision(
+    config: ConfiguracionSimulador,
+    precision_relativa: float = 0.05,
+    metricas: Sequence[Metrica] = METRICAS_POR_DEFECTO,
+    replicaciones_iniciales: int = 10,
+    replicaciones_maximas: int = 1000,
+    workers: Optional[int] = None,
+    semilla_maestra: int = 1,
+    nivel_confianza: float = 0.95,
+    cache: Optional[CacheResultados] = None,
+) -> ResultadoPrecision:
+    """
+    Agrega réplicas en lotes paralelos hasta que semi_ancho / |media| <= precision_relativa
+    para todas las 'metricas' (o hasta replicaciones_maximas).
+    - La réplica i usa la misma semilla que en correr_replicaciones: con n réplicas el
+      resumen es idéntico al de correr_replicaciones(config, n, ...).
+    - Cada lote apunta a las réplicas estimadas que faltan, con al menos un worker de
+      ancho, y reusa el mismo pool de procesos.
+    """
+    if precision_relativa <= 0:
+        raise ValueError("precision_relativa debe ser > 0")
+    if not 2 <= replicaciones_iniciales <= replicaciones_maximas:
+        raise ValueError("se requiere 2 <= replicaciones_iniciales <= replicaciones_maximas")
+    for campo, tipo in metricas:
+        if campo not in ("perdidos_por_tipo", "atendidos_por_tipo", "espera_promedio_por_tipo_min") or tipo not in POOLS:
+            raise ValueError(f"métrica desconocida: {(campo, tipo)}")
+
+    workers = workers or os.cpu_count() or 1
+    resultados: List[ResultadoSimulacion] = []
+    semillas: List[int] = []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        lote = replicaciones_iniciales
+        while True:
+            nuevas = derivar_semillas(semilla_maestra, lote, inicio=len(semillas))
+            resultados.extend(correr_lote(config, nuevas, workers, pool, cache))
+            semillas.extend(nuevas)
+
+            resumen = resumir_replicaciones(resultados, semillas, nivel_confianza)
+            intervalos = {(campo, tipo): getattr(resumen, campo)[tipo] for campo, tipo in metricas}
+            peor = max((ic.semi_ancho_relativo for ic in intervalos.values()), default=0.0)
+            n = len(resultados)
+            if peor <= precision_relativa or n >= replicaciones_maximas:
+                return ResultadoPrecision(resumen, intervalos, precision_relativa, peor <= precision_relativa)
+
+            faltan = _replicaciones_estimadas(n, peor, precision_relativa) - n
+            faltan = replicaciones_iniciales if math.isinf(faltan) else math.ceil(faltan)
+            lote = min(max(faltan, workers), replicaciones_maximas - n)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+# ------------------------------------------------------------
+# Variables antitéticas
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class ReduccionVarianza:
+    """
+    Varianza de la media de un par, con réplicas independientes (Var(X)/2) y con
+    el par antitético (Var((X + X')/2)).
+    """
+    varianza_independiente: float
+    varianza_antitetica: float
+
+    @property
+    def reduccion(self) -> float:
+        """Fracción de varianza eliminada (0 = nada, negativo = empeoró)."""
+        if self.varianza_independiente == 0:
+            return 0.0
+        return 1.0 - self.varianza_antitetica / self.varianza_independiente
+
+    @property
+    def factor_replicaciones(self) -> float:
+        """Cuántas réplicas independientes equivale cada réplica antitética."""
+        if self.varianza_antitetica == 0:
+            return 1.0 if self.varianza_independiente == 0 else math.inf
+        return self.varianza_independiente / self.varianza_antitetica
+
+
+@dataclass
+class ResultadoAntitetico:
+    pares: List[Tuple[ResultadoSimulacion, ResultadoSimulacion]]
+    semillas: List[int]
+    # IC sobre las medias de cada par (n = cantidad de pares)
+    perdidos_por_tipo: Dict[str, IntervaloConfianza]
+    atendidos_por_tipo: Dict[str, IntervaloConfianza]
+    espera_promedio_por_tipo_min: Dict[str, IntervaloConfianza]
+    reduccion_varianza: Dict[Metrica, ReduccionVarianza]
+
+    @property
+    def replicaciones(self) -> int:
+        return 2 * len(self.pares)
+
+
+def correr_pares_antiteticos(
+    config: ConfiguracionSimulador,
+    pares: int,
+    workers: Optional[int] = None,
+    semilla_maestra: int = 1,
+    nivel_confianza: float = 0.95,
+    cache: Optional[CacheResultados] = None,
+    pool: Optional[Executor] = None,
+) -> ResultadoAntitetico:
+    """
+    Para cada semilla corre la réplica normal y la antitética (todas las uniformes 1-U)
+    y arma los IC con la media de cada par.
+    La reducción de varianza compara Var(media del par) contra Var(X)/2, con Var(X)
+    estimada sobre las 2*pares corridas individuales.
+    'pool' permite reusar un executor ya abierto (como en correr_lote).
+    """
+    if pares < 2:
+        raise ValueError("pares debe ser >= 2")
+    semillas = derivar_semillas(semilla_maestra, pares)
+    resultados = _mapear(_correr_par_antitetico, [(config, semilla, cache) for semilla in semillas], workers, pool)
+
+    intervalos: Dict[str, Dict[str, IntervaloConfianza]] = {}
+    reduccion: Dict[Metrica, ReduccionVarianza] = {}
+    for campo in ("perdidos_por_tipo", "atendidos_por_tipo", "espera_promedio_por_tipo_min"):
+        intervalos[campo] = {}
+        for tipo in POOLS:
+            valores = [(getattr(a, campo)[tipo], getattr(b, campo)[tipo]) for a, b in resultados]
+            medias_par = [(x + y) / 2 for x, y in valores]
+            individuales = [v for par in valores for v in par]
+            intervalos[campo][tipo] = intervalo_confianza(medias_par, nivel_confianza)
+            reduccion[(campo, tipo)] = ReduccionVarianza(
+                varianza_independiente=statistics.variance(individuales) / 2,
+                varianza_antitetica=statistics.variance(medias_par),
+            )
+
+    return ResultadoAntitetico(
+        pares=resultados,
+        semillas=semillas,
+        perdidos_por_tipo=intervalos["perdidos_por_tipo"],
+        atendidos_por_tipo=intervalos["atendidos_por_tipo"],
+        espera_promedio_por_tipo_min=intervalos["espera_promedio_por_tipo_min"],
+        reduccion_varianza=reduccion,
+    )
+
+
+# ------------------------------------------------------------
+# Calentamiento (transitorio inicial)
+# ------------------------------------------------------------
+def _correr_serie_diaria(argumentos: Tuple[ConfiguracionSimulador, int]) -> List[ResultadoSimulacion]:
+    config, semilla = argumentos
+    simulador = config.construir(semilla)
+    simulador.correr(config.dias)
+    return simulador.metricas_diarias()
+
+
+@dataclass
+class Calentamiento:
+    dias_calentamiento: int
+    truncamiento_por_metrica: Dict[Metrica, int]
+    dias_piloto: int
+    replicaciones_piloto: int
+
+    def dias_sugeridos(self, factor: int = 10) -> int:
+        """Calentamiento + una ventana de 'factor' veces el calentamiento (al menos 1 día de base)."""
+        return self.dias_calentamiento + factor * max(self.dias_calentamiento, 1)
+
+    def aplicar(self, config: ConfiguracionSimulador, factor: int = 10) -> ConfiguracionSimulador:
+        """Copia de 'config' con dias_sugeridos y el calentamiento a descartar."""
+        return replace(config, dias=self.dias_sugeridos(factor), dias_calentamiento=self.dias_calentamiento)
+
+
+def estimar_calentamiento(
+    config: ConfiguracionSimulador,
+    replicaciones: int = 5,
+    metricas: Sequence[Metrica] = METRICAS_POR_DEFECTO,
+    tamano_lote: int = 5,
+    workers: Optional[int] = None,
+    semilla_maestra: int = 1,
+) -> Calentamiento:
+    """
+    Corre 'replicaciones' pilotos de config.dias días, promedia día a día cada métrica
+    entre réplicas (Welch) y aplica MSER con lotes de 'tamano_lote' días a cada serie.
+    El calentamiento es el mayor truncamiento entre las métricas.
+    Las semillas piloto salen de derivar_semillas con un índice que no usan las réplicas.
+    """
+    if replicaciones < 1:
+        raise ValueError("replicaciones debe ser >= 1")
+    semillas = derivar_semillas(semilla_maestra, replicaciones, inicio=2 ** 32)
+    series = _mapear(_correr_serie_diaria, [(config, semilla) for semilla in semillas], workers)
+
+    truncamientos: Dict[Metrica, int] = {}
+    for campo, tipo in metricas:
+        promedio_diario = [
+            math.fsum(getattr(dias[d], campo)[tipo] for dias in series) / len(series)
+            for d in range(config.dias)
+        ]
+        truncamientos[(campo, tipo)] = truncamiento_mser(promedio_diario, tamano_lote)
+
+    return Calentamiento(
+        dias_calentamiento=max(truncamientos.values(), default=0),
+        truncamiento_por_metrica=truncamientos,
+        dias_piloto=config.dias,
+        replicaciones_piloto=replicaciones,
+    )
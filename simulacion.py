@@ -1,9 +1,24 @@
 # simulador_mesa_ayuda.py
 from __future__ import annotations
 
+import heapq
+import math
+import os
+import pickle
 import random
+import sys
+import time
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Callable, Dict
+from typing import TYPE_CHECKING, Optional, List, NamedTuple, Tuple, Callable, Deque, Dict, Iterable, Sequence, Union
+
+from distribucion import DistribucionEspera
+
+if TYPE_CHECKING:
+    from muestreadores import TasaArribosPorHora  # muestreadores importa de acá
 
 
 # ------------------------------------------------------------
@@ -16,8 +31,28 @@ from typing import Optional, List, Tuple, Callable, Dict
 MINUTOS_POR_DIA: int = 24 * 60
 INICIO_TURNO_MIN: int = 9 * 60
 FIN_TURNO_MIN: int = 18 * 60
+MINUTOS_LABORALES_POR_DIA: int = FIN_TURNO_MIN - INICIO_TURNO_MIN  # 540
 
 HORIZONTE_VACIO: float = float("inf")  # HV: no hay salida programada
+ABANDONO: int = -2  # _buscar_operador_para_agendar: se fue por la espera (> 30 min)
+
+# Motores para elegir la próxima salida
+MOTOR_BARRIDO: str = "barrido"        # recorre TPSIT/TPSTEC/TPSDEVS en cada evento
+MOTOR_CALENDARIO: str = "calendario"  # heap de eventos futuros (invalidación perezosa)
+MOTORES = (MOTOR_BARRIDO, MOTOR_CALENDARIO)
+
+# Pools en orden de prioridad de empate (IT > TEC > DEV)
+POOLS = ("IT", "TEC", "DEV")
+
+# Códigos internos de tipo/pool = posición en POOLS (índice en las tablas por pool)
+TIPO_IT: int = 0
+TIPO_TEC: int = 1
+TIPO_DEV: int = 2
+CODIGO_TIPO: Dict[str, int] = {tipo: codigo for codigo, tipo in enumerate(POOLS)}
+
+# Muestreo en bloques: arranca chico (corridas cortas) y se duplica hasta el máximo
+TAMANO_BLOQUE_INICIAL: int = 1024
+TAMANO_BLOQUE_MAXIMO: int = 65536
 
 
 # ------------------------------------------------------------
@@ -45,22 +80,242 @@ def sumar_minutos_laborales(tiempo_inicio_minutos: float, duracion_minutos: floa
     """
     Suma 'duracion_minutos' contando SOLO minutos dentro del horario 9-18.
     Si se llega al fin del turno, continúa al día siguiente 9:00.
+    Forma cerrada (sin loop por día): lo que no entra hoy se reparte en jornadas
+    de MINUTOS_LABORALES_POR_DIA con divmod. Terminar justo a las 18:00 queda
+    en ese día (no salta al siguiente 9:00).
     """
     tiempo_actual = normalizar_a_horario_laboral(tiempo_inicio_minutos)
-    minutos_restantes = duracion_minutos
+    if duracion_minutos <= 0:
+        return tiempo_actual
+
+    dia = int(tiempo_actual // MINUTOS_POR_DIA)
+    minutos_disponibles_hoy = dia * MINUTOS_POR_DIA + FIN_TURNO_MIN - tiempo_actual
+    if duracion_minutos <= minutos_disponibles_hoy:
+        return tiempo_actual + duracion_minutos
+
+    # Restar múltiplos enteros de 540 es exacto en float, así que divmod da el
+    # mismo resto que restar jornada por jornada.
+    minutos_restantes = duracion_minutos - minutos_disponibles_hoy
+    jornadas_completas, minutos_ultimo_dia = divmod(minutos_restantes, MINUTOS_LABORALES_POR_DIA)
+    if minutos_ultimo_dia == 0:
+        jornadas_completas -= 1
+        minutos_ultimo_dia = MINUTOS_LABORALES_POR_DIA
+
+    dia_fin = dia + 1 + int(jornadas_completas)
+    return dia_fin * MINUTOS_POR_DIA + INICIO_TURNO_MIN + minutos_ultimo_dia
+
+
+def minutos_laborales_acumulados(tiempo_minutos: float) -> float:
+    """
+    Inversa de sumar_minutos_laborales: minutos laborales transcurridos desde
+    Día 0 09:00 hasta 'tiempo_minutos' (fuera de turno no suma).
+    """
+    dia = int(tiempo_minutos // MINUTOS_POR_DIA)
+    minuto_del_dia = tiempo_minutos % MINUTOS_POR_DIA
+
+    if minuto_del_dia < INICIO_TURNO_MIN:
+        return dia * MINUTOS_LABORALES_POR_DIA
+    if minuto_del_dia >= FIN_TURNO_MIN:
+        return (dia + 1) * MINUTOS_LABORALES_POR_DIA
+    return dia * MINUTOS_LABORALES_POR_DIA + (minuto_del_dia - INICIO_TURNO_MIN)
+
+
+def tiempo_desde_minutos_laborales(minutos_laborales: float) -> float:
+    """
+    Minutos absolutos en que se cumplen 'minutos_laborales' desde Día 0 09:00.
+    Mismo criterio que sumar_minutos_laborales: un múltiplo de 540 cae a las 18:00.
+    """
+    return sumar_minutos_laborales(INICIO_TURNO_MIN, minutos_laborales)
+
+
+# ------------------------------------------------------------
+# Calendario laboral (fines de semana, feriados, turnos variables)
+# ------------------------------------------------------------
+TURNO_CATEDRA: Tuple[int, int] = (INICIO_TURNO_MIN, FIN_TURNO_MIN)
+DIAS_POR_SEMANA: int = 7
+TURNOS_LUNES_A_VIERNES: Dict[int, Tuple[int, int]] = {dia: TURNO_CATEDRA for dia in range(5)}  # 0 = lunes
+MARGEN_DIAS_CALENDARIO: int = 30  # jornadas armadas de más: servicios que terminan después del último día
 
-    while minutos_restantes > 0:
-        dia = int(tiempo_actual // MINUTOS_POR_DIA)
-        fin_hoy = dia * MINUTOS_POR_DIA + FIN_TURNO_MIN
 
-        minutos_disponibles_hoy = fin_hoy - tiempo_actual
-        if minutos_restantes <= minutos_disponibles_hoy:
-            return tiempo_actual + minutos_restantes
+class _TablasJornadas(NamedTuple):
+    """Una entrada por jornada laboral; acumulados[k] = minutos laborales antes de la jornada k."""
+    dias: List[int]
+    aperturas: List[float]
+    cierres: List[float]
+    acumulados: List[float]
+    dias_armados: int
 
-        minutos_restantes -= minutos_disponibles_hoy
-        tiempo_actual = (dia + 1) * MINUTOS_POR_DIA + INICIO_TURNO_MIN
 
-    return tiempo_actual
+class CalendarioLaboral:
+    """
+    Horario laboral general: un turno (inicio, fin) por día de la semana, feriados
+    cerrados y turnos especiales por día (medio día, horario extendido).
+    - Los días se numeran desde el Día 0 (día de semana 'dia_semana_inicial', 0 = lunes)
+      y los tiempos siguen siendo minutos absolutos desde el Día 0 00:00.
+    - Se arman una vez tablas por jornada laboral (apertura, cierre, minutos laborales
+      acumulados): normalizar, sumar y acumulados son un bisect, O(log días).
+      ConfiguracionSimulador y correr() las arman para el horizonte de la corrida más
+      MARGEN_DIAS_CALENDARIO (servicios que terminan después del último día).
+    - Las consultas solo leen las tablas. Si una pasa del horizonte armado se arman
+      tablas nuevas al doble y se reemplazan con una sola asignación: las listas
+      publicadas nunca se modifican, así que se comparte de solo lectura entre
+      simuladores, hilos y (por pickle, con las tablas armadas) workers de proceso.
+    - Sin argumentos es el 9-18 de todos los días: mismos resultados que las funciones de
+      módulo, bit a bit.
+    """
+
+    def __init__(
+        self,
+        turnos_por_dia_semana: Optional[Dict[int, Tuple[float, float]]] = None,
+        feriados: Sequence[int] = (),
+        turnos_especiales: Optional[Dict[int, Tuple[float, float]]] = None,
+        dia_semana_inicial: int = 0,
+        dias: int = 366,
+    ):
+        if turnos_por_dia_semana is None:
+            turnos_por_dia_semana = {dia: TURNO_CATEDRA for dia in range(DIAS_POR_SEMANA)}
+        turnos_especiales = dict(turnos_especiales or {})
+        if not turnos_por_dia_semana:
+            raise ValueError("turnos_por_dia_semana necesita al menos un día laboral")
+        if not all(0 <= dia < DIAS_POR_SEMANA for dia in turnos_por_dia_semana):
+            raise ValueError("los días de la semana van de 0 (lunes) a 6 (domingo)")
+        for inicio, fin in list(turnos_por_dia_semana.values()) + list(turnos_especiales.values()):
+            if not 0 <= inicio < fin < MINUTOS_POR_DIA:
+                raise ValueError("cada turno debe cumplir 0 <= inicio < fin < 24:00")
+        if set(feriados) & set(turnos_especiales):
+            raise ValueError("un día no puede ser feriado y tener turno especial")
+
+        self.turnos_por_dia_semana = dict(turnos_por_dia_semana)
+        self.feriados = frozenset(feriados)
+        self.turnos_especiales = turnos_especiales
+        self.dia_semana_inicial = dia_semana_inicial
+        self._tablas = self._armar(_TablasJornadas([], [], [], [0], 0), max(dias, 1))
+
+    def _turno(self, dia: int) -> Optional[Tuple[float, float]]:
+        if dia in self.turnos_especiales:
+            return self.turnos_especiales[dia]
+        if dia in self.feriados:
+            return None
+        return self.turnos_por_dia_semana.get((dia + self.dia_semana_inicial) % DIAS_POR_SEMANA)
+
+    def _armar(self, tablas: _TablasJornadas, dias: int) -> _TablasJornadas:
+        """Tablas nuevas hasta 'dias' (copia las de 'tablas', que no se tocan)."""
+        dias_laborales, aperturas, cierres, acumulados = (list(tabla) for tabla in tablas[:4])
+        for dia in range(tablas.dias_armados, dias):
+            turno = self._turno(dia)
+            if turno is None:
+                continue
+            inicio, fin = turno
+            dias_laborales.append(dia)
+            aperturas.append(dia * MINUTOS_POR_DIA + inicio)
+            cierres.append(dia * MINUTOS_POR_DIA + fin)
+            acumulados.append(acumulados[-1] + (fin - inicio))
+        return _TablasJornadas(dias_laborales, aperturas, cierres, acumulados, dias)
+
+    def preparar(self, dias: int):
+        """Arma las tablas para al menos 'dias' días (una asignación; no toca las publicadas)."""
+        tablas = self._tablas
+        if tablas.dias_armados < dias:
+            self._tablas = self._armar(tablas, dias)
+
+    def _extender(self, cubre: Callable[[_TablasJornadas], bool]) -> _TablasJornadas:
+        tablas = self._tablas
+        dias = tablas.dias_armados
+        while True:
+            dias *= 2
+            nuevas = self._armar(tablas, dias)
+            if cubre(nuevas):
+                self._tablas = nuevas
+                return nuevas
+
+    def _jornada(self, tiempo_minutos: float) -> Tuple[_TablasJornadas, int]:
+        """Tablas vigentes y primera jornada que cierra después de 'tiempo_minutos' (la vigente o la próxima)."""
+        tablas = self._tablas
+        if not tablas.cierres or tablas.cierres[-1] <= tiempo_minutos:
+            tablas = self._extender(lambda nuevas: bool(nuevas.cierres) and nuevas.cierres[-1] > tiempo_minutos)
+        return tablas, bisect_right(tablas.cierres, tiempo_minutos)
+
+    def normalizar_a_horario_laboral(self, tiempo_minutos: float) -> float:
+        tablas, k = self._jornada(tiempo_minutos)
+        apertura = tablas.aperturas[k]
+        return apertura if tiempo_minutos < apertura else tiempo_minutos
+
+    def sumar_minutos_laborales(self, tiempo_inicio_minutos: float, duracion_minutos: float) -> float:
+        """
+        Mismo criterio que sumar_minutos_laborales: terminar justo al cierre queda en ese día.
+        Lo que no entra hoy se ubica con bisect sobre los acumulados; como son enteros
+        (turnos en minutos enteros), el resto del último día sale exacto.
+        """
+        tablas, k = self._jornada(tiempo_inicio_minutos)
+        apertura = tablas.aperturas[k]
+        tiempo_actual = apertura if tiempo_inicio_minutos < apertura else tiempo_inicio_minutos
+        if duracion_minutos <= 0:
+            return tiempo_actual
+
+        minutos_disponibles_hoy = tablas.cierres[k] - tiempo_actual
+        if duracion_minutos <= minutos_disponibles_hoy:
+            return tiempo_actual + duracion_minutos
+
+        minutos_restantes = duracion_minutos - minutos_disponibles_hoy
+        base = tablas.acumulados[k + 1]
+        objetivo = base + minutos_restantes
+        if tablas.acumulados[-1] <= objetivo:  # una jornada de margen para el ajuste
+            tablas = self._extender(lambda nuevas: nuevas.acumulados[-1] >= objetivo + 1)
+        acumulados = tablas.acumulados
+        j = bisect_left(acumulados, objetivo, k + 2) - 1
+        minutos_ultimo_dia = minutos_restantes - (acumulados[j] - base)
+        while minutos_ultimo_dia > acumulados[j + 1] - acumulados[j]:  # 'objetivo' redondeado hacia abajo
+            j += 1
+            minutos_ultimo_dia = minutos_restantes - (acumulados[j] - base)
+        return tablas.aperturas[j] + minutos_ultimo_dia
+
+    def minutos_laborales_acumulados(self, tiempo_minutos: float) -> float:
+        tablas, k = self._jornada(tiempo_minutos)
+        apertura = tablas.aperturas[k]
+        if tiempo_minutos < apertura:
+            return tablas.acumulados[k]
+        return tablas.acumulados[k] + (tiempo_minutos - apertura)
+
+    def tiempo_desde_minutos_laborales(self, minutos_laborales: float) -> float:
+        return self.sumar_minutos_laborales(self.inicio, minutos_laborales)
+
+    @property
+    def inicio(self) -> float:
+        """Apertura de la primera jornada laboral."""
+        return self.normalizar_a_horario_laboral(0)
+
+    def es_laboral(self, dia: int) -> bool:
+        return self._turno(dia) is not None
+
+    def fin_de_dia(self, dia: int) -> float:
+        """Cierre del turno del día 'dia'; si no es laboral, su medianoche de inicio."""
+        turno = self._turno(dia)
+        if turno is None:
+            return dia * MINUTOS_POR_DIA
+        return dia * MINUTOS_POR_DIA + turno[1]
+
+    def _parametros(self) -> tuple:
+        return (
+            tuple(sorted(self.turnos_por_dia_semana.items())),
+            tuple(sorted(self.feriados)),
+            tuple(sorted(self.turnos_especiales.items())),
+            self.dia_semana_inicial % DIAS_POR_SEMANA,
+        )
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, CalendarioLaboral):
+            return NotImplemented
+        return self._parametros() == otro._parametros()
+
+    def __hash__(self) -> int:
+        return hash(self._parametros())
+
+    def __repr__(self) -> str:
+        turnos, feriados, especiales, dia_semana_inicial = self._parametros()
+        return (
+            f"CalendarioLaboral(turnos_por_dia_semana={dict(turnos)}, feriados={list(feriados)}, "
+            f"turnos_especiales={dict(especiales)}, dia_semana_inicial={dia_semana_inicial})"
+        )
 
 
 def formatear_tiempo(tiempo_minutos: float) -> str:
@@ -77,19 +332,414 @@ def formatear_tiempo(tiempo_minutos: float) -> str:
 # ------------------------------------------------------------
 # Modelos
 # ------------------------------------------------------------
-@dataclass
+# slots=True existe desde Python 3.10; antes queda el dataclass común
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Trabajo:
+    """
+    Un trabajo por arribo (millones en corridas largas): con __slots__ no lleva
+    __dict__ por instancia, ocupa menos y genera menos basura.
+    """
     tiempo_arribo_minutos: float
     tipo_servicio: str                 # "IT" | "TEC" | "DEV"
     duracion_servicio_minutos: float       # sorteada al ARRIBO o PENDIENTE
     tomadoPorDev: bool = False          # si fue tomado por DEV
 
 
+@dataclass
+class MedicionLlamadas:
+    llamadas: int = 0
+    tiempo_ns: int = 0  # inclusivo: incluye lo que llama adentro
+
+    @property
+    def ns_por_llamada(self) -> float:
+        return self.tiempo_ns / self.llamadas if self.llamadas else 0.0
+
+
 @dataclass
 class ResultadoSimulacion:
     perdidos_por_tipo: Dict[str, int]
     atendidos_por_tipo: Dict[str, int]
     espera_promedio_por_tipo_min: Dict[str, float]
+    # media/varianza/cuantiles de la espera por tipo (sin guardar muestras); None en las series diarias
+    distribucion_espera_por_tipo: Optional[Dict[str, DistribucionEspera]] = None
+    largo_medio_cola_por_tipo: Optional[Dict[str, float]] = None  # solo con cola_pendientes=True
+    instrumentacion: Optional[Dict[str, MedicionLlamadas]] = None  # solo con instrumentar=True
+
+
+# ------------------------------------------------------------
+# Muestreo en bloques
+# ------------------------------------------------------------
+def admite_bloques(muestreador) -> bool:
+    """
+    Un muestreador admite bloques si además de ser invocable tiene
+    'muestrear_bloque(rng, n)' (o 'muestrear_bloque(tipo, rng, n)' para duraciones)
+    que devuelve una lista con n valores ya sorteados.
+    """
+    return callable(getattr(muestreador, "muestrear_bloque", None))
+
+
+class RandomAntitetico(random.Random):
+    """
+    random.Random que devuelve 1-U en cada uniforme: expovariate, choices, etc. (todo
+    lo que pasa por random()) sale antitético respecto del Random con la misma semilla.
+    - getrandbits no se invierte: los bloques NumPy se siembran igual y se invierten
+      sus uniformes (ver muestreadores.py).
+    - U = 0 se deja en 0 para no salir de [0, 1).
+    """
+    antitetico = True
+
+    def random(self) -> float:
+        u = super().random()
+        return 1.0 - u if u else 0.0
+
+
+def crear_rng(seed, antitetico: bool = False) -> random.Random:
+    return RandomAntitetico(seed) if antitetico else random.Random(seed)
+
+
+def rng_de_cursor(seed, nombre: str, antitetico: bool = False) -> random.Random:
+    """Rng propio de cada cursor: 'interarribo', 'tipo' o 'duracion/<TIPO>'."""
+    return crear_rng(f"{seed}/{nombre}", antitetico)
+
+
+class CursorBloques:
+    """
+    Entrega de a uno los valores de un bloque pre-sorteado y pide otro al agotarse.
+    - Cada cursor tiene su propio rng: lo que se sortea en bloque no depende de
+      cuántas veces se usó el rng del simulador (abandonos, etc.).
+    - El bloque crece x2 desde TAMANO_BLOQUE_INICIAL hasta TAMANO_BLOQUE_MAXIMO.
+    """
+
+    def __init__(self, muestrear_bloque: Callable, argumentos: tuple, rng: random.Random):
+        self.muestrear_bloque = muestrear_bloque
+        self.argumentos = argumentos  # p.ej. (tipo_servicio,) para duraciones
+        self.rng = rng
+        self.tamano_bloque = TAMANO_BLOQUE_INICIAL
+        self._proximo = iter(()).__next__
+
+    def siguiente_bloque(self) -> list:
+        bloque = self.muestrear_bloque(*self.argumentos, self.rng, self.tamano_bloque)
+        self.tamano_bloque = min(self.tamano_bloque * 2, TAMANO_BLOQUE_MAXIMO)
+        return bloque
+
+    def _recargar(self):
+        self._proximo = iter(self.siguiente_bloque()).__next__
+
+    def siguiente(self):
+        try:
+            return self._proximo()
+        except StopIteration:
+            self._recargar()
+            return self._proximo()
+
+    def estado(self) -> tuple:
+        """(estado del rng, tamaño del próximo bloque, valores del bloque aún no entregados)."""
+        restantes = list(self._proximo.__self__)
+        self._proximo = iter(restantes).__next__
+        return self.rng.getstate(), self.tamano_bloque, restantes
+
+    def restaurar(self, estado: tuple):
+        estado_rng, self.tamano_bloque, restantes = estado
+        self.rng.setstate(estado_rng)
+        self._proximo = iter(list(restantes)).__next__
+
+
+class ReproduccionArribos:
+    """
+    Arribos tomados de un historial en vez de sorteados (ver historial.py).
+    - 'registros' es un iterable de (tiempo_min, tipo, duracion_min) ordenado por tiempo,
+      en minutos absolutos desde el Día 0 00:00; se consume de a uno, así que un
+      generador sobre un archivo corre en memoria constante.
+    - Los puntos de control necesitan volver a recorrerlo desde el principio: con un
+      iterador de una sola pasada (un generador) guardar o restaurar da ValueError;
+      HistorialCSV / HistorialBinario reabren el archivo en cada recorrida.
+    - Un ticket fuera de horario arriba (y empieza a esperar) en la próxima apertura.
+    - Agotado el historial, TPLL = HV.
+    """
+
+    def __init__(self, registros: Iterable[Tuple[float, str, float]], normalizar: Callable[[float], float]):
+        self.registros = registros
+        self._iterador = iter(registros)
+        self._normalizar = normalizar
+        self._tipo: Optional[str] = None
+        self._duracion = 0.0
+        self._ultimo_tiempo = -math.inf
+        self.leidos = 0
+
+    def siguiente_arribo(self) -> float:
+        """Avanza al próximo registro y devuelve su tiempo (ya en horario laboral)."""
+        registro = next(self._iterador, None)
+        if registro is None:
+            return HORIZONTE_VACIO
+        tiempo, tipo, duracion = registro
+        if tiempo < self._ultimo_tiempo:
+            raise ValueError(f"historial desordenado en el registro {self.leidos}: {tiempo} < {self._ultimo_tiempo}")
+        if tipo not in CODIGO_TIPO:
+            raise ValueError(f"tipo desconocido en el registro {self.leidos}: {tipo!r}")
+        self.leidos += 1
+        self._ultimo_tiempo = tiempo
+        self._tipo = tipo
+        self._duracion = duracion
+        return self._normalizar(tiempo)
+
+    # Reemplazan a _sortear_tipo_servicio / _obtener_duracion_servicio_minutos
+    def tipo(self) -> str:
+        return self._tipo
+
+    def duracion(self, tipo_servicio: str) -> float:
+        return self._duracion
+
+    def _verificar_reanudable(self):
+        if iter(self.registros) is self.registros:
+            raise ValueError(
+                "historial_arribos es un iterador de una sola pasada y no se puede reanudar: "
+                "usar HistorialCSV / HistorialBinario o una secuencia"
+            )
+
+    def estado(self) -> tuple:
+        self._verificar_reanudable()
+        return self.leidos, self._tipo, self._duracion, self._ultimo_tiempo
+
+    def restaurar(self, estado: tuple):
+        """Vuelve a recorrer 'registros' desde el principio y saltea lo ya leído."""
+        self._verificar_reanudable()
+        self.leidos, self._tipo, self._duracion, self._ultimo_tiempo = estado
+        self._iterador = iter(self.registros)
+        deque(islice(self._iterador, self.leidos), maxlen=0)
+
+
+class ArribosNoHomogeneos:
+    """
+    Arribos de un Poisson no homogéneo (tasa por hora del día y día de la semana, ver
+    muestreadores.TasaArribosPorHora) en vez de interarribos en minutos laborales.
+    - Los tiempos son de reloj desde el Día 0 00:00: la tasa ya dice cuándo llega la
+      gente; lo que cae fuera de horario arriba en la próxima apertura.
+    - Se invierte la intensidad acumulada de a bloques de exponenciales (como CursorBloques,
+      crecen x2 hasta TAMANO_BLOQUE_MAXIMO) con el rng propio del cursor "arribos".
+    """
+
+    def __init__(self, tasa: TasaArribosPorHora, rng: random.Random, normalizar: Callable[[float], float]):
+        self.tasa = tasa
+        self.rng = rng
+        self._normalizar = normalizar
+        self.tamano_bloque = TAMANO_BLOQUE_INICIAL
+        self._fin_bloque = 0.0  # último tiempo sorteado: de ahí sigue el próximo bloque
+        self._proximo = iter(()).__next__
+
+    def _recargar(self):
+        exponenciales = self.tasa.exponenciales_bloque(self.rng, self.tamano_bloque)
+        bloque = self.tasa.tiempos_desde(self._fin_bloque, exponenciales)
+        self.tamano_bloque = min(self.tamano_bloque * 2, TAMANO_BLOQUE_MAXIMO)
+        self._fin_bloque = bloque[-1]
+        self._proximo = iter(bloque).__next__
+
+    def siguiente_arribo(self) -> float:
+        """Tiempo del próximo arribo (ya en horario laboral)."""
+        try:
+            tiempo = self._proximo()
+        except StopIteration:
+            self._recargar()
+            tiempo = self._proximo()
+        return self._normalizar(tiempo)
+
+    def estado(self) -> tuple:
+        restantes = list(self._proximo.__self__)
+        self._proximo = iter(restantes).__next__
+        return self.rng.getstate(), self.tamano_bloque, self._fin_bloque, restantes
+
+    def restaurar(self, estado: tuple):
+        estado_rng, self.tamano_bloque, self._fin_bloque, restantes = estado
+        self.rng.setstate(estado_rng)
+        self._proximo = iter(list(restantes)).__next__
+
+
+# ------------------------------------------------------------
+# Puntos de control (snapshot / reanudación)
+# ------------------------------------------------------------
+VERSION_PUNTO_CONTROL: int = 7
+
+
+@dataclass(frozen=True)
+class PuntoControl:
+    """
+    Cada cuánto guardar el estado completo del simulador en 'ruta' durante correr().
+    - cada_eventos y/o cada_dias (días simulados); el archivo se reescribe en cada guardado.
+    - Se guarda entre eventos, así que reanudar da exactamente el mismo resultado.
+    """
+    ruta: str
+    cada_eventos: Optional[int] = None
+    cada_dias: Optional[int] = None
+
+
+def guardar_estado(ruta: str, estado: dict):
+    """pickle + zlib, con escritura atómica (un corte a mitad no pisa el anterior)."""
+    datos = zlib.compress(pickle.dumps(estado, pickle.HIGHEST_PROTOCOL), 1)
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(datos)
+    os.replace(temporal, ruta)
+
+
+def cargar_estado(ruta: str) -> dict:
+    with open(ruta, "rb") as archivo:
+        estado = pickle.loads(zlib.decompress(archivo.read()))
+    if estado.get("version") != VERSION_PUNTO_CONTROL:
+        raise ValueError(f"punto de control con versión desconocida: {estado.get('version')}")
+    return estado
+
+
+# ------------------------------------------------------------
+# Instrumentación opcional
+# ------------------------------------------------------------
+# Métodos (o atributos) del simulador que se miden con instrumentar=True
+PUNTOS_INSTRUMENTADOS = (
+    "_procesar_arribo",
+    "_procesar_salida",
+    "_buscar_operador_libre",
+    "_buscar_operador_para_agendar",
+    "_sumar_minutos_laborales",
+)
+
+
+class Cronometrado:
+    """
+    Envuelve una función contando llamadas y perf_counter_ns acumulado.
+    Se instala como atributo de instancia: sin instrumentar no queda ningún if
+    en el loop, se llama directo al método original.
+    """
+
+    def __init__(self, funcion: Callable, medicion: MedicionLlamadas):
+        self.funcion = funcion
+        self.medicion = medicion
+
+    def __call__(self, *args):
+        inicio = time.perf_counter_ns()
+        try:
+            return self.funcion(*args)
+        finally:
+            self.medicion.tiempo_ns += time.perf_counter_ns() - inicio
+            self.medicion.llamadas += 1
+
+
+# ------------------------------------------------------------
+# Calendario de eventos futuros (salidas)
+# ------------------------------------------------------------
+class CalendarioSalidas:
+    """
+    Heap de salidas programadas con clave (tiempo, prioridad_pool, indice_operador).
+    - prioridad_pool sigue el orden de POOLS => en empate gana IT, luego TEC, luego DEV
+      y dentro del pool el menor índice (igual que el barrido de cátedra).
+    - Invalidación perezosa: una entrada vale solo si el TPS del operador sigue siendo
+      ese tiempo. Las entradas viejas se descartan cuando llegan al tope.
+    """
+
+    def __init__(self, vectores_tps: List[List[float]]):
+        self.vectores_tps = vectores_tps  # en el orden de POOLS
+        self.heap: List[Tuple[float, int, int]] = []
+        self.reconstruir()
+
+    def reconstruir(self):
+        self.heap = [
+            (tps, prioridad, i)
+            for prioridad, vector in enumerate(self.vectores_tps)
+            for i, tps in enumerate(vector)
+            if tps != HORIZONTE_VACIO
+        ]
+        heapq.heapify(self.heap)
+
+    def programar(self, prioridad_pool: int, indice_operador: int, tiempo: float):
+        if tiempo != HORIZONTE_VACIO:
+            heapq.heappush(self.heap, (tiempo, prioridad_pool, indice_operador))
+
+    def proxima(self) -> Tuple[float, int, int]:
+        heap = self.heap
+        vectores = self.vectores_tps
+        while heap:
+            tiempo, prioridad, indice = heap[0]
+            if vectores[prioridad][indice] == tiempo:
+                return tiempo, prioridad, indice
+            heapq.heappop(heap)
+        return HORIZONTE_VACIO, -1, -1
+
+
+class IndiceOperadoresLibres:
+    """
+    Min-heap con los índices de operadores libres de un pool (gana el menor índice).
+    - Libre = TPS == HV y AG == None (misma regla que el barrido).
+    - Invalidación perezosa: cuando un operador se ocupa no se lo saca del heap;
+      se descarta al llegar al tope. Cada índice está a lo sumo una vez en el heap.
+    """
+
+    def __init__(self, vector_tps: List[float], vector_ag: List[Optional[Trabajo]]):
+        self.vector_tps = vector_tps
+        self.vector_ag = vector_ag
+        self.heap: List[int] = []
+        self.en_heap: List[bool] = [False] * len(vector_tps)
+        for i in range(len(vector_tps)):
+            if self._esta_libre(i):
+                self.liberar(i)
+
+    def _esta_libre(self, indice: int) -> bool:
+        return self.vector_tps[indice] == HORIZONTE_VACIO and self.vector_ag[indice] is None
+
+    def liberar(self, indice: int):
+        if not self.en_heap[indice]:
+            self.en_heap[indice] = True
+            heapq.heappush(self.heap, indice)
+
+    def primero(self) -> int:
+        heap = self.heap
+        while heap:
+            indice = heap[0]
+            if self._esta_libre(indice):
+                return indice
+            heapq.heappop(heap)
+            self.en_heap[indice] = False
+        return -1
+
+
+class IndiceAgendables:
+    """
+    Min-heap (TPS, indice) de operadores ocupados con slot de agenda libre en un pool.
+    - Gana el que termina antes y, en empate, el menor índice (igual que el barrido).
+    - Se carga al iniciar cada servicio; una entrada vale solo si el operador sigue
+      con ese TPS y con el slot vacío (invalidación perezosa).
+    """
+
+    def __init__(self, vector_tps: List[float], vector_ag: List[Optional[Trabajo]]):
+        self.vector_tps = vector_tps
+        self.vector_ag = vector_ag
+        self.heap: List[Tuple[float, int]] = [
+            (tps, i) for i, tps in enumerate(vector_tps)
+            if tps != HORIZONTE_VACIO and vector_ag[i] is None
+        ]
+        heapq.heapify(self.heap)
+
+    def ocupar(self, indice: int, tps: float):
+        if tps != HORIZONTE_VACIO:
+            heapq.heappush(self.heap, (tps, indice))
+
+    def mejor(self) -> Tuple[float, int]:
+        heap = self.heap
+        vector_tps = self.vector_tps
+        vector_ag = self.vector_ag
+        while heap:
+            tps, indice = heap[0]
+            if vector_tps[indice] == tps and vector_ag[indice] is None:
+                return tps, indice
+            heapq.heappop(heap)
+        return HORIZONTE_VACIO, -1
+
+
+def _columna(tabla: str, codigo: int) -> property:
+    """Expone self.<tabla>[codigo] con el nombre de cátedra (TPSIT, AGTEC, DEVATENCIONIT, ...)."""
+    return property(
+        lambda self: getattr(self, tabla)[codigo],
+        lambda self, valor: getattr(self, tabla).__setitem__(codigo, valor),
+    )
 
 
 # ------------------------------------------------------------
@@ -105,10 +755,46 @@ class SimuladorMesaAyuda:
     Reglas:
     - Atender si hay operador libre.
     - Si no hay libre: agendar en un operador específico ocupado con slot libre (1 por operador).
-    - Si no hay slot para agendar: se pierde.
+    - Si no hay slot para agendar: se pierde. Con cola_pendientes=True espera en una
+      cola FIFO de su tipo (salvo que abandone por la espera) y la toma el próximo
+      operador que se libere (ver _procesar_pendiente).
     - Operador "libre" SOLO si no está atendiendo (TPS=HV) y no tiene trabajo asignado (slot None).
+    Motores:
+    - "barrido": busca el mínimo TPS recorriendo los vectores (referencia de cátedra).
+    - "calendario": usa CalendarioSalidas e índices por pool de operadores libres y
+      de ocupados con slot libre (O(log n) por evento), mismos resultados.
+    Muestreadores:
+    - Invocables por llamada (firma de siempre) usando self.rng.
+    - Si además tienen 'muestrear_bloque' se consumen con un CursorBloques
+      (un rng propio por cursor, derivado de la semilla).
+    - muestrear_tipo_servicio es opcional; sin él se usa el 70/20/10 de cátedra.
+    - antitetico=True usa RandomAntitetico en todos los rngs (tipo, interarribo,
+      duración y el 50% de abandono): la corrida pareja de la misma semilla.
+    - historial_arribos=... reproduce arribos registrados (tiempo, tipo, duración) en vez
+      de sortearlos (ver ReproduccionArribos e historial.py); el rng queda para el abandono.
+    - tasa_arribos=TasaArribosPorHora(...) reemplaza al interarribo por una tasa por hora
+      del día y día de la semana (ver ArribosNoHomogeneos); tipo y duración se sortean igual.
+    Horario laboral:
+    - Por defecto 9-18 todos los días (forma cerrada).
+    - calendario=CalendarioLaboral(...) agrega fines de semana, feriados y turnos
+      especiales; 'dias' sigue contando días corridos (laborales o no).
+    Internamente los tipos son códigos (TIPO_IT, TIPO_TEC, TIPO_DEV) que indexan
+    tablas por pool (_tps, _ag, contadores); TPSIT, AGTEC, etc. son vistas de esas
+    tablas y las métricas se devuelven con claves "IT" | "TEC" | "DEV".
     """
 
+    # Vistas de cátedra sobre las tablas por pool
+    TPSIT = _columna("_tps", TIPO_IT)
+    TPSTEC = _columna("_tps", TIPO_TEC)
+    TPSDEVS = _columna("_tps", TIPO_DEV)
+    AGIT = _columna("_ag", TIPO_IT)
+    AGTEC = _columna("_ag", TIPO_TEC)
+    AGDEVS = _columna("_ag", TIPO_DEV)
+    DEVATENCIONIT = _columna("_derivados_a_dev", TIPO_IT)
+    DEVATENCIONTEC = _columna("_derivados_a_dev", TIPO_TEC)
+    PERDIDATIEMPOMAS30IT = _columna("_perdidos_espera_mas_30", TIPO_IT)
+    PERDIDATIEMPOMAS30TEC = _columna("_perdidos_espera_mas_30", TIPO_TEC)
+
     def __init__(
         self,
         cantidad_operadores_it: int,
@@ -118,9 +804,32 @@ class SimuladorMesaAyuda:
         muestrear_duracion_servicio_min: Callable[[str, random.Random], float],
         seed: int = 1,
         debug: bool = False,
+        motor: str = MOTOR_BARRIDO,
+        muestrear_tipo_servicio: Optional[Callable[[random.Random], str]] = None,
+        traza=None,
+        instrumentar: bool = False,
+        antitetico: bool = False,
+        calendario: Optional[CalendarioLaboral] = None,
+        cola_pendientes: bool = False,
+        historial_arribos: Optional[Iterable[Tuple[float, str, float]]] = None,
+        tasa_arribos: Optional[TasaArribosPorHora] = None,
     ):
-        self.rng = random.Random(seed)
+        if motor not in MOTORES:
+            raise ValueError(f"motor debe ser uno de {MOTORES}")
+        if historial_arribos is not None and tasa_arribos is not None:
+            raise ValueError("historial_arribos y tasa_arribos son excluyentes")
+        if tasa_arribos is not None and calendario is not None and tasa_arribos.dia_semana_inicial != calendario.dia_semana_inicial:
+            raise ValueError("tasa_arribos y calendario deben empezar el mismo día de la semana")
+        self.seed = seed
+        self.antitetico = antitetico
+        self.rng = crear_rng(seed, antitetico)
         self.debug = debug
+        self.traza = traza  # traza.EscritorTraza opcional (registros binarios)
+        self.motor = motor
+        # Se arman al iniciar correr() con los vectores vigentes
+        self._calendario: Optional[CalendarioSalidas] = None
+        self._libres: Optional[List[IndiceOperadoresLibres]] = None  # en el orden de POOLS
+        self._agendables: Optional[List[IndiceAgendables]] = None
 
         self.cantidad_operadores_it = cantidad_operadores_it
         self.cantidad_operadores_tecnico = cantidad_operadores_tecnico
@@ -129,39 +838,188 @@ class SimuladorMesaAyuda:
         # Wrappers inyectados (los vas a cambiar después)
         self.muestrear_interarribo_min = muestrear_interarribo_min
         self.muestrear_duracion_servicio_min = muestrear_duracion_servicio_min
-
-        # Vectores TPS (fin de servicio por operador)
-        self.TPSIT: List[float] = [HORIZONTE_VACIO] * cantidad_operadores_it
-        self.TPSTEC: List[float] = [HORIZONTE_VACIO] * cantidad_operadores_tecnico
-        self.TPSDEVS: List[float] = [HORIZONTE_VACIO] * cantidad_operadores_dev
-
-        # 1 trabajo calendarizado por operador (asignado a un operador específico)
-        self.AGIT: List[Optional[Trabajo]] = [None] * cantidad_operadores_it
-        self.AGTEC: List[Optional[Trabajo]] = [None] * cantidad_operadores_tecnico
-        self.AGDEVS: List[Optional[Trabajo]] = [None] * cantidad_operadores_dev
-        self.TrabajoPendiente: List[Trabajo] = []
-        self.DEVATENCIONIT = 0 
-        self.DEVATENCIONTEC = 0 
-        self.PERDIDATIEMPOMAS30IT = 0
-        self.PERDIDATIEMPOMAS30TEC = 0
+        self.muestrear_tipo_servicio = muestrear_tipo_servicio
+        self._configurar_muestreo()
+
+        # Aritmética de horario laboral vía atributo: se puede cronometrar sin tocar el loop.
+        # Sin calendario queda la forma cerrada del 9-18 de todos los días.
+        self.calendario = calendario
+        if calendario is None:
+            self._normalizar_a_horario_laboral = normalizar_a_horario_laboral
+            self._sumar_minutos_laborales = sumar_minutos_laborales
+        else:
+            self._normalizar_a_horario_laboral = calendario.normalizar_a_horario_laboral
+            self._sumar_minutos_laborales = calendario.sumar_minutos_laborales
+
+        # Fuente de arribos en vez del interarribo: historial (tipo y duración salen del
+        # registro en curso, no de los muestreadores) o tasa no homogénea
+        self.tasa_arribos = tasa_arribos
+        self._fuente_arribos: Optional[Union[ReproduccionArribos, ArribosNoHomogeneos]] = None
+        if historial_arribos is not None:
+            self._fuente_arribos = ReproduccionArribos(historial_arribos, self._normalizar_a_horario_laboral)
+            self._sortear_tipo_servicio = self._fuente_arribos.tipo
+            self._obtener_duracion_servicio_minutos = self._fuente_arribos.duracion
+        elif tasa_arribos is not None:
+            self._fuente_arribos = ArribosNoHomogeneos(
+                tasa_arribos, self._crear_rng_cursor("arribos"), self._normalizar_a_horario_laboral
+            )
+        self.instrumentacion: Optional[Dict[str, MedicionLlamadas]] = None
+        self.eventos_procesados = 0  # arribos + salidas acumulados de la corrida (incluye continuar)
+        self._reloj: Optional[Tuple[float, float, float]] = None  # (T, TPLL, fin) al terminar; para continuar()
+        if instrumentar:
+            self._instrumentar()
+
+        cantidades = (cantidad_operadores_it, cantidad_operadores_tecnico, cantidad_operadores_dev)
+
+        # Vectores TPS (fin de servicio por operador), uno por pool: TPSIT, TPSTEC, TPSDEVS
+        self._tps: List[List[float]] = [[HORIZONTE_VACIO] * n for n in cantidades]
+
+        # 1 trabajo calendarizado por operador (asignado a un operador específico): AGIT, AGTEC, AGDEVS
+        self._ag: List[List[Optional[Trabajo]]] = [[None] * n for n in cantidades]
+        # Cola FIFO por código de tipo (cola_pendientes=True): lo que no se atiende ni se
+        # agenda espera acá en vez de perderse. Largo ponderado por tiempo: área acumulada
+        # hasta el último cambio de cada cola.
+        self.cola_pendientes = cola_pendientes
+        self._pendientes: List[Deque[Trabajo]] = [deque() for _ in POOLS]
+        self._area_cola = [0.0, 0.0, 0.0]
+        self._ultimo_cambio_cola = [0.0, 0.0, 0.0]
+        self._inicio_corrida = 0.0
+        self._derivados_a_dev = [0, 0, 0]           # DEVATENCIONIT, DEVATENCIONTEC
+        self._perdidos_espera_mas_30 = [0, 0, 0]    # PERDIDATIEMPOMAS30IT, PERDIDATIEMPOMAS30TEC
         self.TIPO_EN_SERVICIO_DEV: List[Optional[str]] = [None] * cantidad_operadores_dev
 
+        # Métricas por código de tipo
+        self._perdidos = [0, 0, 0]
+        self._atendidos = [0, 0, 0]
+        self._suma_espera_min = [0.0, 0.0, 0.0]
 
+        # Distribución de la espera por código de tipo (al iniciar servicio, memoria acotada).
+        # Se reinicia al empezar el día 'registrar_esperas_desde_dia' (calentamiento).
+        self._distribucion_espera = [DistribucionEspera() for _ in POOLS]
+        self.registrar_esperas_desde_dia = 0
 
-        # Métricas
-        self.perdidos_por_tipo = {"IT": 0, "TEC": 0, "DEV": 0}
-        self.atendidos_por_tipo = {"IT": 0, "TEC": 0, "DEV": 0}
-        self.suma_espera_por_tipo_min = {"IT": 0.0, "TEC": 0.0, "DEV": 0.0}
+        # Acumulados al empezar cada día de la corrida (serie diaria sin guardar eventos)
+        self._cortes_diarios: List[tuple] = [self._acumulados()]
+        self._proximo_corte_dia: float = MINUTOS_POR_DIA
+
+    # -----------------------------
+    # Métricas con claves de tipo (borde público)
+    # -----------------------------
+    @property
+    def perdidos_por_tipo(self) -> Dict[str, int]:
+        return dict(zip(POOLS, self._perdidos))
+
+    @property
+    def atendidos_por_tipo(self) -> Dict[str, int]:
+        return dict(zip(POOLS, self._atendidos))
+
+    @property
+    def suma_espera_por_tipo_min(self) -> Dict[str, float]:
+        return dict(zip(POOLS, self._suma_espera_min))
+
+    def _acumulados(self) -> tuple:
+        return tuple(self._perdidos), tuple(self._atendidos), tuple(self._suma_espera_min)
+
+    def _cerrar_dias(self, tiempo: float) -> float:
+        """Registra los acumulados de cada medianoche que 'tiempo' dejó atrás; devuelve el próximo corte."""
+        while tiempo >= self._proximo_corte_dia:
+            self._cortes_diarios.append(self._acumulados())
+            self._proximo_corte_dia += MINUTOS_POR_DIA
+            if len(self._cortes_diarios) - 1 == self.registrar_esperas_desde_dia:
+                self._distribucion_espera = [DistribucionEspera() for _ in POOLS]
+        return self._proximo_corte_dia
+
+    def _distribuciones(self) -> Dict[str, DistribucionEspera]:
+        return {tipo: distribucion.copia() for tipo, distribucion in zip(POOLS, self._distribucion_espera)}
+
+    def _resultado_entre(self, desde: tuple, hasta: tuple, con_distribucion: bool = False) -> ResultadoSimulacion:
+        perdidos, atendidos, suma_espera = ([b - a for a, b in zip(x, y)] for x, y in zip(desde, hasta))
+        return ResultadoSimulacion(
+            perdidos_por_tipo=dict(zip(POOLS, perdidos)),
+            atendidos_por_tipo=dict(zip(POOLS, atendidos)),
+            espera_promedio_por_tipo_min={
+                tipo: suma_espera[codigo] / atendidos[codigo] if atendidos[codigo] > 0 else 0.0
+                for codigo, tipo in enumerate(POOLS)
+            },
+            distribucion_espera_por_tipo=self._distribuciones() if con_distribucion else None,
+            instrumentacion=self.instrumentacion,
+        )
+
+    def metricas_diarias(self) -> List[ResultadoSimulacion]:
+        """
+        Un ResultadoSimulacion por día de la corrida (0 .. dias_simulados-1), con lo que
+        pasó ese día: perdidos y atendidos del día, espera sumada ese día / atendidos ese día.
+        El evento que se procesa después del cierre del último día queda afuera.
+        """
+        cortes = self._cortes_diarios + [self._acumulados()]
+        return [self._resultado_entre(cortes[dia], cortes[dia + 1]) for dia in range(self.dias_simulados)]
+
+    def resultado_estacionario(self, dias_calentamiento: int) -> ResultadoSimulacion:
+        """
+        Métricas de la corrida descartando los primeros 'dias_calentamiento' días (transitorio).
+        La distribución de la espera solo viene si se registró desde ese día
+        (registrar_esperas_desde_dia == dias_calentamiento, lo que arma ConfiguracionSimulador).
+        """
+        if not 0 <= dias_calentamiento < self.dias_simulados:
+            raise ValueError("dias_calentamiento debe estar en [0, dias_simulados)")
+        cortes = self._cortes_diarios + [self._acumulados()]
+        con_distribucion = dias_calentamiento == self.registrar_esperas_desde_dia
+        return self._resultado_entre(cortes[dias_calentamiento], cortes[self.dias_simulados], con_distribucion)
+
+    def _instrumentar(self):
+        self.instrumentacion = {}
+        for nombre in PUNTOS_INSTRUMENTADOS:
+            medicion = MedicionLlamadas()
+            self.instrumentacion[nombre.lstrip("_")] = medicion
+            setattr(self, nombre, Cronometrado(getattr(self, nombre), medicion))
 
     # -----------------------------
     # Wrappers internos declarativos
     # -----------------------------
+    def _crear_rng_cursor(self, nombre: str) -> random.Random:
+        return rng_de_cursor(self.seed, nombre, self.antitetico)
+
+    def _configurar_muestreo(self):
+        """
+        Para los muestreadores con bloques reemplaza los wrappers por el cursor
+        (sin un if por llamada en el loop).
+        """
+        self._cursores_duracion: Optional[Dict[str, CursorBloques]] = None
+        self._cursores: Dict[str, CursorBloques] = {}  # por nombre, para los puntos de control
+
+        if admite_bloques(self.muestrear_interarribo_min):
+            cursor = CursorBloques(self.muestrear_interarribo_min.muestrear_bloque, (), self._crear_rng_cursor("interarribo"))
+            self._cursores["interarribo"] = cursor
+            self._obtener_siguiente_interarribo_minutos = cursor.siguiente
+
+        if admite_bloques(self.muestrear_duracion_servicio_min):
+            self._cursores_duracion = {
+                tipo: CursorBloques(
+                    self.muestrear_duracion_servicio_min.muestrear_bloque, (tipo,), self._crear_rng_cursor(f"duracion/{tipo}")
+                )
+                for tipo in POOLS
+            }
+            for tipo, cursor in self._cursores_duracion.items():
+                self._cursores[f"duracion/{tipo}"] = cursor
+            self._obtener_duracion_servicio_minutos = self._obtener_duracion_servicio_minutos_bloques
+
+        if self.muestrear_tipo_servicio is not None:
+            if admite_bloques(self.muestrear_tipo_servicio):
+                cursor = CursorBloques(self.muestrear_tipo_servicio.muestrear_bloque, (), self._crear_rng_cursor("tipo"))
+                self._cursores["tipo"] = cursor
+                self._sortear_tipo_servicio = cursor.siguiente
+            else:
+                self._sortear_tipo_servicio = self._sortear_tipo_servicio_inyectado
+
     def _obtener_siguiente_interarribo_minutos(self) -> float:
         return self.muestrear_interarribo_min(self.rng)
 
     def _obtener_duracion_servicio_minutos(self, tipo_servicio: str) -> float:
         return self.muestrear_duracion_servicio_min(tipo_servicio, self.rng)
 
+    def _obtener_duracion_servicio_minutos_bloques(self, tipo_servicio: str) -> float:
+        return self._cursores_duracion[tipo_servicio].siguiente()
+
     # -----------------------------
     # Sorteo del tipo (70/20/10)
     # -----------------------------
@@ -173,6 +1031,9 @@ class SimuladorMesaAyuda:
             return "TEC"
         return "DEV"
 
+    def _sortear_tipo_servicio_inyectado(self) -> str:
+        return self.muestrear_tipo_servicio(self.rng)
+
     # -----------------------------
     # Cálculo de mínimos (como en cátedra)
     # -----------------------------
@@ -189,20 +1050,22 @@ class SimuladorMesaAyuda:
         return minimo, indice_minimo
 
     def _elegir_siguiente_salida(self) -> Tuple[float, str, int]:
-        min_it, idx_it = self._minimo_tps_y_indice(self.TPSIT)
-        min_tec, idx_tec = self._minimo_tps_y_indice(self.TPSTEC)
-        min_dev, idx_dev = self._minimo_tps_y_indice(self.TPSDEVS)
+        if self._calendario is not None:
+            tiempo_minimo, prioridad, indice = self._calendario.proxima()
+            if tiempo_minimo == HORIZONTE_VACIO:
+                return HORIZONTE_VACIO, "", -1
+            return tiempo_minimo, POOLS[prioridad], indice
+
+        # Prioridad en empate (prioridad it): '<' estricto recorriendo IT, TEC, DEV
+        tiempo_minimo, pool_minimo, indice_minimo = HORIZONTE_VACIO, -1, -1
+        for codigo, vector_tps in enumerate(self._tps):
+            minimo, indice = self._minimo_tps_y_indice(vector_tps)
+            if minimo < tiempo_minimo:
+                tiempo_minimo, pool_minimo, indice_minimo = minimo, codigo, indice
 
-        tiempo_minimo = min(min_it, min_tec, min_dev)
         if tiempo_minimo == HORIZONTE_VACIO:
             return HORIZONTE_VACIO, "", -1
-
-        # Prioridad en empate (prioridad it)
-        if min_it == tiempo_minimo:
-            return tiempo_minimo, "IT", idx_it
-        if min_tec == tiempo_minimo:
-            return tiempo_minimo, "TEC", idx_tec
-        return tiempo_minimo, "DEV", idx_dev
+        return tiempo_minimo, POOLS[pool_minimo], indice_minimo
 
     # -----------------------------
     # Reglas: libre / agendar
@@ -212,32 +1075,28 @@ class SimuladorMesaAyuda:
         Libre SOLO si:
         - TPS == HV (no está atendiendo)
         - y NO tiene trabajo asignado (AG == None)
+        IT y TEC caen al pool DEV si no hay libre en el propio (tomadoPorDev).
         """
-        tipo_servicio = trabajo.tipo_servicio
-        if tipo_servicio == "IT":
-            for i in range(self.cantidad_operadores_it):
-                if self.TPSIT[i] == HORIZONTE_VACIO and self.AGIT[i] is None:
-                    return i
-            for i in range(self.cantidad_operadores_dev):
-                if self.TPSDEVS[i] == HORIZONTE_VACIO and self.AGDEVS[i] is None:
-                    self.DEVATENCIONIT += 1
-                    trabajo.tomadoPorDev = True
-                    return i
-            return -1
-
-        if tipo_servicio == "TEC":
-            for i in range(self.cantidad_operadores_tecnico):
-                if self.TPSTEC[i] == HORIZONTE_VACIO and self.AGTEC[i] is None:
-                    return i
-            for i in range(self.cantidad_operadores_dev):
-                if self.TPSDEVS[i] == HORIZONTE_VACIO and self.AGDEVS[i] is None:
-                    self.DEVATENCIONTEC += 1
-                    trabajo.tomadoPorDev = True
-                    return i
-            return -1
-        
-        for i in range(self.cantidad_operadores_dev):
-            if self.TPSDEVS[i] == HORIZONTE_VACIO and self.AGDEVS[i] is None:
+        codigo = CODIGO_TIPO.get(trabajo.tipo_servicio, TIPO_DEV)
+        indice = self._primer_libre(codigo)
+        if indice != -1 or codigo == TIPO_DEV:
+            return indice
+
+        indice = self._primer_libre(TIPO_DEV)
+        if indice != -1:
+            self._derivados_a_dev[codigo] += 1
+            trabajo.tomadoPorDev = True
+        return indice
+
+    def _primer_libre(self, codigo_pool: int) -> int:
+        """Menor índice libre del pool: por índice (motor calendario) o barriendo."""
+        if self._libres is not None:
+            return self._libres[codigo_pool].primero()
+
+        vector_tps = self._tps[codigo_pool]
+        vector_ag = self._ag[codigo_pool]
+        for i in range(len(vector_tps)):
+            if vector_tps[i] == HORIZONTE_VACIO and vector_ag[i] is None:
                 return i
         return -1
 
@@ -245,44 +1104,33 @@ class SimuladorMesaAyuda:
         """
         Se agenda SOLO si el operador está ocupado (TPS != HV) y su slot está libre.
         Elegimos el que termina antes (menor TPS).
+        IT/TEC: si hay que esperar más de 30 min, 50% de que se vaya. El sorteo se
+        hace aunque no haya candidato (mejor_tps = HV), como siempre.
+        Devuelve el índice, -1 si no hay con quién agendar o ABANDONO si se fue.
         """
+        codigo = CODIGO_TIPO.get(tipo_servicio, TIPO_DEV)
+        mejor_tps, mejor_indice = self._mejor_agendable(codigo)
+
+        if codigo != TIPO_DEV and mejor_tps-tiempo_arribo_minutos>30 and self.rng.random() < 0.5:
+            self._perdidos_espera_mas_30[codigo] += 1
+            return ABANDONO
+        return mejor_indice
+
+    def _mejor_agendable(self, codigo_pool: int) -> Tuple[float, int]:
+        """(menor TPS, índice) entre ocupados con slot libre del pool, o (HV, -1)."""
+        if self._agendables is not None:
+            return self._agendables[codigo_pool].mejor()
+
         mejor_indice = -1
         mejor_tps = HORIZONTE_VACIO
-
-        if tipo_servicio == "IT":
-            for i in range(self.cantidad_operadores_it):
-                ocupado = self.TPSIT[i] != HORIZONTE_VACIO
-                slot_libre = self.AGIT[i] is None
-                if ocupado and slot_libre and self.TPSIT[i] < mejor_tps:
-                    mejor_tps = self.TPSIT[i]
-                    mejor_indice = i
-            
-            if mejor_tps-tiempo_arribo_minutos>30 and self.rng.random() < 0.5:
-                self.PERDIDATIEMPOMAS30IT += 1
-                return -1
-            
-            return mejor_indice
-
-        if tipo_servicio == "TEC":
-            for i in range(self.cantidad_operadores_tecnico):
-                ocupado = self.TPSTEC[i] != HORIZONTE_VACIO
-                slot_libre = self.AGTEC[i] is None
-                if ocupado and slot_libre and self.TPSTEC[i] < mejor_tps:
-                    mejor_tps = self.TPSTEC[i]
-                    mejor_indice = i
-            
-            if mejor_tps-tiempo_arribo_minutos>30 and self.rng.random() < 0.5:
-                self.PERDIDATIEMPOMAS30TEC += 1
-                return -1        
-            return mejor_indice
-
-        for i in range(self.cantidad_operadores_dev):
-            ocupado = self.TPSDEVS[i] != HORIZONTE_VACIO
-            slot_libre = self.AGDEVS[i] is None
-            if ocupado and slot_libre and self.TPSDEVS[i] < mejor_tps:
-                mejor_tps = self.TPSDEVS[i]
+        vector_tps = self._tps[codigo_pool]
+        vector_ag = self._ag[codigo_pool]
+        for i in range(len(vector_tps)):
+            tps = vector_tps[i]
+            if tps != HORIZONTE_VACIO and vector_ag[i] is None and tps < mejor_tps:
+                mejor_tps = tps
                 mejor_indice = i
-        return mejor_indice
+        return mejor_tps, mejor_indice
 
     # -----------------------------
     # Acciones sobre eventos
@@ -294,20 +1142,23 @@ class SimuladorMesaAyuda:
         - acumula espera
         - programa el fin del servicio en TPS = inicio + duracion (en tiempo laboral)
         """
-        inicio_servicio = normalizar_a_horario_laboral(tiempo_actual_minutos)
+        inicio_servicio = self._normalizar_a_horario_laboral(tiempo_actual_minutos)
 
+        codigo = CODIGO_TIPO.get(trabajo.tipo_servicio, TIPO_DEV)
         espera = inicio_servicio - trabajo.tiempo_arribo_minutos
-        self.suma_espera_por_tipo_min[trabajo.tipo_servicio] += espera
+        self._suma_espera_min[codigo] += espera
+        self._distribucion_espera[codigo].agregar(espera)  # append; el volcado es por lote
 
-        fin_servicio = sumar_minutos_laborales(inicio_servicio, trabajo.duracion_servicio_minutos)
+        fin_servicio = self._sumar_minutos_laborales(inicio_servicio, trabajo.duracion_servicio_minutos)
 
-        if trabajo.tipo_servicio == "IT" and trabajo.tomadoPorDev == False:
-            self.TPSIT[indice_operador] = fin_servicio
-        elif trabajo.tipo_servicio == "TEC" and trabajo.tomadoPorDev == False:
-            self.TPSTEC[indice_operador] = fin_servicio
-        else:
-            self.TPSDEVS[indice_operador] = fin_servicio
+        pool = TIPO_DEV if trabajo.tomadoPorDev else codigo
+        self._tps[pool][indice_operador] = fin_servicio
+        if pool == TIPO_DEV:
             self.TIPO_EN_SERVICIO_DEV[indice_operador] = trabajo.tipo_servicio
+        if self._calendario is not None:
+            # motor calendario: calendario e índices se mantienen juntos
+            self._calendario.programar(pool, indice_operador, fin_servicio)
+            self._agendables[pool].ocupar(indice_operador, fin_servicio)
         if self.debug:
             print(
                 f"[INICIO] {trabajo.tipo_servicio} op={indice_operador} "
@@ -315,20 +1166,22 @@ class SimuladorMesaAyuda:
                 f"inicio={formatear_tiempo(inicio_servicio)} "
                 f"fin={formatear_tiempo(fin_servicio)}"
             )
+        if self.traza is not None:
+            self.traza.inicio(tiempo_actual_minutos, pool, indice_operador, codigo, espera)
 
-    def _agendar_trabajo(self, tipo_servicio: str, indice_operador: int, trabajo: Trabajo):
-        if tipo_servicio == "IT":
-            self.AGIT[indice_operador] = trabajo
-        elif tipo_servicio == "TEC":
-            self.AGTEC[indice_operador] = trabajo
-        else:
-            self.AGDEVS[indice_operador] = trabajo
+    def _agendar_trabajo(self, tipo_servicio: str, indice_operador: int, trabajo: Trabajo, tiempo_minutos: Optional[float] = None):
+        """'tiempo_minutos' es el de la agenda si no es el arribo (trabajo que sale de la cola)."""
+        pool = CODIGO_TIPO.get(tipo_servicio, TIPO_DEV)
+        self._ag[pool][indice_operador] = trabajo
 
         if self.debug:
             print(
                 f"[AGENDA] {tipo_servicio} op={indice_operador} "
                 f"arribo={formatear_tiempo(trabajo.tiempo_arribo_minutos)}"
             )
+        if self.traza is not None:
+            tiempo = trabajo.tiempo_arribo_minutos if tiempo_minutos is None else tiempo_minutos
+            self.traza.agenda(tiempo, pool, indice_operador, CODIGO_TIPO.get(trabajo.tipo_servicio, TIPO_DEV))
 
     def _procesar_arribo(self, tiempo_arribo_minutos: float):
         """
@@ -346,115 +1199,375 @@ class SimuladorMesaAyuda:
             self._iniciar_servicio(tiempo_arribo_minutos, trabajo, indice_libre)
             return
 
+        codigo = CODIGO_TIPO[tipo]
         indice_para_agendar = self._buscar_operador_para_agendar(tipo, tiempo_arribo_minutos)
-        if indice_para_agendar != -1:
+        if indice_para_agendar >= 0:
             self._agendar_trabajo(tipo, indice_para_agendar, trabajo)
             return
 
-        self.perdidos_por_tipo[tipo] += 1
+        # Con cola espera salvo que se haya ido por la espera
+        if self.cola_pendientes and indice_para_agendar != ABANDONO:
+            self._encolar(codigo, trabajo, tiempo_arribo_minutos)
+            return
+        self._perdidos[codigo] += 1
         if self.debug:
             print(f"[PERDIDO] {tipo} arribo={formatear_tiempo(tiempo_arribo_minutos)}")
+        if self.traza is not None:
+            self.traza.perdido(tiempo_arribo_minutos, codigo)
+
+    def _encolar(self, codigo: int, trabajo: Trabajo, tiempo: float):
+        cola = self._pendientes[codigo]
+        self._area_cola[codigo] += len(cola) * (tiempo - self._ultimo_cambio_cola[codigo])
+        self._ultimo_cambio_cola[codigo] = tiempo
+        cola.append(trabajo)
+        if self.debug:
+            print(f"[PENDIENTE] {trabajo.tipo_servicio} arribo={formatear_tiempo(tiempo)} en cola={len(cola)}")
+        if self.traza is not None:
+            self.traza.pendiente(tiempo, codigo)
 
-    def _procesar_pendiente(self, indicePendiente: int, tiempo):
+    def _desencolar(self, codigo: int, tiempo: float) -> Trabajo:
+        cola = self._pendientes[codigo]
+        self._area_cola[codigo] += len(cola) * (tiempo - self._ultimo_cambio_cola[codigo])
+        self._ultimo_cambio_cola[codigo] = tiempo
+        return cola.popleft()
+
+    def _procesar_pendiente(self, tiempo: float, pool: int, indice_operador: int):
         """
-        PENDIENTE:
-        - se sabe el tiempo que tarda la tarea
-        - intenta atender / perder
+        PENDIENTE (cola_pendientes=True), después de una salida del operador:
+        - si quedó libre atiende al primero de la cola de su pool; un DEV sin pendientes
+          DEV toma el IT/TEC que llegó antes (derivado, como en _buscar_operador_libre)
+        - si su slot de agenda quedó vacío agenda al siguiente de su pool
+        Solo mira las cabezas de las colas: O(1) por salida, sin importar el largo.
         """
-        trabajo = self.TrabajoPendiente[indicePendiente]
-
-        tipo = trabajo.tipo_servicio
-        tiempo_arribo_minutos = trabajo.tiempo_arribo_minutos
-
-        indice_libre = self._buscar_operador_libre(trabajo)
-        if indice_libre != -1:
-            self._iniciar_servicio(tiempo_arribo_minutos, trabajo, indice_libre)
-            return
-
-        self.perdidos_por_tipo[tipo] += 1
-        if self.debug:
-            print(f"[PERDIDO] {tipo} arribo={formatear_tiempo(tiempo_arribo_minutos)}")
+        colas = self._pendientes
+        if self._tps[pool][indice_operador] == HORIZONTE_VACIO:
+            codigo = pool
+            if pool == TIPO_DEV and not colas[TIPO_DEV]:
+                cola_it, cola_tec = colas[TIPO_IT], colas[TIPO_TEC]
+                if cola_it and (not cola_tec or cola_it[0].tiempo_arribo_minutos <= cola_tec[0].tiempo_arribo_minutos):
+                    codigo = TIPO_IT
+                elif cola_tec:
+                    codigo = TIPO_TEC
+            if not colas[codigo]:
+                return
+            trabajo = self._desencolar(codigo, tiempo)
+            if codigo != pool:
+                self._derivados_a_dev[codigo] += 1
+                trabajo.tomadoPorDev = True
+            self._iniciar_servicio(tiempo, trabajo, indice_operador)
+
+        if colas[pool] and self._ag[pool][indice_operador] is None:
+            trabajo = self._desencolar(pool, tiempo)
+            self._agendar_trabajo(trabajo.tipo_servicio, indice_operador, trabajo, tiempo)
+
+    @property
+    def pendientes_por_tipo(self) -> Dict[str, int]:
+        return dict(zip(POOLS, map(len, self._pendientes)))
+
+    def _largo_medio_cola(self, tiempo: float) -> Dict[str, float]:
+        """Largo medio de cada cola ponderado por tiempo, desde el inicio de la corrida hasta 'tiempo'."""
+        duracion = tiempo - self._inicio_corrida
+        return {
+            tipo: (self._area_cola[codigo] + len(cola) * (tiempo - self._ultimo_cambio_cola[codigo])) / duracion
+            if duracion > 0 else 0.0
+            for codigo, (tipo, cola) in enumerate(zip(POOLS, self._pendientes))
+        }
 
     def _procesar_salida(self, tiempo_salida_min: float, tipo: str, indice_operador: int):
         """
         SALIDA:
         - operador termina -> TPS = HV
         - si tenía agendado -> lo inicia (no queda libre)
+        - con cola_pendientes -> toma de la cola (ver _procesar_pendiente)
         - si no -> queda libre
         """
+        pool = CODIGO_TIPO.get(tipo, TIPO_DEV)
         tipo_atendido = tipo
-        if(tipo is not None and tipo == "DEV"):
+        if pool == TIPO_DEV:
             tipo_atendido = self.TIPO_EN_SERVICIO_DEV[indice_operador] or "DEV"
             self.TIPO_EN_SERVICIO_DEV[indice_operador] = None
-        self.atendidos_por_tipo[tipo_atendido] += 1
+        codigo_atendido = CODIGO_TIPO[tipo_atendido]
+        self._atendidos[codigo_atendido] += 1
         if self.debug:
             print(f"[FIN] pool={tipo} op={indice_operador} atendio={tipo_atendido} ...")
-
-        if tipo == "IT":
-            self.TPSIT[indice_operador] = HORIZONTE_VACIO
-            trabajo_agendado = self.AGIT[indice_operador]
-            self.AGIT[indice_operador] = None
-            if trabajo_agendado is not None:
-                self._iniciar_servicio(tiempo_salida_min, trabajo_agendado, indice_operador)
-
-        elif tipo == "TEC":
-            self.TPSTEC[indice_operador] = HORIZONTE_VACIO
-            trabajo_agendado = self.AGTEC[indice_operador]
-            self.AGTEC[indice_operador] = None
-            if trabajo_agendado is not None:
-                self._iniciar_servicio(tiempo_salida_min, trabajo_agendado, indice_operador)
-
-        else:  # DEV
-            self.TPSDEVS[indice_operador] = HORIZONTE_VACIO
-            trabajo_agendado = self.AGDEVS[indice_operador]
-            self.AGDEVS[indice_operador] = None
-            if trabajo_agendado is not None:
-                self._iniciar_servicio(tiempo_salida_min, trabajo_agendado, indice_operador)
+        if self.traza is not None:
+            self.traza.fin(tiempo_salida_min, pool, indice_operador, codigo_atendido)
+
+        self._tps[pool][indice_operador] = HORIZONTE_VACIO
+        vector_ag = self._ag[pool]
+        trabajo_agendado = vector_ag[indice_operador]
+        vector_ag[indice_operador] = None
+        if trabajo_agendado is not None:
+            self._iniciar_servicio(tiempo_salida_min, trabajo_agendado, indice_operador)
+        if self.cola_pendientes:
+            self._procesar_pendiente(tiempo_salida_min, pool, indice_operador)
+        if self._libres is not None and self._tps[pool][indice_operador] == HORIZONTE_VACIO:
+            self._libres[pool].liberar(indice_operador)
 
     # -----------------------------
     # Loop principal: próximo evento
     # -----------------------------
-    def correr(self, dias: int) -> ResultadoSimulacion:
+    def correr(self, dias: int, punto_control: Optional[PuntoControl] = None) -> ResultadoSimulacion:
         """
         Simula 'dias' jornadas laborales completas.
         Arribos y servicios se programan en tiempo laboral (saltando la noche).
+        Con 'punto_control' guarda el estado periódicamente (ver reanudar).
         """
         if dias < 1:
             raise ValueError("dias debe ser >= 1")
-        tiempo_inicio_sim = 0 * MINUTOS_POR_DIA + INICIO_TURNO_MIN
-        tiempo_fin_sim = (dias - 1) * MINUTOS_POR_DIA + FIN_TURNO_MIN  # fin del último día
+        tiempo_inicio_sim = self._normalizar_a_horario_laboral(0)
+        tiempo_fin_sim = self._fin_de_simulacion(dias)
 
         T = tiempo_inicio_sim
-
-        # TPLL inicial: se suma interarribo en TIEMPO LABORAL
-        TPLL = sumar_minutos_laborales(T, self._obtener_siguiente_interarribo_minutos())
+        self._inicio_corrida = tiempo_inicio_sim
+        self._ultimo_cambio_cola = [tiempo_inicio_sim] * len(POOLS)
+        self._armar_indices()
+        self._cortes_diarios = [self._acumulados()]
+        self._proximo_corte_dia = MINUTOS_POR_DIA
+        # Si el día 0 no es laboral T arranca más tarde: los días previos quedan vacíos
+        self._cerrar_dias(T)
+
+        # TPLL inicial: se suma interarribo en TIEMPO LABORAL (o el primero de la fuente de arribos)
+        if self._fuente_arribos is None:
+            TPLL = self._sumar_minutos_laborales(T, self._obtener_siguiente_interarribo_minutos())
+        else:
+            TPLL = self._fuente_arribos.siguiente_arribo()
 
         if self.debug:
             print(f"Inicio sim: {formatear_tiempo(T)} | Primer TPLL: {formatear_tiempo(TPLL)}")
 
+        return self._avanzar(T, TPLL, tiempo_fin_sim, 0, punto_control)
+
+    def continuar(self, dias_extra: int, punto_control: Optional[PuntoControl] = None) -> ResultadoSimulacion:
+        """
+        Extiende la última corrida 'dias_extra' jornadas sin repetir las anteriores:
+        sigue desde el T, TPLL y estado con que terminó. correr(30) + continuar(30)
+        da lo mismo que correr(60); el resultado es el acumulado desde el día 0.
+        """
+        if dias_extra < 1:
+            raise ValueError("dias_extra debe ser >= 1")
+        if self._reloj is None:
+            raise ValueError("no hay corrida para continuar: llamar antes a correr()")
+        T, TPLL, _ = self._reloj
+        return self._avanzar(T, TPLL, self._fin_de_simulacion(self.dias_simulados + dias_extra), self.eventos_procesados, punto_control)
+
+    def _fin_de_simulacion(self, dias: int) -> float:
+        """Fin del último día (dias - 1): su cierre, o su medianoche si no es laboral."""
+        if self.calendario is None:
+            return (dias - 1) * MINUTOS_POR_DIA + FIN_TURNO_MIN
+        self.calendario.preparar(dias + MARGEN_DIAS_CALENDARIO)
+        return self.calendario.fin_de_dia(dias - 1)
+
+    @property
+    def dias_simulados(self) -> int:
+        if self._reloj is None:
+            return 0
+        return int(self._reloj[2] // MINUTOS_POR_DIA) + 1
+
+    def reanudar(self, ruta: str, punto_control: Optional[PuntoControl] = None) -> ResultadoSimulacion:
+        """
+        Carga un punto de control guardado por correr() y sigue hasta el mismo horizonte.
+        El simulador tiene que estar construido con la misma configuración (operadores,
+        muestreadores, semilla, motor); el resultado es idéntico al de la corrida sin cortes.
+        """
+        estado = cargar_estado(ruta)
+        if estado["firma"] != self._firma():
+            raise ValueError("el punto de control es de un simulador con otra configuración")
+
+        self._tps = estado["tps"]
+        self._ag = estado["ag"]
+        self.TIPO_EN_SERVICIO_DEV = estado["tipo_en_servicio_dev"]
+        self._pendientes = estado["pendientes"]
+        self._area_cola = estado["area_cola"]
+        self._ultimo_cambio_cola = estado["ultimo_cambio_cola"]
+        self._inicio_corrida = estado["inicio_corrida"]
+        self._derivados_a_dev = estado["derivados_a_dev"]
+        self._perdidos_espera_mas_30 = estado["perdidos_espera_mas_30"]
+        self._perdidos = estado["perdidos"]
+        self._atendidos = estado["atendidos"]
+        self._suma_espera_min = estado["suma_espera_min"]
+        self._cortes_diarios = estado["cortes_diarios"]
+        self._proximo_corte_dia = estado["proximo_corte_dia"]
+        self._distribucion_espera = estado["distribucion_espera"]
+        self.registrar_esperas_desde_dia = estado["registrar_esperas_desde_dia"]
+        self.rng.setstate(estado["rng"])
+        for nombre, estado_cursor in estado["cursores"].items():
+            self._cursores[nombre].restaurar(estado_cursor)
+        if self._fuente_arribos is not None:
+            self._fuente_arribos.restaurar(estado["fuente_arribos"])
+
+        self._armar_indices()
+        return self._avanzar(estado["T"], estado["TPLL"], estado["tiempo_fin_sim"], estado["eventos"], punto_control)
+
+    def _firma(self) -> tuple:
+        return (
+            tuple(len(tps) for tps in self._tps), self.seed, self.motor, self.antitetico, tuple(sorted(self._cursores)),
+            self.calendario, self.cola_pendientes, isinstance(self._fuente_arribos, ReproduccionArribos), self.tasa_arribos,
+        )
+
+    def _armar_indices(self):
+        if self.motor == MOTOR_CALENDARIO:
+            # Se arman con los vectores vigentes (pueden haberse reemplazado desde afuera)
+            self._calendario = CalendarioSalidas(self._tps)
+            self._libres = [IndiceOperadoresLibres(tps, ag) for tps, ag in zip(self._tps, self._ag)]
+            self._agendables = [IndiceAgendables(tps, ag) for tps, ag in zip(self._tps, self._ag)]
+
+    def _guardar_punto_control(self, ruta: str, T: float, TPLL: float, tiempo_fin_sim: float, eventos: int):
+        if self.traza is not None:
+            self.traza.vaciar()  # la traza en disco queda al día con el estado guardado
+        guardar_estado(ruta, {
+            "version": VERSION_PUNTO_CONTROL,
+            "firma": self._firma(),
+            "T": T,
+            "TPLL": TPLL,
+            "tiempo_fin_sim": tiempo_fin_sim,
+            "eventos": eventos,
+            "tps": self._tps,
+            "ag": self._ag,
+            "tipo_en_servicio_dev": self.TIPO_EN_SERVICIO_DEV,
+            "pendientes": self._pendientes,
+            "area_cola": self._area_cola,
+            "ultimo_cambio_cola": self._ultimo_cambio_cola,
+            "inicio_corrida": self._inicio_corrida,
+            "derivados_a_dev": self._derivados_a_dev,
+            "perdidos_espera_mas_30": self._perdidos_espera_mas_30,
+            "perdidos": self._perdidos,
+            "atendidos": self._atendidos,
+            "suma_espera_min": self._suma_espera_min,
+            "cortes_diarios": self._cortes_diarios,
+            "proximo_corte_dia": self._proximo_corte_dia,
+            "distribucion_espera": self._distribucion_espera,
+            "registrar_esperas_desde_dia": self.registrar_esperas_desde_dia,
+            "rng": self.rng.getstate(),
+            "cursores": {nombre: cursor.estado() for nombre, cursor in self._cursores.items()},
+            "fuente_arribos": self._fuente_arribos.estado() if self._fuente_arribos is not None else None,
+        })
+
+    @staticmethod
+    def _proximos_controles(punto_control: Optional[PuntoControl], T: float, eventos: int) -> Tuple[float, float]:
+        """(evento, tiempo) en que toca el próximo guardado; inf si no corresponde."""
+        if punto_control is None:
+            return math.inf, math.inf
+        por_eventos = eventos + punto_control.cada_eventos if punto_control.cada_eventos else math.inf
+        por_tiempo = math.inf
+        if punto_control.cada_dias:
+            dia_control = (int(T // MINUTOS_POR_DIA) // punto_control.cada_dias + 1) * punto_control.cada_dias
+            por_tiempo = dia_control * MINUTOS_POR_DIA
+        return por_eventos, por_tiempo
+
+    def _avanzar(
+        self,
+        T: float,
+        TPLL: float,
+        tiempo_fin_sim: float,
+        eventos: int,
+        punto_control: Optional[PuntoControl],
+    ) -> ResultadoSimulacion:
+        control_eventos, control_tiempo = self._proximos_controles(punto_control, T, eventos)
+        corte_dia = self._proximo_corte_dia
+        fuente_arribos = self._fuente_arribos
+
         while T < tiempo_fin_sim:
+            if eventos >= control_eventos or T >= control_tiempo:
+                self._guardar_punto_control(punto_control.ruta, T, TPLL, tiempo_fin_sim, eventos)
+                control_eventos, control_tiempo = self._proximos_controles(punto_control, T, eventos)
+
+            eventos += 1
             min_trabajo_programado, tipo_salida, idx_operador = self._elegir_siguiente_salida()
 
             # Decisión de cátedra:
             # Si TPLL >= minTiempoTrabajoProgramado -> SALIDA
-            if min_trabajo_programado != HORIZONTE_VACIO and TPLL >= min_trabajo_programado:
-                T = min_trabajo_programado
+            es_salida = min_trabajo_programado != HORIZONTE_VACIO and TPLL >= min_trabajo_programado
+            T = min_trabajo_programado if es_salida else TPLL
+            if T == HORIZONTE_VACIO:
+                # Historial agotado y sin salidas: no queda nada por pasar hasta el fin
+                T = tiempo_fin_sim
+                self._cerrar_dias(T + MINUTOS_POR_DIA - T % MINUTOS_POR_DIA)
+                break
+            if T >= corte_dia:
+                corte_dia = self._cerrar_dias(T)
+
+            if es_salida:
                 self._procesar_salida(T, tipo_salida, idx_operador)
             else:
-                T = TPLL
                 self._procesar_arribo(T)
 
                 # Programar próximo arribo en tiempo laboral
-                TPLL = sumar_minutos_laborales(T, self._obtener_siguiente_interarribo_minutos())
+                if fuente_arribos is None:
+                    TPLL = self._sumar_minutos_laborales(T, self._obtener_siguiente_interarribo_minutos())
+                else:
+                    TPLL = fuente_arribos.siguiente_arribo()
+
+        self.eventos_procesados = eventos
+        self._reloj = (T, TPLL, tiempo_fin_sim)
+        if self.traza is not None:
+            self.traza.vaciar()
 
         espera_promedio = {
-            tipo: (self.suma_espera_por_tipo_min[tipo] / self.atendidos_por_tipo[tipo])
-            if self.atendidos_por_tipo[tipo] > 0 else 0.0
-            for tipo in ["IT", "TEC", "DEV"]
+            tipo: (self._suma_espera_min[codigo] / self._atendidos[codigo])
+            if self._atendidos[codigo] > 0 else 0.0
+            for codigo, tipo in enumerate(POOLS)
         }
 
         return ResultadoSimulacion(
             perdidos_por_tipo=self.perdidos_por_tipo,
             atendidos_por_tipo=self.atendidos_por_tipo,
             espera_promedio_por_tipo_min=espera_promedio,
+            distribucion_espera_por_tipo=self._distribuciones(),
+            largo_medio_cola_por_tipo=self._largo_medio_cola(T) if self.cola_pendientes else None,
+            instrumentacion=self.instrumentacion,
         )
+
+
+# ------------------------------------------------------------
+# Configuración para construir réplicas
+# ------------------------------------------------------------
+@dataclass
+class ConfiguracionSimulador:
+    """
+    Todo lo necesario para construir un SimuladorMesaAyuda salvo la semilla.
+    Para correr en otros procesos los muestreadores deben poder serializarse
+    con pickle (funciones de módulo o los de muestreadores.py, no lambdas).
+    """
+    cantidad_operadores_it: int
+    cantidad_operadores_tecnico: int
+    cantidad_operadores_dev: int
+    muestrear_interarribo_min: Callable[[random.Random], float]
+    muestrear_duracion_servicio_min: Callable[[str, random.Random], float]
+    dias: int
+    motor: str = MOTOR_CALENDARIO  # mismos resultados que el barrido, más rápido
+    muestrear_tipo_servicio: Optional[Callable[[random.Random], str]] = None
+    dias_calentamiento: int = 0  # días iniciales que no entran en el resultado (ver estimar_calentamiento)
+    calendario: Optional[CalendarioLaboral] = None  # None: 9-18 todos los días
+    cola_pendientes: bool = False  # True: lo que no entra espera en cola FIFO en vez de perderse
+    tasa_arribos: Optional[TasaArribosPorHora] = None  # reemplaza al interarribo (arribos no homogéneos)
+
+    def __post_init__(self):
+        # Tablas del calendario armadas antes de viajar por pickle a los workers
+        if self.calendario is not None:
+            self.calendario.preparar(self.dias + MARGEN_DIAS_CALENDARIO)
+
+    def construir(self, seed: int, antitetico: bool = False) -> SimuladorMesaAyuda:
+        return SimuladorMesaAyuda(
+            cantidad_operadores_it=self.cantidad_operadores_it,
+            cantidad_operadores_tecnico=self.cantidad_operadores_tecnico,
+            cantidad_operadores_dev=self.cantidad_operadores_dev,
+            muestrear_interarribo_min=self.muestrear_interarribo_min,
+            muestrear_duracion_servicio_min=self.muestrear_duracion_servicio_min,
+            seed=seed,
+            motor=self.motor,
+            muestrear_tipo_servicio=self.muestrear_tipo_servicio,
+            antitetico=antitetico,
+            calendario=self.calendario,
+            cola_pendientes=self.cola_pendientes,
+            tasa_arribos=self.tasa_arribos,
+        )
+
+    def correr(self, seed: int, antitetico: bool = False) -> ResultadoSimulacion:
+        """Una réplica completa: construye, corre 'dias' y descarta el calentamiento si hay."""
+        simulador = self.construir(seed, antitetico)
+        simulador.registrar_esperas_desde_dia = self.dias_calentamiento
+        resultado = simulador.correr(self.dias)
+        if self.dias_calentamiento:
+            return simulador.resultado_estacionario(self.dias_calentamiento)
+        return resultado
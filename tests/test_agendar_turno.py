@@ -1,5 +1,5 @@
 import pytest
-from simulacion import HORIZONTE_VACIO, SimuladorMesaAyuda
+from simulacion import ABANDONO, HORIZONTE_VACIO, IndiceAgendables, SimuladorMesaAyuda
 
 def interarribo_dummy(_rng) -> float:
     return 1.0
@@ -84,6 +84,7 @@ def test_para_agendar_devuelve_menos_uno_si_todos_estan_libres_hv(monkeypatch):
         tec=[HORIZONTE_VACIO],
         dev=[HORIZONTE_VACIO, HORIZONTE_VACIO],
     )
+    monkeypatch.setattr(sim.rng, "random", lambda: 0.5)  # sin abandono: solo falta candidato
     assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == -1
     assert sim._buscar_operador_para_agendar("TEC", tiempo_arribo_minutos=0.0) == -1
     assert sim._buscar_operador_para_agendar("DEV", tiempo_arribo_minutos=0.0) == -1
@@ -98,6 +99,7 @@ def test_para_agendar_devuelve_menos_uno_si_todos_tienen_slot_ocupado(monkeypatc
     sim.AGIT = ["x", "x"]
     sim.AGTEC = ["x"]
     sim.AGDEVS = ["x", "x"]
+    monkeypatch.setattr(sim.rng, "random", lambda: 0.5)  # sin abandono: solo falta candidato
 
     assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == -1
     assert sim._buscar_operador_para_agendar("TEC", tiempo_arribo_minutos=0.0) == -1
@@ -126,7 +128,7 @@ def test_para_agendar_it_puede_perder_si_espera_mayor_30_y_random_menor_0_5(monk
     )
     # tiempo_arribo=0 => espera=60 (>30) => aplica regla
     monkeypatch.setattr(sim.rng, "random", lambda: 0.49)  # < 0.5 => pierde
-    assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == -1
+    assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == ABANDONO
     assert sim.PERDIDATIEMPOMAS30IT == 1
 
 
@@ -149,5 +151,59 @@ def test_para_agendar_tec_puede_perder_si_espera_mayor_30_y_random_menor_0_5(mon
     )
     # tiempo_arribo=0 => espera=40 (>30)
     monkeypatch.setattr(sim.rng, "random", lambda: 0.1)
-    assert sim._buscar_operador_para_agendar("TEC", tiempo_arribo_minutos=0.0) == -1
+    assert sim._buscar_operador_para_agendar("TEC", tiempo_arribo_minutos=0.0) == ABANDONO
     assert sim.PERDIDATIEMPOMAS30TEC == 1
+
+
+# -------------------------
+# Índice de agendables (motor calendario)
+# -------------------------
+
+def test_indice_agendables_elige_menor_tps_y_descarta_invalidos():
+    tps = [100.0, 40.0, HORIZONTE_VACIO, 40.0]
+    ag = [None, None, None, None]
+    indice = IndiceAgendables(tps, ag)
+    assert indice.mejor() == (40.0, 1)   # empate => menor índice
+
+    ag[1] = "agendado"
+    assert indice.mejor() == (40.0, 3)
+
+    tps[3] = HORIZONTE_VACIO             # salió
+    ag[3] = None
+    assert indice.mejor() == (100.0, 0)
+
+    tps[2] = 20.0                        # empieza servicio
+    indice.ocupar(2, 20.0)
+    assert indice.mejor() == (20.0, 2)
+
+
+def _con_indices(sim):
+    sim._agendables = [
+        IndiceAgendables(sim.TPSIT, sim.AGIT),
+        IndiceAgendables(sim.TPSTEC, sim.AGTEC),
+        IndiceAgendables(sim.TPSDEVS, sim.AGDEVS),
+    ]
+    return sim
+
+
+def test_para_agendar_indexado_sortea_50_igual_que_el_barrido(monkeypatch):
+    sim = _con_indices(sim_crear_simulador_dummy(sit=[100.0, 60.0], tec=[], dev=[]))
+    monkeypatch.setattr(sim.rng, "random", lambda: 0.49)
+    assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == ABANDONO
+    assert sim.PERDIDATIEMPOMAS30IT == 1
+
+    monkeypatch.setattr(sim.rng, "random", lambda: 0.5)
+    assert sim._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0) == 1
+
+
+def test_para_agendar_indexado_sin_candidatos_tambien_consume_rng():
+    # Sin candidatos mejor_tps = HV => el barrido igual sortea; el índice también
+    barrido = sim_crear_simulador_dummy(sit=[HORIZONTE_VACIO], tec=[HORIZONTE_VACIO], dev=[])
+    indexado = _con_indices(sim_crear_simulador_dummy(sit=[HORIZONTE_VACIO], tec=[HORIZONTE_VACIO], dev=[]))
+    for _ in range(20):
+        assert (
+            indexado._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0)
+            == barrido._buscar_operador_para_agendar("IT", tiempo_arribo_minutos=0.0)
+        )
+    assert indexado.PERDIDATIEMPOMAS30IT == barrido.PERDIDATIEMPOMAS30IT
+    assert indexado.rng.getstate() == barrido.rng.getstate()
@@ -0,0 +1,103 @@
+import analitico
+import pytest
+from analitico import ParametrosAnaliticos, estimar_dotacion, estimar_dotaciones, podar_dotaciones
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from replicacion import correr_replicaciones
+from simulacion import POOLS, TURNOS_LUNES_A_VIERNES, CalendarioLaboral, ConfiguracionSimulador
+
+MEDIAS = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+
+
+def crear_config(dotacion=(3, 3, 3), media_interarribo=4.0, **cambios) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        *dotacion,
+        muestrear_interarribo_min=InterarriboExponencial(media_interarribo),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo(MEDIAS),
+        muestrear_tipo_servicio=TipoServicioCategorico(),
+        dias=30,
+        **cambios,
+    )
+
+
+def test_grilla_igual_a_una_por_una():
+    parametros = ParametrosAnaliticos(2.0, MEDIAS)
+    dotaciones = [(0, 0, 0), (0, 1, 1), (1, 0, 0), (5, 2, 0), (3, 3, 3), (12, 4, 7), (40, 40, 40)]
+    tabla = estimar_dotaciones(parametros, dotaciones)
+    assert len(tabla) == len(dotaciones)
+    for i, dotacion in enumerate(dotaciones):
+        esperado, obtenido = estimar_dotacion(parametros, dotacion), tabla.fila(i)
+        assert obtenido.dotacion == dotacion
+        for campo in ("perdidos_por_dia", "atendidos_por_dia", "derivados_a_dev_por_dia", "espera_promedio_min"):
+            assert getattr(obtenido, campo) == pytest.approx(getattr(esperado, campo), rel=1e-9, abs=1e-9)
+
+
+def test_casos_limite():
+    parametros = ParametrosAnaliticos(2.0, MEDIAS)
+    vacio = estimar_dotacion(parametros, (0, 0, 0))
+    assert vacio.perdidos_por_dia == pytest.approx(vacio.arribos_por_dia)
+    assert vacio.tasa_perdida == pytest.approx(1.0)
+
+    # Sin operadores IT todo IT lo atiende DEV (derivado) o se pierde
+    sin_it = estimar_dotacion(parametros, (0, 2, 4))
+    assert sin_it.atendidos_por_dia["IT"] == pytest.approx(sin_it.derivados_a_dev_por_dia["IT"])
+    assert sin_it.espera_promedio_min["IT"] == 0.0
+
+
+def test_mas_operadores_menos_perdida():
+    parametros = ParametrosAnaliticos(2.0, MEDIAS)
+    tasas = estimar_dotaciones(parametros, [(n, n, n) for n in range(1, 15)]).tasa_perdida.tolist()
+    assert tasas == sorted(tasas, reverse=True)
+    assert all(a + p == pytest.approx(arribos) for a, p, arribos in zip(
+        estimar_dotacion(parametros, (4, 2, 1)).atendidos_por_dia.values(),
+        estimar_dotacion(parametros, (4, 2, 1)).perdidos_por_dia.values(),
+        estimar_dotacion(parametros, (4, 2, 1)).arribos_por_dia.values(),
+    ))
+
+
+def test_cerca_de_la_simulacion():
+    config = crear_config()
+    estimacion = estimar_dotacion(ParametrosAnaliticos.desde_config(config), (3, 3, 3))
+    lote = correr_replicaciones(config, replicaciones=8, workers=1)
+    for tipo in POOLS:
+        simulado = lote.perdidos_por_tipo[tipo].media / config.dias
+        assert estimacion.perdidos_por_dia[tipo] == pytest.approx(simulado, rel=0.3, abs=0.5)
+    assert estimacion.espera_promedio_min["DEV"] == pytest.approx(lote.espera_promedio_por_tipo_min["DEV"].media, rel=0.3)
+
+
+def test_podar_dotaciones():
+    config = crear_config(media_interarribo=2.0)
+    grilla = [(i, j, k) for i in range(1, 13) for j in range(1, 13) for k in range(1, 13)]
+    podadas = podar_dotaciones(config, grilla, perdida_maxima=0.02, holgura=0.0)
+    assert 0 < len(podadas) < len(grilla)
+    assert [sum(d) for d in podadas] == sorted(sum(d) for d in podadas)
+
+    parametros = ParametrosAnaliticos.desde_config(config)
+    for dotacion in grilla:
+        cumple = estimar_dotacion(parametros, dotacion).tasa_perdida <= 0.02
+        assert cumple == (dotacion in podadas)
+
+    assert len(podar_dotaciones(config, grilla, perdida_maxima=0.02, holgura=1.0)) > len(podadas)
+    con_espera = podar_dotaciones(config, grilla, perdida_maxima=0.02, espera_maxima_min={"DEV": 300.0}, holgura=0.0)
+    assert 0 < len(con_espera) < len(podadas) and set(con_espera) <= set(podadas)
+    assert podar_dotaciones(config, grilla, perdida_maxima=0.02, holgura=0.0, maximo=3) == podadas[:3]
+
+
+def test_podar_sin_numpy(monkeypatch):
+    config = crear_config(media_interarribo=2.0)
+    grilla = [(i, j, k) for i in range(1, 6) for j in range(1, 6) for k in range(1, 6)]
+    con_numpy = podar_dotaciones(config, grilla, perdida_maxima=0.05)
+    monkeypatch.setattr(analitico, "np", None)
+    assert podar_dotaciones(config, grilla, perdida_maxima=0.05) == con_numpy
+    with pytest.raises(ImportError):
+        estimar_dotaciones(ParametrosAnaliticos.desde_config(config), grilla)
+
+
+def test_configuraciones_fuera_del_modelo():
+    with pytest.raises(ValueError):
+        ParametrosAnaliticos.desde_config(crear_config(calendario=CalendarioLaboral(TURNOS_LUNES_A_VIERNES)))
+    with pytest.raises(ValueError):
+        ParametrosAnaliticos.desde_config(crear_config(cola_pendientes=True))
+    with pytest.raises(ValueError):
+        ParametrosAnaliticos.desde_config(
+            ConfiguracionSimulador(1, 1, 1, lambda rng: rng.expovariate(0.25), DuracionExponencialPorTipo(MEDIAS), dias=1)
+        )
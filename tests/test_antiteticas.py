@@ -0,0 +1,74 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import muestreadores
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import ReduccionVarianza, correr_pares_antiteticos
+from simulacion import ConfiguracionSimulador, RandomAntitetico
+
+
+def crear_config(dias=10) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=4.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=dias,
+    )
+
+
+def test_random_antitetico_devuelve_uno_menos_u():
+    base, anti = random.Random(9), RandomAntitetico(9)
+    for _ in range(100):
+        assert anti.random() == pytest.approx(1.0 - base.random())
+    base, anti = random.Random(9), RandomAntitetico(9)
+    x, y = base.expovariate(1.0), anti.expovariate(1.0)
+    assert math.exp(-x) + math.exp(-y) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_bloques_antiteticos_con_y_sin_numpy(monkeypatch, con_numpy):
+    if con_numpy and muestreadores.np is None:
+        pytest.skip("NumPy no disponible")
+    if not con_numpy:
+        monkeypatch.setattr(muestreadores, "np", None)
+    muestreador = InterarriboExponencial(4.0)
+    normal = muestreador.muestrear_bloque(random.Random("s"), 50)
+    anti = muestreador.muestrear_bloque(RandomAntitetico("s"), 50)
+    for x, y in zip(normal, anti):
+        assert math.exp(-x / 4.0) + math.exp(-y / 4.0) == pytest.approx(1.0)
+
+
+def test_corrida_antitetica_es_distinta_y_reproducible():
+    config = crear_config(dias=3)
+    normal = config.construir(5).correr(config.dias)
+    anti = config.construir(5, antitetico=True).correr(config.dias)
+    assert anti != normal
+    assert anti == config.construir(5, antitetico=True).correr(config.dias)
+
+
+def test_pares_reportan_ic_por_par_y_reduccion():
+    res = correr_pares_antiteticos(crear_config(), pares=20, workers=1, semilla_maestra=1)
+    assert res.replicaciones == 40
+    ic = res.perdidos_por_tipo["IT"]
+    assert ic.n == 20
+    assert ic.media == pytest.approx(sum((a.perdidos_por_tipo["IT"] + b.perdidos_por_tipo["IT"]) / 2 for a, b in res.pares) / 20)
+    # con el tipo 70/20/10 de cátedra, más arribos ~ más pérdidas: correlación negativa clara
+    assert res.reduccion_varianza[("perdidos_por_tipo", "IT")].reduccion > 0.2
+
+
+def test_pares_no_dependen_de_workers():
+    config = crear_config(dias=3)
+    assert correr_pares_antiteticos(config, 4, workers=1).pares == correr_pares_antiteticos(config, 4, workers=2).pares
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert correr_pares_antiteticos(config, 4, workers=2, pool=pool).pares == correr_pares_antiteticos(config, 4, workers=1).pares
+
+
+def test_reduccion_varianza_bordes():
+    assert ReduccionVarianza(4.0, 1.0).reduccion == pytest.approx(0.75)
+    assert ReduccionVarianza(4.0, 1.0).factor_replicaciones == pytest.approx(4.0)
+    assert ReduccionVarianza(0.0, 0.0).factor_replicaciones == 1.0
+    with pytest.raises(ValueError):
+        correr_pares_antiteticos(crear_config(), pares=1)
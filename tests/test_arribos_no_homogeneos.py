@@ -0,0 +1,132 @@
+import random
+
+import muestreadores
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TasaArribosPorHora
+from simulacion import (
+    MINUTOS_POR_DIA,
+    MOTOR_BARRIDO,
+    MOTOR_CALENDARIO,
+    TURNOS_LUNES_A_VIERNES,
+    CalendarioLaboral,
+    ConfiguracionSimulador,
+    PuntoControl,
+    SimuladorMesaAyuda,
+)
+
+# Pico a la mañana, valle al mediodía, nada fuera de 9-18
+PERFIL_DIA = [0.0] * 9 + [30.0, 30.0, 20.0, 8.0, 8.0, 15.0, 15.0, 10.0, 5.0] + [0.0] * 6
+
+
+def crear_tasa(**extra) -> TasaArribosPorHora:
+    return TasaArribosPorHora.por_dia(PERFIL_DIA, dias_semana=range(5), **extra)
+
+
+def crear_simulador(seed=2, motor=MOTOR_CALENDARIO, **extra) -> SimuladorMesaAyuda:
+    extra.setdefault("tasa_arribos", crear_tasa())
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=None,
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        seed=seed,
+        motor=motor,
+        **extra,
+    )
+
+
+def test_intensidad_acumulada_e_inversa():
+    tasa = crear_tasa(dia_semana_inicial=3)  # el Día 0 es jueves
+    assert tasa.arribos_por_semana == pytest.approx(5 * sum(PERFIL_DIA))
+    assert tasa.intensidad_acumulada(0.0) == 0.0
+    assert tasa.intensidad_acumulada(9 * 60 + 30) == pytest.approx(15.0)
+    # Sábado y domingo no suman
+    assert tasa.intensidad_acumulada(4 * MINUTOS_POR_DIA) == pytest.approx(tasa.intensidad_acumulada(2 * MINUTOS_POR_DIA))
+
+    for tiempo in (570.0, 1000.0, 5 * MINUTOS_POR_DIA + 700.0, 40 * MINUTOS_POR_DIA + 1000.0):
+        [siguiente] = tasa.tiempos_desde(tiempo, [1e-9])
+        assert siguiente == pytest.approx(tiempo, abs=1e-6)
+
+
+def test_vectorizado_igual_a_python(monkeypatch):
+    tasa = crear_tasa(dia_semana_inicial=6)
+    exponenciales = [random.Random(1).expovariate(1.0) for _ in range(5000)]
+    con_numpy = tasa.tiempos_desde(123.0, exponenciales)
+    monkeypatch.setattr(muestreadores, "np", None)
+    assert tasa.tiempos_desde(123.0, exponenciales) == pytest.approx(con_numpy, rel=1e-9)
+    assert con_numpy == sorted(con_numpy)
+
+
+def test_arribos_por_hora_siguen_la_tasa():
+    tasa = crear_tasa()
+    rng = random.Random(5)
+    tiempos = tasa.tiempos_desde(0.0, tasa.exponenciales_bloque(rng, 200_000))
+    semanas = tiempos[-1] // (7 * MINUTOS_POR_DIA)
+    conteos = [0] * (7 * 24)
+    for tiempo in tiempos:
+        if tiempo < semanas * 7 * MINUTOS_POR_DIA:
+            conteos[int(tiempo % (7 * MINUTOS_POR_DIA) // 60)] += 1
+
+    for hora, conteo in enumerate(conteos):
+        esperado = semanas * tasa.tasas_por_hora[hora]
+        if esperado == 0:
+            assert conteo == 0
+        else:
+            assert abs(conteo - esperado) < 5 * esperado ** 0.5
+
+
+def test_tasas_invalidas():
+    with pytest.raises(ValueError):
+        TasaArribosPorHora((1.0,) * 24)
+    with pytest.raises(ValueError):
+        TasaArribosPorHora.por_dia([0.0] * 24)
+    with pytest.raises(ValueError):
+        TasaArribosPorHora.por_dia([-1.0] + [1.0] * 23)
+    with pytest.raises(ValueError):
+        crear_simulador(historial_arribos=[(600.0, "IT", 5.0)])
+    with pytest.raises(ValueError):
+        crear_simulador(calendario=CalendarioLaboral(TURNOS_LUNES_A_VIERNES, dia_semana_inicial=2))
+
+
+def test_corrida_con_tasa_por_hora():
+    sim = crear_simulador()
+    res = sim.correr(dias=14)
+    arribos = sum(res.atendidos_por_tipo.values()) + sum(res.perdidos_por_tipo.values())
+    assert arribos == pytest.approx(2 * crear_tasa().arribos_por_semana, rel=0.1)
+    # Sábados y domingos no llega nada nuevo
+    fines_de_semana = [dia for i, dia in enumerate(sim.metricas_diarias()) if i % 7 >= 5]
+    assert all(sum(dia.perdidos_por_tipo.values()) == 0 for dia in fines_de_semana)
+
+    assert crear_simulador().correr(dias=14) == res
+
+
+@pytest.mark.parametrize("seed", [1, 9])
+def test_motor_calendario_igual_al_barrido(seed):
+    assert crear_simulador(seed, MOTOR_CALENDARIO).correr(dias=10) == crear_simulador(seed, MOTOR_BARRIDO).correr(dias=10)
+
+
+def test_continuar_y_reanudar(tmp_path):
+    esperado = crear_simulador().correr(dias=15)
+
+    incremental = crear_simulador()
+    incremental.correr(dias=6)
+    assert incremental.continuar(9) == esperado
+
+    ruta = str(tmp_path / "tasa.ckpt")
+    crear_simulador().correr(dias=15, punto_control=PuntoControl(ruta, cada_dias=4))
+    assert crear_simulador().reanudar(ruta) == esperado
+
+
+def test_desde_la_configuracion():
+    config = ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(4.0),  # ignorado con tasa_arribos
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=7,
+        calendario=CalendarioLaboral(TURNOS_LUNES_A_VIERNES),
+        tasa_arribos=crear_tasa(),
+    )
+    assert config.correr(3) == crear_simulador(3, calendario=config.calendario).correr(dias=7)
@@ -1,4 +1,4 @@
-from simulacion import HORIZONTE_VACIO, SimuladorMesaAyuda, Trabajo
+from simulacion import HORIZONTE_VACIO, IndiceOperadoresLibres, SimuladorMesaAyuda, Trabajo
 import random
 
 def interarribo_dummy(_rng) -> float:
@@ -78,4 +78,43 @@ def test_buscar_operador_libre_estado_agendados():
     indice_dev = sim._buscar_operador_libre(trabajo)
     assert indice_it == -1
     assert indice_tec == -1
-    assert indice_dev == -1   
+    assert indice_dev == -1
+
+
+def test_indice_libres_devuelve_menor_indice_libre_y_descarta_ocupados():
+    tps = [HORIZONTE_VACIO, 30.0, HORIZONTE_VACIO, HORIZONTE_VACIO]
+    ag = [None, None, "agendado", None]
+    indice = IndiceOperadoresLibres(tps, ag)
+    assert indice.primero() == 0
+
+    tps[0] = 40.0                 # se ocupa: queda viejo en el heap
+    assert indice.primero() == 3
+
+    tps[1] = HORIZONTE_VACIO      # sale sin agenda
+    indice.liberar(1)
+    assert indice.primero() == 1
+    indice.liberar(1)             # no duplica
+    assert indice.heap.count(1) == 1
+
+
+def test_buscar_operador_libre_indexado_usa_dev_y_cuenta_derivaciones():
+    sim = sim_crear_simulador_dummy(
+        sit=[100.0],
+        tec=[20.0],
+        dev=[150.0, HORIZONTE_VACIO, HORIZONTE_VACIO],
+    )
+    sim.AGIT, sim.AGTEC, sim.AGDEVS = [None], [None], [None, None, None]
+    sim._libres = [
+        IndiceOperadoresLibres(sim.TPSIT, sim.AGIT),
+        IndiceOperadoresLibres(sim.TPSTEC, sim.AGTEC),
+        IndiceOperadoresLibres(sim.TPSDEVS, sim.AGDEVS),
+    ]
+    trabajo_it = Trabajo(tiempo_arribo_minutos=0.0, tipo_servicio='IT', duracion_servicio_minutos=10.0)
+    assert sim._buscar_operador_libre(trabajo_it) == 1
+    assert trabajo_it.tomadoPorDev
+    assert sim.DEVATENCIONIT == 1
+
+    sim.TPSDEVS[1] = 60.0
+    trabajo_tec = Trabajo(tiempo_arribo_minutos=0.0, tipo_servicio='TEC', duracion_servicio_minutos=10.0)
+    assert sim._buscar_operador_libre(trabajo_tec) == 2
+    assert sim.DEVATENCIONTEC == 1
@@ -0,0 +1,131 @@
+import pickle
+from dataclasses import replace
+
+import pytest
+from cache_resultados import CacheResultados, clave_resultado, huella_muestreador
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import correr_replicaciones
+from simulacion import TURNOS_LUNES_A_VIERNES, CalendarioLaboral, ConfiguracionSimulador
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 4.0)
+
+def interarribo_mas_lento(rng) -> float:
+    return rng.expovariate(1 / 5.0)
+
+
+def crear_config(dias=3, media_interarribo=4.0) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=media_interarribo),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=dias,
+    )
+
+
+def test_clave_estable_y_sensible_a_la_configuracion():
+    base = clave_resultado(crear_config(), 1)
+    assert clave_resultado(crear_config(), 1) == base
+    assert clave_resultado(crear_config(), 2) != base
+    assert clave_resultado(crear_config(), 1, antitetico=True) != base
+    assert clave_resultado(crear_config(dias=4), 1) != base
+    assert clave_resultado(crear_config(media_interarribo=4.5), 1) != base
+    assert clave_resultado(replace(crear_config(), calendario=CalendarioLaboral(TURNOS_LUNES_A_VIERNES)), 1) != base
+
+
+def test_huella_de_funciones_por_codigo():
+    assert huella_muestreador(interarribo_exponencial) == huella_muestreador(interarribo_exponencial)
+    assert huella_muestreador(interarribo_exponencial) != huella_muestreador(interarribo_mas_lento)
+    assert huella_muestreador(lambda rng: 1.0) != huella_muestreador(lambda rng: 2.0)
+
+
+def test_huella_sigue_globales_y_auxiliares():
+    # Como una celda de notebook que se vuelve a correr con otro valor u otra auxiliar
+    espacio = {}
+    exec("MEDIA = 4.0\ndef escala():\n    return MEDIA\ndef muestrear(rng):\n    return rng.expovariate(1 / escala())", espacio)
+    base = huella_muestreador(espacio["muestrear"])
+    assert huella_muestreador(espacio["muestrear"]) == base
+
+    espacio["MEDIA"] = 5.0
+    assert huella_muestreador(espacio["muestrear"]) != base
+    espacio["MEDIA"] = 4.0
+    assert huella_muestreador(espacio["muestrear"]) == base
+
+    exec("def escala():\n    return 2 * MEDIA", espacio)
+    assert huella_muestreador(espacio["muestrear"]) != base
+
+
+def test_clave_no_depende_del_orden_de_los_dicts():
+    config = crear_config()
+    invertida = replace(config, muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"DEV": 240.0, "TEC": 45.0, "IT": 20.0}))
+    assert clave_resultado(invertida, 1) == clave_resultado(config, 1)
+
+
+def test_acierto_devuelve_el_mismo_resultado_sin_correr(tmp_path, monkeypatch):
+    config = crear_config()
+    with CacheResultados(str(tmp_path / "cache.sqlite")) as cache:
+        esperado = cache.correr(config, 7)
+        assert esperado == config.correr(7)
+
+        def no_correr(*args, **kwargs):
+            raise AssertionError("debía salir de la cache")
+
+        monkeypatch.setattr(ConfiguracionSimulador, "correr", no_correr)
+        assert cache.correr(config, 7) == esperado
+        assert (cache.aciertos, cache.fallos) == (1, 1)
+        assert len(cache) == 1
+
+
+def test_desaloja_lo_usado_hace_mas_tiempo(tmp_path):
+    config = crear_config(dias=1)
+    with CacheResultados(str(tmp_path / "cache.sqlite")) as cache:
+        for semilla in range(3):
+            cache.correr(config, semilla)
+        tamano_entrada = cache.tamano_bytes // 3
+        cache.tamano_maximo_bytes = int(tamano_entrada * 3.5)
+
+        cache.obtener(config, 0)      # la 1 pasa a ser la menos usada
+        cache.correr(config, 3)
+        assert len(cache) == 3
+        assert cache.tamano_bytes <= cache.tamano_maximo_bytes
+        assert cache.obtener(config, 1) is None
+        assert all(cache.obtener(config, semilla) is not None for semilla in (0, 2, 3))
+
+
+def test_varios_procesos_comparten_la_cache(tmp_path):
+    config = crear_config()
+    ruta = str(tmp_path / "cache.sqlite")
+    sin_cache = correr_replicaciones(config, replicaciones=8, workers=1, semilla_maestra=3)
+
+    primera = correr_replicaciones(config, replicaciones=8, workers=4, semilla_maestra=3, cache=CacheResultados(ruta))
+    assert primera.resultados == sin_cache.resultados
+
+    cache = CacheResultados(ruta)
+    segunda = correr_replicaciones(config, replicaciones=8, workers=1, semilla_maestra=3, cache=cache)
+    assert segunda.resultados == sin_cache.resultados
+    assert (cache.aciertos, cache.fallos, len(cache)) == (8, 0, 8)
+
+
+def test_viaja_por_pickle_sin_la_conexion(tmp_path):
+    cache = CacheResultados(str(tmp_path / "cache.sqlite"))
+    cache.correr(crear_config(dias=1), 1)
+    copia = pickle.loads(pickle.dumps(cache))
+    assert copia._conexion is None
+    assert copia.obtener(crear_config(dias=1), 1) is not None
+    cache.cerrar()
+    copia.cerrar()
+
+
+def test_muestreador_no_identificable():
+    class Opaco:
+        def __call__(self, rng):
+            return 1.0
+
+        def __reduce__(self):
+            raise TypeError("no se serializa")
+
+    with pytest.raises(ValueError):
+        huella_muestreador(Opaco())
@@ -0,0 +1,176 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from simulacion import (
+    MINUTOS_LABORALES_POR_DIA,
+    MARGEN_DIAS_CALENDARIO,
+    MINUTOS_POR_DIA,
+    MOTOR_BARRIDO,
+    MOTOR_CALENDARIO,
+    TURNOS_LUNES_A_VIERNES,
+    CalendarioLaboral,
+    ConfiguracionSimulador,
+    SimuladorMesaAyuda,
+    minutos_laborales_acumulados,
+    normalizar_a_horario_laboral,
+    sumar_minutos_laborales,
+)
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, strategies as st
+
+
+def hora(dia, hh, mm=0):
+    return dia * MINUTOS_POR_DIA + hh * 60 + mm
+
+
+def crear_simulador(calendario=None, motor=MOTOR_CALENDARIO, seed=8) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(3.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        seed=seed,
+        motor=motor,
+        calendario=calendario,
+    )
+
+
+# Pocas jornadas armadas de entrada: las consultas largas ejercitan la extensión
+CATEDRA = CalendarioLaboral(dias=8)
+
+tiempos = st.one_of(
+    st.floats(min_value=0, max_value=400 * MINUTOS_POR_DIA, allow_nan=False),
+    st.builds(lambda d, borde: hora(d, borde), st.integers(0, 400), st.sampled_from([9, 18])),
+)
+duraciones = st.one_of(
+    st.floats(min_value=-10, max_value=100 * MINUTOS_LABORALES_POR_DIA, allow_nan=False),
+    st.builds(lambda k: k * MINUTOS_LABORALES_POR_DIA, st.integers(0, 100)),
+)
+
+
+@given(tiempos, duraciones)
+def test_sin_argumentos_identico_a_las_funciones_de_modulo(tiempo, duracion):
+    assert CATEDRA.normalizar_a_horario_laboral(tiempo) == normalizar_a_horario_laboral(tiempo)
+    assert CATEDRA.sumar_minutos_laborales(tiempo, duracion) == sumar_minutos_laborales(tiempo, duracion)
+    assert CATEDRA.minutos_laborales_acumulados(tiempo) == minutos_laborales_acumulados(tiempo)
+
+
+@given(tiempos, st.floats(min_value=0, max_value=100 * MINUTOS_LABORALES_POR_DIA, allow_nan=False))
+def test_acumulados_es_inversa_de_sumar_con_feriados_y_medio_dia(tiempo, duracion):
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, feriados=[3, 17], turnos_especiales={9: (540, 780)}, dias=4)
+    fin = calendario.sumar_minutos_laborales(tiempo, duracion)
+    transcurridos = calendario.minutos_laborales_acumulados(fin) - calendario.minutos_laborales_acumulados(tiempo)
+    assert transcurridos == pytest.approx(duracion, abs=1e-6)
+    assert calendario.es_laboral(int(calendario.normalizar_a_horario_laboral(fin) // MINUTOS_POR_DIA))
+
+
+def test_fin_de_semana_feriado_y_medio_dia():
+    # Día 0 lunes; día 4 viernes, día 7 lunes feriado, día 8 martes medio día
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, feriados=[7], turnos_especiales={8: (540, 780)})
+
+    assert calendario.sumar_minutos_laborales(hora(4, 17), 120) == hora(8, 10)
+    assert calendario.normalizar_a_horario_laboral(hora(5, 12)) == hora(8, 9)
+    assert calendario.sumar_minutos_laborales(hora(8, 12), 90) == hora(9, 9, 30)
+    assert calendario.sumar_minutos_laborales(hora(8, 9), 240) == hora(8, 13)  # justo al cierre
+    assert calendario.fin_de_dia(8) == hora(8, 13)
+    assert calendario.fin_de_dia(6) == hora(6, 0)
+    assert not calendario.es_laboral(5) and not calendario.es_laboral(7)
+
+
+def test_dia_semana_inicial():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, dia_semana_inicial=5)  # el día 0 es sábado
+    assert calendario.inicio == hora(2, 9)
+
+
+@pytest.mark.parametrize("argumentos", [
+    {"turnos_por_dia_semana": {}},
+    {"turnos_por_dia_semana": {7: (540, 1080)}},
+    {"turnos_especiales": {3: (600, 600)}},
+    {"turnos_especiales": {3: (600, MINUTOS_POR_DIA)}},
+    {"feriados": [3], "turnos_especiales": {3: (540, 780)}},
+])
+def test_turnos_invalidos(argumentos):
+    with pytest.raises(ValueError):
+        CalendarioLaboral(**argumentos)
+
+
+def test_consultas_no_modifican_las_tablas_publicadas():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, feriados=[7], dias=8)
+    tablas = calendario._tablas
+    largos = [len(tabla) for tabla in tablas[:4]]
+    assert calendario.sumar_minutos_laborales(hora(4, 17), 300 * MINUTOS_LABORALES_POR_DIA) > hora(300, 0)
+    assert [len(tabla) for tabla in tablas[:4]] == largos  # se reemplazaron, no se extendieron
+    assert calendario._tablas.dias_armados > tablas.dias_armados
+
+    config = ConfiguracionSimulador(1, 1, 1, InterarriboExponencial(3.0), None, dias=90, calendario=CalendarioLaboral(dias=8))
+    assert config.calendario._tablas.dias_armados >= 90 + MARGEN_DIAS_CALENDARIO
+
+
+def test_se_comparte_entre_hilos():
+    consultas = [(hora(dia, 17), dia * 37.0) for dia in range(0, 2000, 3)]
+    esperado = [CalendarioLaboral(TURNOS_LUNES_A_VIERNES).sumar_minutos_laborales(*c) for c in consultas]
+    compartido = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, dias=1)
+    with ThreadPoolExecutor(8) as pool:
+        for _ in range(4):
+            assert list(pool.map(lambda c: compartido.sumar_minutos_laborales(*c), consultas)) == esperado
+
+
+def test_se_comparte_por_pickle():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, feriados=[7], turnos_especiales={8: (540, 780)})
+    copia = pickle.loads(pickle.dumps(calendario))
+    assert copia == calendario
+    assert copia.sumar_minutos_laborales(hora(4, 17), 120) == hora(8, 10)
+    assert copia != CalendarioLaboral(TURNOS_LUNES_A_VIERNES)
+
+
+@pytest.mark.parametrize("motor", [MOTOR_BARRIDO, MOTOR_CALENDARIO])
+def test_simulador_con_calendario_por_defecto_da_lo_mismo(motor):
+    assert crear_simulador(CalendarioLaboral(), motor).correr(dias=6) == crear_simulador(None, motor).correr(dias=6)
+
+
+def test_simulador_no_trabaja_fines_de_semana_ni_feriados():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, feriados=[9])
+    sim = crear_simulador(calendario)
+    sim.correr(dias=14)
+
+    por_dia = sim.metricas_diarias()
+    assert len(por_dia) == 14
+    for dia, resultado in enumerate(por_dia):
+        movimiento = sum(resultado.atendidos_por_tipo.values()) + sum(resultado.perdidos_por_tipo.values())
+        if calendario.es_laboral(dia):
+            assert movimiento > 0
+        else:
+            assert movimiento == 0, dia
+
+
+def test_continuar_con_calendario_equivale_a_correr_todo():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, turnos_especiales={4: (540, 780)})
+    esperado = crear_simulador(calendario).correr(dias=20)
+
+    incremental = crear_simulador(calendario)
+    incremental.correr(dias=6)  # termina en domingo
+    assert incremental.dias_simulados == 6
+    assert incremental.continuar(14) == esperado
+
+
+def test_arranque_en_fin_de_semana_registra_todos_los_dias():
+    calendario = CalendarioLaboral(TURNOS_LUNES_A_VIERNES, dia_semana_inicial=5)  # el día 0 es sábado
+    sim = crear_simulador(calendario)
+    sim.registrar_esperas_desde_dia = 3
+    sim.correr(dias=10)
+
+    por_dia = sim.metricas_diarias()
+    assert len(por_dia) == 10
+    for dia in (0, 1, 7, 8):
+        assert sum(por_dia[dia].atendidos_por_tipo.values()) + sum(por_dia[dia].perdidos_por_tipo.values()) == 0
+    estacionario = sim.resultado_estacionario(3)
+    assert estacionario.atendidos_por_tipo == {
+        tipo: sum(dia.atendidos_por_tipo[tipo] for dia in por_dia[3:]) for tipo in estacionario.atendidos_por_tipo
+    }
+    # La distribución se reinicia al empezar el día 3 (martes), no dos días después
+    atendidos = sum(estacionario.atendidos_por_tipo.values())
+    assert sum(d.n for d in estacionario.distribucion_espera_por_tipo.values()) == atendidos
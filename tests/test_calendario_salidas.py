@@ -0,0 +1,72 @@
+import pytest
+from simulacion import (
+    HORIZONTE_VACIO,
+    MOTOR_BARRIDO,
+    MOTOR_CALENDARIO,
+    CalendarioSalidas,
+    SimuladorMesaAyuda,
+)
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 4.0)
+
+def duracion_exponencial(tipo: str, rng) -> float:
+    medias = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+    return rng.expovariate(1 / medias[tipo])
+
+def crear_simulador(cantidad_it, cantidad_tec, cantidad_dev, seed, motor) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=cantidad_it,
+        cantidad_operadores_tecnico=cantidad_tec,
+        cantidad_operadores_dev=cantidad_dev,
+        muestrear_interarribo_min=interarribo_exponencial,
+        muestrear_duracion_servicio_min=duracion_exponencial,
+        seed=seed,
+        debug=False,
+        motor=motor,
+    )
+
+
+def test_calendario_desempata_it_tec_dev_y_menor_indice():
+    tps_it = [HORIZONTE_VACIO, 50.0, 50.0]
+    tps_tec = [50.0]
+    tps_dev = [50.0, 10.0]
+    calendario = CalendarioSalidas([tps_it, tps_tec, tps_dev])
+
+    assert calendario.proxima() == (10.0, 2, 1)
+    tps_dev[1] = HORIZONTE_VACIO           # invalidada sin tocar el heap
+    assert calendario.proxima() == (50.0, 0, 1)
+    tps_it[1] = 70.0
+    calendario.programar(0, 1, 70.0)
+    assert calendario.proxima() == (50.0, 0, 2)
+
+
+def test_calendario_vacio_devuelve_hv():
+    calendario = CalendarioSalidas([[HORIZONTE_VACIO], [], [HORIZONTE_VACIO]])
+    assert calendario.proxima() == (HORIZONTE_VACIO, -1, -1)
+
+
+@pytest.mark.parametrize("seed", [1, 7, 123])
+@pytest.mark.parametrize("operadores", [(1, 1, 1), (3, 2, 1), (0, 0, 2), (8, 4, 3)])
+def test_motor_calendario_igual_al_barrido(seed, operadores):
+    barrido = crear_simulador(*operadores, seed=seed, motor=MOTOR_BARRIDO)
+    calendario = crear_simulador(*operadores, seed=seed, motor=MOTOR_CALENDARIO)
+
+    res_barrido = barrido.correr(dias=5)
+    res_calendario = calendario.correr(dias=5)
+
+    assert res_calendario == res_barrido
+    assert calendario.TPSIT == barrido.TPSIT
+    assert calendario.TPSTEC == barrido.TPSTEC
+    assert calendario.TPSDEVS == barrido.TPSDEVS
+    assert calendario.DEVATENCIONIT == barrido.DEVATENCIONIT
+    assert calendario.DEVATENCIONTEC == barrido.DEVATENCIONTEC
+    assert calendario.PERDIDATIEMPOMAS30IT == barrido.PERDIDATIEMPOMAS30IT
+    assert calendario.PERDIDATIEMPOMAS30TEC == barrido.PERDIDATIEMPOMAS30TEC
+    assert calendario.rng.getstate() == barrido.rng.getstate()
+
+
+def test_motor_desconocido_falla():
+    with pytest.raises(ValueError):
+        crear_simulador(1, 1, 1, seed=1, motor="otro")
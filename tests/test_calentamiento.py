@@ -0,0 +1,60 @@
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import Calentamiento, estimar_calentamiento
+from simulacion import POOLS, ConfiguracionSimulador
+
+
+def crear_config(dias=20) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=3.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=dias,
+    )
+
+
+def test_serie_diaria_suma_el_horizonte():
+    sim = crear_config().construir(3)
+    sim.correr(20)
+    diarias = sim.metricas_diarias()
+
+    assert len(diarias) == 20
+    estacionario = sim.resultado_estacionario(5)
+    for tipo in POOLS:
+        assert estacionario.perdidos_por_tipo[tipo] == sum(d.perdidos_por_tipo[tipo] for d in diarias[5:])
+        assert estacionario.atendidos_por_tipo[tipo] == sum(d.atendidos_por_tipo[tipo] for d in diarias[5:])
+    with pytest.raises(ValueError):
+        sim.resultado_estacionario(20)
+
+
+def test_serie_diaria_igual_con_continuar():
+    completo = crear_config().construir(3)
+    completo.correr(20)
+    incremental = crear_config().construir(3)
+    incremental.correr(8)
+    incremental.continuar(12)
+    assert incremental.metricas_diarias() == completo.metricas_diarias()
+
+
+def test_config_descarta_calentamiento():
+    config = crear_config()
+    sim = config.construir(9)
+    sim.registrar_esperas_desde_dia = 4
+    sim.correr(config.dias)
+    con_calentamiento = ConfiguracionSimulador(**{**config.__dict__, "dias_calentamiento": 4})
+    assert con_calentamiento.correr(9) == sim.resultado_estacionario(4)
+    assert config.correr(9) == config.construir(9).correr(config.dias)
+
+
+def test_estimar_calentamiento_y_sugerir_corrida():
+    config = crear_config(dias=30)
+    calentamiento = estimar_calentamiento(config, replicaciones=3, workers=1)
+
+    assert calentamiento.dias_calentamiento == max(calentamiento.truncamiento_por_metrica.values())
+    assert 0 <= calentamiento.dias_calentamiento <= 15
+    sugerida = calentamiento.aplicar(config, factor=4)
+    assert sugerida.dias_calentamiento == calentamiento.dias_calentamiento
+    assert sugerida.dias == calentamiento.dias_calentamiento + 4 * max(calentamiento.dias_calentamiento, 1)
+    assert Calentamiento(3, {}, 30, 3).dias_sugeridos() == 33
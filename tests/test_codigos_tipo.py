@@ -0,0 +1,45 @@
+from simulacion import (
+    CODIGO_TIPO,
+    POOLS,
+    TIPO_DEV,
+    TIPO_IT,
+    TIPO_TEC,
+    SimuladorMesaAyuda,
+)
+
+
+def crear_simulador(cantidad_it=2, cantidad_tec=1, cantidad_dev=1) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=cantidad_it,
+        cantidad_operadores_tecnico=cantidad_tec,
+        cantidad_operadores_dev=cantidad_dev,
+        muestrear_interarribo_min=lambda rng: rng.expovariate(1 / 5.0),
+        muestrear_duracion_servicio_min=lambda tipo, rng: rng.expovariate(1 / 30.0),
+        seed=3,
+    )
+
+
+def test_codigos_siguen_el_orden_de_pools():
+    assert (TIPO_IT, TIPO_TEC, TIPO_DEV) == (0, 1, 2)
+    assert [POOLS[CODIGO_TIPO[tipo]] for tipo in POOLS] == list(POOLS)
+
+
+def test_vectores_de_catedra_son_vistas_de_las_tablas():
+    sim = crear_simulador()
+    sim.TPSTEC = [12.0]
+    sim.AGIT[1] = "agendado"
+
+    assert sim._tps[TIPO_TEC] is sim.TPSTEC
+    assert sim._ag[TIPO_IT][1] == "agendado"
+    assert len(sim.TPSIT) == 2 and len(sim.AGDEVS) == 1
+
+
+def test_metricas_exponen_claves_de_tipo_y_no_comparten_estado():
+    sim = crear_simulador()
+    resultado = sim.correr(dias=5)
+
+    assert set(resultado.perdidos_por_tipo) == set(POOLS)
+    assert resultado.atendidos_por_tipo == sim.atendidos_por_tipo
+    resultado.atendidos_por_tipo["IT"] += 1000
+    assert sim.atendidos_por_tipo["IT"] == sim._atendidos[TIPO_IT]
+    assert sim.atendidos_por_tipo["IT"] != resultado.atendidos_por_tipo["IT"]
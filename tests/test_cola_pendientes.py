@@ -0,0 +1,92 @@
+import pytest
+from simulacion import HORIZONTE_VACIO, MOTOR_BARRIDO, MOTOR_CALENDARIO, POOLS, PuntoControl, SimuladorMesaAyuda
+from traza import EVENTO_INICIO, EVENTO_PENDIENTE, EscritorTraza, LectorTraza
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 3.0)
+
+def duracion_exponencial(tipo: str, rng) -> float:
+    medias = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+    return rng.expovariate(1 / medias[tipo])
+
+def crear_simulador(motor=MOTOR_CALENDARIO, operadores=(2, 1, 1), seed=4, **extra) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        *operadores,
+        muestrear_interarribo_min=interarribo_exponencial,
+        muestrear_duracion_servicio_min=duracion_exponencial,
+        seed=seed,
+        motor=motor,
+        cola_pendientes=True,
+        **extra,
+    )
+
+
+def test_solo_se_pierde_por_abandono():
+    sim = crear_simulador()
+    res = sim.correr(dias=10)
+
+    assert res.perdidos_por_tipo["IT"] == sim.PERDIDATIEMPOMAS30IT
+    assert res.perdidos_por_tipo["TEC"] == sim.PERDIDATIEMPOMAS30TEC
+    assert res.perdidos_por_tipo["DEV"] == 0
+    assert sum(sim.pendientes_por_tipo.values()) > 0
+
+
+def test_todo_arribo_queda_contado_una_vez():
+    sim = crear_simulador()
+    res = sim.correr(dias=10)
+
+    arribos = sim.eventos_procesados - sum(res.atendidos_por_tipo.values())
+    en_servicio = sum(tps != HORIZONTE_VACIO for tps_pool in sim._tps for tps in tps_pool)
+    agendados = sum(trabajo is not None for ag in sim._ag for trabajo in ag)
+    assert arribos == (
+        sum(res.atendidos_por_tipo.values()) + sum(res.perdidos_por_tipo.values())
+        + en_servicio + agendados + sum(sim.pendientes_por_tipo.values())
+    )
+
+
+def test_la_cola_es_fifo(tmp_path):
+    ruta = str(tmp_path / "cola.traza")
+    with EscritorTraza(ruta) as traza:
+        # Un solo operador IT y ningún DEV: los IT se atienden en orden de llegada
+        sim = crear_simulador(operadores=(1, 1, 0), muestrear_tipo_servicio=lambda rng: "IT", traza=traza)
+        sim.correr(dias=3)
+
+    with LectorTraza(ruta) as lector:
+        assert any(r.evento == EVENTO_PENDIENTE for r in lector.registros())
+        arribos = [r.tiempo - r.espera for r in lector.filtrar(eventos=[EVENTO_INICIO])]
+        tiempos = [r.tiempo for r in lector.registros()]
+    assert arribos == sorted(arribos)
+    assert tiempos == sorted(tiempos)
+
+
+@pytest.mark.parametrize("seed", [1, 7])
+def test_motor_calendario_igual_al_barrido_con_cola(seed):
+    barrido = crear_simulador(MOTOR_BARRIDO, seed=seed)
+    calendario = crear_simulador(MOTOR_CALENDARIO, seed=seed)
+    assert calendario.correr(dias=8) == barrido.correr(dias=8)
+    assert calendario.pendientes_por_tipo == barrido.pendientes_por_tipo
+
+
+def test_largo_medio_de_la_cola():
+    res = crear_simulador().correr(dias=10)
+    assert set(res.largo_medio_cola_por_tipo) == set(POOLS)
+    assert res.largo_medio_cola_por_tipo["DEV"] > 0
+
+    holgado = crear_simulador(operadores=(20, 10, 10)).correr(dias=10)
+    assert holgado.largo_medio_cola_por_tipo == {tipo: 0.0 for tipo in POOLS}
+
+    sin_cola = SimuladorMesaAyuda(2, 1, 1, interarribo_exponencial, duracion_exponencial, seed=4).correr(dias=2)
+    assert sin_cola.largo_medio_cola_por_tipo is None
+
+
+def test_continuar_y_reanudar_con_cola(tmp_path):
+    esperado = crear_simulador().correr(dias=12)
+
+    incremental = crear_simulador()
+    incremental.correr(dias=5)
+    assert incremental.continuar(7) == esperado
+
+    ruta = str(tmp_path / "cola.ckpt")
+    crear_simulador().correr(dias=12, punto_control=PuntoControl(ruta, cada_dias=4))
+    assert crear_simulador().reanudar(ruta) == esperado
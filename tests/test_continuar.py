@@ -0,0 +1,42 @@
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from simulacion import MOTOR_BARRIDO, MOTOR_CALENDARIO, SimuladorMesaAyuda
+
+
+def crear_simulador(motor) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(3.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        seed=8,
+        motor=motor,
+    )
+
+
+@pytest.mark.parametrize("motor", [MOTOR_BARRIDO, MOTOR_CALENDARIO])
+def test_continuar_equivale_a_correr_el_horizonte_completo(motor):
+    completo = crear_simulador(motor)
+    esperado = completo.correr(dias=25)
+
+    incremental = crear_simulador(motor)
+    parcial = incremental.correr(dias=10)
+    incremental.continuar(5)
+    final = incremental.continuar(10)
+
+    assert final == esperado
+    assert incremental.dias_simulados == 25
+    assert incremental.eventos_procesados == completo.eventos_procesados
+    assert parcial != final
+    assert parcial == crear_simulador(motor).correr(dias=10)  # el parcial no cambia al continuar
+
+
+def test_continuar_sin_corrida_previa_falla():
+    sim = crear_simulador(MOTOR_CALENDARIO)
+    assert sim.dias_simulados == 0
+    with pytest.raises(ValueError):
+        sim.continuar(5)
+    sim.correr(dias=2)
+    with pytest.raises(ValueError):
+        sim.continuar(0)
@@ -0,0 +1,127 @@
+import math
+import random
+import statistics
+from bisect import bisect_left, bisect_right
+import pytest
+import distribucion
+from distribucion import DistribucionEspera, TDigest, Welford, combinar_distribuciones
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import correr_replicaciones
+from simulacion import POOLS, ConfiguracionSimulador
+
+
+def exponenciales(n, seed=1, media=30.0):
+    rng = random.Random(seed)
+    return [rng.expovariate(1 / media) for _ in range(n)]
+
+
+def crear_config(dias=10) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=3.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=dias,
+    )
+
+
+def test_welford_por_lotes_y_combinado():
+    valores = exponenciales(5000)
+    acumulado = Welford()
+    for i in range(0, 5000, 700):
+        acumulado.agregar_lote(valores[i:i + 700])
+    assert acumulado.n == 5000
+    assert acumulado.media == pytest.approx(statistics.fmean(valores), rel=1e-12)
+    assert acumulado.varianza == pytest.approx(statistics.variance(valores), rel=1e-9)
+    assert Welford().varianza == 0.0
+
+
+def test_welford_sin_cancelacion_con_offset_grande():
+    # Esperas chicas montadas sobre un offset enorme: la suma de cuadrados se cancela
+    valores = [1e9 + x for x in exponenciales(2000, media=1.0)]
+    acumulado = Welford()
+    for i in range(0, 2000, 300):
+        acumulado.agregar_lote(valores[i:i + 300])
+    assert acumulado.varianza == pytest.approx(statistics.variance(valores), rel=1e-6)
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_cuantiles_cerca_de_los_exactos_con_memoria_acotada(monkeypatch, con_numpy):
+    if con_numpy and distribucion.np is None:
+        pytest.skip("NumPy no disponible")
+    if not con_numpy:
+        monkeypatch.setattr(distribucion, "np", None)
+    valores = exponenciales(100_000)
+    espera = DistribucionEspera()
+    for v in valores:
+        espera.agregar(v)
+
+    ordenados = sorted(valores)
+    for q in (0.5, 0.9, 0.99):
+        assert espera.cuantil(q) == pytest.approx(ordenados[int(q * len(ordenados))], rel=0.02)
+    assert espera.n == 100_000
+    assert len(espera.digest.medias) <= espera.digest.compresion
+    assert espera.digest.cuantil(0.0) == ordenados[0]
+    assert espera.digest.cuantil(1.0) == ordenados[-1]
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_rango_del_p99_con_cola_pesada_y_ceros(monkeypatch, con_numpy):
+    # Como las esperas reales: un bloque de ceros (atención inmediata) y cola lognormal
+    if con_numpy and distribucion.np is None:
+        pytest.skip("NumPy no disponible")
+    if not con_numpy:
+        monkeypatch.setattr(distribucion, "np", None)
+    rng = random.Random(3)
+    valores = [0.0 if rng.random() < 0.3 else rng.lognormvariate(3.0, 1.2) for _ in range(200_000)]
+    espera = DistribucionEspera()
+    for v in valores:
+        espera.agregar(v)
+
+    ordenados = sorted(valores)
+
+    def rango(valor):
+        return (bisect_left(ordenados, valor) + bisect_right(ordenados, valor)) / 2 / len(ordenados)
+
+    assert espera.cuantil(0.2) == 0.0
+    assert abs(rango(espera.cuantil(0.9)) - 0.9) < 5e-4
+    assert abs(rango(espera.cuantil(0.99)) - 0.99) < 4e-4  # < 4% de la cola del 1%
+
+
+def test_combinar_replicas_equivale_a_una_sola_corriente():
+    valores = exponenciales(40_000, seed=2)
+    partes = [DistribucionEspera() for _ in range(4)]
+    for i, v in enumerate(valores):
+        partes[i % 4].agregar(v)
+    combinada = combinar_distribuciones(partes)
+
+    ordenados = sorted(valores)
+    assert combinada.n == 40_000
+    assert combinada.media == pytest.approx(statistics.fmean(valores), rel=1e-12)
+    assert combinada.varianza == pytest.approx(statistics.variance(valores), rel=1e-9)
+    assert combinada.cuantil(0.9) == pytest.approx(ordenados[36_000], rel=0.02)
+
+
+def test_digest_vacio_y_q_invalido():
+    assert math.isnan(TDigest().cuantil(0.5))
+    with pytest.raises(ValueError):
+        TDigest().cuantil(1.5)
+
+
+def test_simulador_entrega_distribucion_por_tipo():
+    sim = crear_config().construir(4)
+    resultado = sim.correr(10)
+    distribuciones = resultado.distribucion_espera_por_tipo
+
+    assert set(distribuciones) == set(POOLS)
+    it = distribuciones["IT"]
+    assert it.media == pytest.approx(sim.suma_espera_por_tipo_min["IT"] / it.n)
+    assert it.cuantil(0.5) <= it.cuantil(0.9) <= it.cuantil(0.99)
+    assert all(d.distribucion_espera_por_tipo is None for d in sim.metricas_diarias())
+
+
+def test_replicaciones_combinan_distribuciones():
+    res = correr_replicaciones(crear_config(dias=3), replicaciones=3, workers=1)
+    combinada = res.distribucion_espera_por_tipo["TEC"]
+    assert combinada.n == sum(r.distribucion_espera_por_tipo["TEC"].n for r in res.resultados)
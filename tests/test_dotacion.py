@@ -0,0 +1,72 @@
+import pytest
+from dotacion import correr_barrido_dotacion, correr_con_flujo, premuestrear_flujo
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TasaArribosPorHora, TipoServicioCategorico
+from replicacion import derivar_semillas
+from simulacion import ConfiguracionSimulador
+
+
+def crear_config(**cambios) -> ConfiguracionSimulador:
+    valores = dict(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=4.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        muestrear_tipo_servicio=TipoServicioCategorico(),
+        dias=4,
+    )
+    valores.update(cambios)
+    return ConfiguracionSimulador(**valores)
+
+
+@pytest.mark.parametrize("dotacion", [(1, 1, 1), (3, 2, 1), (6, 3, 2)])
+def test_flujo_premuestreado_reproduce_la_corrida_directa(dotacion):
+    config = crear_config(
+        cantidad_operadores_it=dotacion[0], cantidad_operadores_tecnico=dotacion[1], cantidad_operadores_dev=dotacion[2]
+    )
+    flujo = premuestrear_flujo(config, semilla=11)
+    assert correr_con_flujo(config, flujo) == config.construir(11).correr(config.dias)
+
+
+def test_flujo_con_tasa_por_hora_no_sortea_interarribos():
+    tasa = TasaArribosPorHora.por_dia([0.0] * 9 + [20.0] * 9 + [0.0] * 6)
+    config = crear_config(muestrear_interarribo_min=None, tasa_arribos=tasa)
+    flujo = premuestrear_flujo(config, semilla=5)
+    assert flujo.interarribos == [] and "interarribo" not in flujo.estados_rng
+    resultado = correr_con_flujo(config, flujo)
+    assert resultado == config.construir(5).correr(config.dias)
+    # Los tipos pre-sorteados alcanzan para todos los arribos de la tasa
+    assert sum(resultado.atendidos_por_tipo.values()) + sum(resultado.perdidos_por_tipo.values()) <= len(flujo.tipos)
+
+
+def test_flujo_se_reutiliza_entre_dotaciones():
+    flujo = premuestrear_flujo(crear_config(), semilla=3)
+    chico = correr_con_flujo(crear_config(cantidad_operadores_it=1), flujo)
+    grande = correr_con_flujo(crear_config(cantidad_operadores_it=8), flujo)
+    # mismos arribos: lo que cambia es cuántos se pierden
+    total_chico = sum(chico.atendidos_por_tipo.values()) + sum(chico.perdidos_por_tipo.values())
+    total_grande = sum(grande.atendidos_por_tipo.values()) + sum(grande.perdidos_por_tipo.values())
+    assert abs(total_chico - total_grande) <= 20  # solo difieren los que siguen en curso o agendados
+    assert grande.perdidos_por_tipo["IT"] < chico.perdidos_por_tipo["IT"]
+
+
+def test_barrido_tabla_tidy_y_no_depende_de_workers():
+    dotaciones = [(1, 1, 1), (2, 1, 1), (4, 2, 1)]
+    secuencial = correr_barrido_dotacion(crear_config(), dotaciones, replicaciones=3, workers=1, semilla_maestra=5)
+    paralelo = correr_barrido_dotacion(crear_config(), dotaciones, replicaciones=3, workers=2, semilla_maestra=5)
+
+    assert secuencial == paralelo
+    assert len(secuencial) == len(dotaciones) * 3
+    assert {(f.cantidad_operadores_it, f.tipo_servicio) for f in secuencial} >= {(4, "IT"), (1, "DEV")}
+
+    config = crear_config(cantidad_operadores_it=4, cantidad_operadores_tecnico=2)
+    directos = [config.construir(semilla).correr(4) for semilla in derivar_semillas(5, 3)]
+    fila = next(f for f in secuencial if f.cantidad_operadores_it == 4 and f.tipo_servicio == "IT")
+    assert fila.replicaciones == 3
+    assert fila.perdidos_media == pytest.approx(sum(r.perdidos_por_tipo["IT"] for r in directos) / 3)
+
+
+def test_barrido_requiere_muestreadores_con_bloques():
+    config = crear_config(muestrear_interarribo_min=lambda rng: 1.0)
+    with pytest.raises(ValueError):
+        correr_barrido_dotacion(config, [(1, 1, 1)], replicaciones=1, workers=1)
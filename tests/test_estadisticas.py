@@ -0,0 +1,46 @@
+import math
+import pytest
+import random
+from estadisticas import cuantil_t, intervalo_confianza, truncamiento_mser
+
+
+@pytest.mark.parametrize("probabilidad, gl, esperado", [
+    (0.975, 1, 12.7062),
+    (0.975, 2, 4.3027),
+    (0.975, 4, 2.7764),
+    (0.975, 9, 2.2622),
+    (0.975, 29, 2.0452),
+    (0.995, 3, 5.8409),
+    (0.95, 5, 2.0150),
+])
+def test_cuantil_t_contra_tabla(probabilidad, gl, esperado):
+    assert cuantil_t(probabilidad, gl) == pytest.approx(esperado, abs=1e-4)
+
+
+def test_intervalo_confianza_media_y_semi_ancho():
+    ic = intervalo_confianza([1.0, 2.0, 3.0, 4.0, 5.0], nivel=0.95)
+    assert ic.media == 3.0
+    assert ic.desvio == pytest.approx(math.sqrt(2.5))
+    assert ic.semi_ancho == pytest.approx(2.7764 * math.sqrt(2.5) / math.sqrt(5), rel=1e-4)
+    assert ic.inferior < 3.0 < ic.superior
+
+
+def test_intervalo_con_una_replica_es_infinito():
+    ic = intervalo_confianza([7.0])
+    assert ic.media == 7.0
+    assert ic.semi_ancho == math.inf
+
+
+def test_mser_detecta_transitorio_inicial():
+    rng = random.Random(3)
+    serie = [10.0 * (1 - math.exp(-i / 8)) + rng.gauss(0, 0.5) for i in range(200)]
+    truncamiento = truncamiento_mser(serie)
+    assert truncamiento % 5 == 0
+    assert 15 <= truncamiento <= 50
+
+
+def test_mser_serie_estacionaria_o_corta():
+    assert truncamiento_mser([4.0] * 50) == 0
+    assert truncamiento_mser([1.0, 2.0, 3.0]) == 0
+    with pytest.raises(ValueError):
+        truncamiento_mser([1.0], tamano_lote=0)
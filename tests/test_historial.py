@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import pytest
+from historial import (
+    HistorialBinario,
+    HistorialCSV,
+    convertir_csv_a_binario,
+    escribir_historial_binario,
+    escribir_historial_csv,
+)
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from simulacion import HORIZONTE_VACIO, MOTOR_BARRIDO, MOTOR_CALENDARIO, PuntoControl, SimuladorMesaAyuda
+
+
+def crear_simulador(seed=3, motor=MOTOR_CALENDARIO, **extra) -> SimuladorMesaAyuda:
+    # Muestreadores con bloques: el rng del simulador queda solo para el abandono
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=2,
+        cantidad_operadores_tecnico=1,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(3.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        muestrear_tipo_servicio=TipoServicioCategorico(),
+        seed=seed,
+        motor=motor,
+        **extra,
+    )
+
+
+def correr_registrando(dias, **extra):
+    """Corre con muestreadores y devuelve el resultado y los arribos como historial."""
+    sim = crear_simulador(**extra)
+    registros = []
+    procesar_arribo = sim._procesar_arribo
+    sortear_tipo = sim._sortear_tipo_servicio
+    obtener_duracion = sim._obtener_duracion_servicio_minutos
+
+    def tipo():
+        registros.append([None, sortear_tipo(), None])
+        return registros[-1][1]
+
+    def duracion(tipo_servicio):
+        registros[-1][2] = obtener_duracion(tipo_servicio)
+        return registros[-1][2]
+
+    def arribo(tiempo):
+        procesar_arribo(tiempo)
+        registros[-1][0] = tiempo
+
+    sim._sortear_tipo_servicio, sim._obtener_duracion_servicio_minutos, sim._procesar_arribo = tipo, duracion, arribo
+    return sim.correr(dias), [tuple(r) for r in registros]
+
+
+@pytest.mark.parametrize("motor", [MOTOR_BARRIDO, MOTOR_CALENDARIO])
+def test_reproducir_el_historial_da_la_misma_corrida(motor):
+    esperado, registros = correr_registrando(4, motor=motor)
+    assert crear_simulador(motor=motor, historial_arribos=registros).correr(4) == esperado
+
+
+def test_csv_y_binario_reproducen_igual(tmp_path):
+    esperado, registros = correr_registrando(4)
+    ruta_csv, ruta_bin = str(tmp_path / "tickets.csv"), str(tmp_path / "tickets.bin")
+    assert escribir_historial_csv(ruta_csv, registros) == len(registros)
+    assert convertir_csv_a_binario(ruta_csv, ruta_bin) == len(registros)
+
+    assert list(HistorialCSV(ruta_csv)) == registros
+    assert list(HistorialBinario(ruta_bin, registros_por_lote=7)) == registros
+    assert len(HistorialBinario(ruta_bin)) == len(registros)
+    assert crear_simulador(historial_arribos=HistorialBinario(ruta_bin, registros_por_lote=64)).correr(4) == esperado
+
+
+def test_csv_con_instantes_y_columnas_extra(tmp_path):
+    ruta = tmp_path / "tickets.csv"
+    ruta.write_text(
+        "id,tipo,tiempo_min,duracion_min\n"
+        "1,IT,2024-03-04T09:30:00,15\n"
+        "2,DEV,2024-03-05T20:00:00,60.5\n"
+    )
+    registros = list(HistorialCSV(str(ruta), origen=datetime(2024, 3, 4)))
+    assert registros == [(570.0, "IT", 15.0), (1440 + 1200.0, "DEV", 60.5)]
+
+    sim = SimuladorMesaAyuda(1, 1, 1, None, None, historial_arribos=registros)
+    res = sim.correr(dias=3)
+    assert res.atendidos_por_tipo == {"IT": 1, "TEC": 0, "DEV": 1}
+    # El ticket de las 20:00 arriba (y empieza a esperar) a las 09:00 del día siguiente
+    assert res.espera_promedio_por_tipo_min["DEV"] == 0.0
+    assert [dia.atendidos_por_tipo["DEV"] for dia in sim.metricas_diarias()] == [0, 0, 1]
+
+
+def test_historial_agotado_termina_la_corrida():
+    sim = SimuladorMesaAyuda(1, 1, 1, None, None, historial_arribos=[(600.0, "IT", 30.0)])
+    res = sim.correr(dias=5)
+    assert res.atendidos_por_tipo["IT"] == 1
+    assert sim.dias_simulados == 5
+    assert all(tps == HORIZONTE_VACIO for tps in sim.TPSIT)
+
+
+def test_historial_invalido():
+    desordenado = [(700.0, "IT", 5.0), (600.0, "IT", 5.0)]
+    with pytest.raises(ValueError):
+        SimuladorMesaAyuda(1, 1, 1, None, None, historial_arribos=desordenado).correr(dias=1)
+    with pytest.raises(ValueError):
+        SimuladorMesaAyuda(1, 1, 1, None, None, historial_arribos=[(600.0, "OTRO", 5.0)]).correr(dias=1)
+
+
+def test_reanudar_reproduccion(tmp_path):
+    esperado, registros = correr_registrando(6)
+    ruta_bin = str(tmp_path / "tickets.bin")
+    escribir_historial_binario(ruta_bin, registros)
+    ruta = str(tmp_path / "reproduccion.ckpt")
+
+    crear_simulador(historial_arribos=HistorialBinario(ruta_bin)).correr(6, punto_control=PuntoControl(ruta, cada_dias=2))
+    assert crear_simulador(historial_arribos=HistorialBinario(ruta_bin)).reanudar(ruta) == esperado
+
+
+def test_reanudar_sobre_un_generador(tmp_path):
+    _, registros = correr_registrando(6)
+    ruta_bin = str(tmp_path / "tickets.bin")
+    escribir_historial_binario(ruta_bin, registros)
+    ruta = str(tmp_path / "reproduccion.ckpt")
+    crear_simulador(historial_arribos=HistorialBinario(ruta_bin)).correr(6, punto_control=PuntoControl(ruta, cada_dias=2))
+
+    # Un generador no se puede volver a recorrer desde el principio
+    with pytest.raises(ValueError):
+        crear_simulador(historial_arribos=(registro for registro in HistorialBinario(ruta_bin))).reanudar(ruta)
+    with pytest.raises(ValueError):
+        crear_simulador(historial_arribos=iter(registros)).correr(6, punto_control=PuntoControl(str(tmp_path / "otro.ckpt"), cada_dias=2))
+    # Sin puntos de control el generador sigue sirviendo
+    assert crear_simulador(historial_arribos=iter(registros)).correr(6) == crear_simulador(historial_arribos=registros).correr(6)
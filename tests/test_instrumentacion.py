@@ -0,0 +1,51 @@
+from simulacion import MOTOR_CALENDARIO, PUNTOS_INSTRUMENTADOS, SimuladorMesaAyuda
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 3.0)
+
+def duracion_exponencial(tipo: str, rng) -> float:
+    return rng.expovariate(1 / {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}[tipo])
+
+def crear_simulador(instrumentar, motor=MOTOR_CALENDARIO) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=2,
+        cantidad_operadores_tecnico=1,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=interarribo_exponencial,
+        muestrear_duracion_servicio_min=duracion_exponencial,
+        seed=8,
+        motor=motor,
+        instrumentar=instrumentar,
+    )
+
+
+def test_sin_instrumentar_no_hay_envoltorios_ni_mediciones():
+    sim = crear_simulador(instrumentar=False)
+    assert all(nombre not in vars(sim) for nombre in PUNTOS_INSTRUMENTADOS if nombre != "_sumar_minutos_laborales")
+    assert sim.correr(2).instrumentacion is None
+
+
+def test_instrumentado_cuenta_llamadas_y_tiempo():
+    sim = crear_simulador(instrumentar=True)
+    res = sim.correr(3)
+    medicion = res.instrumentacion
+
+    assert set(medicion) == {nombre.lstrip("_") for nombre in PUNTOS_INSTRUMENTADOS}
+    arribos = medicion["procesar_arribo"].llamadas
+    salidas = medicion["procesar_salida"].llamadas
+    assert arribos > 0 and salidas == sum(res.atendidos_por_tipo.values())
+    assert medicion["buscar_operador_libre"].llamadas == arribos
+    assert 0 < medicion["buscar_operador_para_agendar"].llamadas <= arribos
+    # un TPLL por arribo (+ el inicial) y un fin de servicio por inicio
+    assert medicion["sumar_minutos_laborales"].llamadas > arribos
+    assert medicion["procesar_arribo"].tiempo_ns >= medicion["buscar_operador_libre"].tiempo_ns
+    assert medicion["procesar_arribo"].ns_por_llamada > 0
+
+
+def test_instrumentar_no_cambia_resultados():
+    con = crear_simulador(instrumentar=True).correr(3)
+    sin = crear_simulador(instrumentar=False).correr(3)
+    assert (con.perdidos_por_tipo, con.atendidos_por_tipo, con.espera_promedio_por_tipo_min) == (
+        sin.perdidos_por_tipo, sin.atendidos_por_tipo, sin.espera_promedio_por_tipo_min
+    )
@@ -0,0 +1,69 @@
+import pytest
+from simulacion import (
+    FIN_TURNO_MIN,
+    INICIO_TURNO_MIN,
+    MINUTOS_LABORALES_POR_DIA,
+    MINUTOS_POR_DIA,
+    minutos_laborales_acumulados,
+    normalizar_a_horario_laboral,
+    sumar_minutos_laborales,
+    tiempo_desde_minutos_laborales,
+)
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, strategies as st
+
+
+def sumar_minutos_laborales_iterativo(tiempo_inicio_minutos, duracion_minutos):
+    """Versión original (un paso por día) usada como oráculo."""
+    tiempo_actual = normalizar_a_horario_laboral(tiempo_inicio_minutos)
+    minutos_restantes = duracion_minutos
+
+    while minutos_restantes > 0:
+        dia = int(tiempo_actual // MINUTOS_POR_DIA)
+        fin_hoy = dia * MINUTOS_POR_DIA + FIN_TURNO_MIN
+
+        minutos_disponibles_hoy = fin_hoy - tiempo_actual
+        if minutos_restantes <= minutos_disponibles_hoy:
+            return tiempo_actual + minutos_restantes
+
+        minutos_restantes -= minutos_disponibles_hoy
+        tiempo_actual = (dia + 1) * MINUTOS_POR_DIA + INICIO_TURNO_MIN
+
+    return tiempo_actual
+
+
+tiempos = st.one_of(
+    st.floats(min_value=0, max_value=3650 * MINUTOS_POR_DIA, allow_nan=False),
+    st.integers(min_value=0, max_value=3650 * MINUTOS_POR_DIA),
+    # bordes de turno: 09:00 y 18:00 de cualquier día
+    st.builds(lambda d, borde: d * MINUTOS_POR_DIA + borde,
+              st.integers(0, 3650), st.sampled_from([INICIO_TURNO_MIN, FIN_TURNO_MIN])),
+)
+duraciones = st.one_of(
+    st.floats(min_value=-10, max_value=200 * MINUTOS_LABORALES_POR_DIA, allow_nan=False),
+    st.integers(min_value=0, max_value=200 * MINUTOS_LABORALES_POR_DIA),
+    st.builds(lambda k: k * MINUTOS_LABORALES_POR_DIA, st.integers(0, 200)),
+)
+
+
+@given(tiempos, duraciones)
+def test_forma_cerrada_identica_al_loop(tiempo, duracion):
+    assert sumar_minutos_laborales(tiempo, duracion) == sumar_minutos_laborales_iterativo(tiempo, duracion)
+
+
+@given(tiempos, st.floats(min_value=0, max_value=200 * MINUTOS_LABORALES_POR_DIA, allow_nan=False))
+def test_acumulados_es_inversa_de_sumar(tiempo, duracion):
+    fin = sumar_minutos_laborales(tiempo, duracion)
+    transcurridos = minutos_laborales_acumulados(fin) - minutos_laborales_acumulados(tiempo)
+    assert transcurridos == pytest.approx(duracion, abs=1e-6)
+    # 18:00 y 09:00 del día siguiente son el mismo instante laboral
+    ida_y_vuelta = tiempo_desde_minutos_laborales(minutos_laborales_acumulados(fin))
+    assert minutos_laborales_acumulados(ida_y_vuelta) == pytest.approx(minutos_laborales_acumulados(fin), abs=1e-6)
+
+
+def test_jornada_completa_termina_a_las_18_del_mismo_dia():
+    assert sumar_minutos_laborales(INICIO_TURNO_MIN, MINUTOS_LABORALES_POR_DIA) == FIN_TURNO_MIN
+    assert sumar_minutos_laborales(INICIO_TURNO_MIN, 2 * MINUTOS_LABORALES_POR_DIA) == MINUTOS_POR_DIA + FIN_TURNO_MIN
+    assert minutos_laborales_acumulados(FIN_TURNO_MIN) == MINUTOS_LABORALES_POR_DIA
+    assert minutos_laborales_acumulados(MINUTOS_POR_DIA + INICIO_TURNO_MIN) == MINUTOS_LABORALES_POR_DIA
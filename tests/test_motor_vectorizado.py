@@ -0,0 +1,78 @@
+import statistics
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from motor_vectorizado import correr_lote_vectorizado, sumar_minutos_laborales_array
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import correr_replicaciones_vectorizadas, derivar_semillas
+from simulacion import POOLS, ConfiguracionSimulador, sumar_minutos_laborales
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 4.0)
+
+
+def crear_config(**cambios) -> ConfiguracionSimulador:
+    valores = dict(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(4.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=5,
+    )
+    valores.update(cambios)
+    return ConfiguracionSimulador(**valores)
+
+
+def test_sumar_minutos_laborales_array_igual_al_escalar():
+    inicios = [0.0, 540.0, 600.5, 1079.0, 1080.0, 1500.0, 2000.0]
+    duraciones = [0.0, 30.0, 479.5, 540.0, 1.0, 1080.0, 2500.25]
+    for inicio in inicios:
+        esperado = [sumar_minutos_laborales(inicio, d) for d in duraciones]
+        obtenido = sumar_minutos_laborales_array(np.full(len(duraciones), inicio), np.array(duraciones))
+        assert obtenido.tolist() == esperado
+
+
+def test_mismo_resultado_con_la_misma_semilla():
+    config = crear_config()
+    assert correr_lote_vectorizado(config, 20, semilla=3) == correr_lote_vectorizado(config, 20, semilla=3)
+    assert correr_lote_vectorizado(config, 20, semilla=3) != correr_lote_vectorizado(config, 20, semilla=4)
+
+
+def test_coincide_en_distribucion_con_el_motor_de_referencia():
+    config = crear_config()
+    vectorizadas = correr_lote_vectorizado(config, 400, semilla=1)
+    referencia = [config.correr(seed) for seed in derivar_semillas(1, 80)]
+
+    for campo in ("perdidos_por_tipo", "atendidos_por_tipo", "espera_promedio_por_tipo_min"):
+        for tipo in POOLS:
+            a = [getattr(r, campo)[tipo] for r in vectorizadas]
+            b = [getattr(r, campo)[tipo] for r in referencia]
+            error_estandar = (statistics.variance(a) / len(a) + statistics.variance(b) / len(b)) ** 0.5
+            assert abs(statistics.mean(a) - statistics.mean(b)) < 4 * error_estandar, (campo, tipo)
+
+
+def test_calentamiento_descarta_los_primeros_dias():
+    completo = correr_lote_vectorizado(crear_config(dias=4), 30, semilla=5)
+    sin_calentamiento = correr_lote_vectorizado(crear_config(dias=4, dias_calentamiento=2), 30, semilla=5)
+    for r_completo, r_recortado in zip(completo, sin_calentamiento):
+        for tipo in POOLS:
+            assert r_recortado.atendidos_por_tipo[tipo] <= r_completo.atendidos_por_tipo[tipo]
+            assert r_recortado.perdidos_por_tipo[tipo] <= r_completo.perdidos_por_tipo[tipo]
+    assert sum(r.atendidos_por_tipo["IT"] for r in sin_calentamiento) < sum(r.atendidos_por_tipo["IT"] for r in completo)
+
+
+def test_sin_muestrear_array_falla():
+    with pytest.raises(ValueError):
+        correr_lote_vectorizado(crear_config(muestrear_interarribo_min=interarribo_exponencial), 5)
+
+
+def test_resumen_de_replicaciones_vectorizadas():
+    resumen = correr_replicaciones_vectorizadas(crear_config(dias=2), 50, semilla_maestra=7)
+    assert resumen.replicaciones == 50
+    assert resumen.semillas == [7]
+    assert resumen.distribucion_espera_por_tipo is None
+    assert resumen.atendidos_por_tipo["IT"].media > 0
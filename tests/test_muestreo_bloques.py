@@ -0,0 +1,78 @@
+import random
+import pytest
+import muestreadores
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from simulacion import TAMANO_BLOQUE_INICIAL, CursorBloques, SimuladorMesaAyuda, admite_bloques
+
+MEDIAS = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+
+
+def crear_simulador_bloques(seed, muestrear_tipo_servicio=None) -> SimuladorMesaAyuda:
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(4.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo(MEDIAS),
+        seed=seed,
+        debug=False,
+        muestrear_tipo_servicio=muestrear_tipo_servicio,
+    )
+
+
+class ContadorBloques:
+    def __init__(self):
+        self.pedidos = []
+
+    def muestrear_bloque(self, rng, n):
+        self.pedidos.append(n)
+        return list(range(n))
+
+
+def test_cursor_recarga_perezosa_y_duplica_bloque():
+    fuente = ContadorBloques()
+    cursor = CursorBloques(fuente.muestrear_bloque, (), random.Random(1))
+    assert fuente.pedidos == []
+
+    valores = [cursor.siguiente() for _ in range(TAMANO_BLOQUE_INICIAL + 1)]
+    assert fuente.pedidos == [TAMANO_BLOQUE_INICIAL, 2 * TAMANO_BLOQUE_INICIAL]
+    assert valores[:3] == [0, 1, 2]
+    assert valores[-1] == 0
+
+
+def test_admite_bloques_solo_si_tiene_muestrear_bloque():
+    assert admite_bloques(InterarriboExponencial(4.0))
+    assert not admite_bloques(lambda rng: 1.0)
+
+
+def test_simulador_con_bloques_es_reproducible():
+    assert crear_simulador_bloques(seed=3).correr(5) == crear_simulador_bloques(seed=3).correr(5)
+    assert crear_simulador_bloques(seed=3).correr(5) != crear_simulador_bloques(seed=4).correr(5)
+
+
+def test_tipo_servicio_invocable_sin_bloques_usa_rng_del_simulador():
+    sim = crear_simulador_bloques(seed=1, muestrear_tipo_servicio=lambda rng: "TEC")
+    res = sim.correr(2)
+    assert res.atendidos_por_tipo["IT"] == 0
+    assert res.atendidos_por_tipo["TEC"] > 0
+
+
+@pytest.mark.parametrize("con_numpy", [True, False])
+def test_bloques_tienen_la_distribucion_pedida(monkeypatch, con_numpy):
+    if con_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(muestreadores, "np", None)
+    rng = random.Random(9)
+
+    interarribos = InterarriboExponencial(4.0).muestrear_bloque(rng, 20000)
+    assert len(interarribos) == 20000
+    assert sum(interarribos) / len(interarribos) == pytest.approx(4.0, rel=0.05)
+
+    duraciones = DuracionExponencialPorTipo(MEDIAS).muestrear_bloque("DEV", rng, 20000)
+    assert sum(duraciones) / len(duraciones) == pytest.approx(240.0, rel=0.05)
+
+    tipos = TipoServicioCategorico().muestrear_bloque(rng, 20000)
+    assert tipos.count("IT") / 20000 == pytest.approx(0.70, abs=0.02)
+    assert tipos.count("TEC") / 20000 == pytest.approx(0.20, abs=0.02)
+    assert tipos.count("DEV") / 20000 == pytest.approx(0.10, abs=0.02)
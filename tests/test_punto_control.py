@@ -0,0 +1,80 @@
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial, TipoServicioCategorico
+from simulacion import MOTOR_BARRIDO, MOTOR_CALENDARIO, PuntoControl, SimuladorMesaAyuda
+
+
+def interarribo_exponencial(rng) -> float:
+    return rng.expovariate(1 / 3.0)
+
+def duracion_exponencial(tipo: str, rng) -> float:
+    medias = {"IT": 20.0, "TEC": 45.0, "DEV": 240.0}
+    return rng.expovariate(1 / medias[tipo])
+
+def crear_simulador(motor=MOTOR_CALENDARIO, bloques=False, seed=4) -> SimuladorMesaAyuda:
+    if bloques:
+        muestreadores = dict(
+            muestrear_interarribo_min=InterarriboExponencial(3.0),
+            muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+            muestrear_tipo_servicio=TipoServicioCategorico(),
+        )
+    else:
+        muestreadores = dict(
+            muestrear_interarribo_min=interarribo_exponencial,
+            muestrear_duracion_servicio_min=duracion_exponencial,
+        )
+    return SimuladorMesaAyuda(
+        cantidad_operadores_it=3, cantidad_operadores_tecnico=2, cantidad_operadores_dev=1,
+        seed=seed, motor=motor, **muestreadores,
+    )
+
+
+class Corte(Exception):
+    pass
+
+
+def cortar_despues_de(sim: SimuladorMesaAyuda, salidas: int):
+    original = sim._procesar_salida
+    contador = [0]
+
+    def con_corte(t, tipo, idx):
+        contador[0] += 1
+        if contador[0] > salidas:
+            raise Corte()
+        return original(t, tipo, idx)
+
+    sim._procesar_salida = con_corte
+
+
+@pytest.mark.parametrize("motor", [MOTOR_BARRIDO, MOTOR_CALENDARIO])
+@pytest.mark.parametrize("bloques", [False, True])
+def test_reanudar_tras_corte_da_el_mismo_resultado(tmp_path, motor, bloques):
+    ruta = str(tmp_path / "estado.ckpt")
+    completo = crear_simulador(motor, bloques)
+    esperado = completo.correr(dias=20)
+
+    interrumpido = crear_simulador(motor, bloques)
+    cortar_despues_de(interrumpido, 1500)
+    with pytest.raises(Corte):
+        interrumpido.correr(dias=20, punto_control=PuntoControl(ruta, cada_eventos=500))
+
+    reanudado = crear_simulador(motor, bloques)
+    assert reanudado.reanudar(ruta) == esperado
+    assert reanudado.metricas_diarias() == completo.metricas_diarias()
+
+
+def test_guardar_por_dias_no_altera_la_corrida(tmp_path):
+    ruta = str(tmp_path / "estado.ckpt")
+    sin_control = crear_simulador(bloques=True)
+    con_control = crear_simulador(bloques=True)
+
+    assert con_control.correr(dias=15, punto_control=PuntoControl(ruta, cada_dias=4)) == sin_control.correr(dias=15)
+    assert con_control.rng.getstate() == sin_control.rng.getstate()
+    # el último guardado fue al entrar al día 12: reanudar termina igual
+    assert crear_simulador(bloques=True).reanudar(ruta) == crear_simulador(bloques=True).correr(dias=15)
+
+
+def test_reanudar_con_otra_configuracion_falla(tmp_path):
+    ruta = str(tmp_path / "estado.ckpt")
+    crear_simulador().correr(dias=3, punto_control=PuntoControl(ruta, cada_dias=1))
+    with pytest.raises(ValueError):
+        crear_simulador(seed=5).reanudar(ruta)
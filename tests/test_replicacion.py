@@ -0,0 +1,81 @@
+import pytest
+from muestreadores import DuracionExponencialPorTipo, InterarriboExponencial
+from replicacion import correr_hasta_precision, correr_replicaciones, derivar_semillas
+from simulacion import ConfiguracionSimulador
+
+
+def crear_config(dias=3) -> ConfiguracionSimulador:
+    return ConfiguracionSimulador(
+        cantidad_operadores_it=3,
+        cantidad_operadores_tecnico=2,
+        cantidad_operadores_dev=1,
+        muestrear_interarribo_min=InterarriboExponencial(media_min=4.0),
+        muestrear_duracion_servicio_min=DuracionExponencialPorTipo({"IT": 20.0, "TEC": 45.0, "DEV": 240.0}),
+        dias=dias,
+    )
+
+
+def test_semillas_deterministicas_e_independientes_del_lote():
+    semillas = derivar_semillas(42, 10)
+    assert semillas == derivar_semillas(42, 10)
+    assert len(set(semillas)) == 10
+    assert derivar_semillas(42, 4, inicio=6) == semillas[6:]
+    assert derivar_semillas(43, 10) != semillas
+
+
+def test_resultado_no_depende_de_cantidad_de_workers():
+    config = crear_config()
+    secuencial = correr_replicaciones(config, replicaciones=6, workers=1, semilla_maestra=7)
+    paralelo = correr_replicaciones(config, replicaciones=6, workers=3, semilla_maestra=7)
+
+    assert paralelo.resultados == secuencial.resultados
+    assert paralelo.perdidos_por_tipo == secuencial.perdidos_por_tipo
+
+
+def test_replica_i_es_la_corrida_con_su_semilla():
+    config = crear_config()
+    res = correr_replicaciones(config, replicaciones=3, workers=1, semilla_maestra=5)
+    for semilla, resultado in zip(res.semillas, res.resultados):
+        assert config.construir(semilla).correr(config.dias) == resultado
+
+
+def test_agrega_medias_e_intervalos_por_tipo():
+    res = correr_replicaciones(crear_config(), replicaciones=5, workers=1)
+    assert res.replicaciones == 5
+    perdidos_it = [r.perdidos_por_tipo["IT"] for r in res.resultados]
+    ic = res.perdidos_por_tipo["IT"]
+    assert ic.media == pytest.approx(sum(perdidos_it) / 5)
+    assert ic.inferior <= ic.media <= ic.superior
+    assert set(res.espera_promedio_por_tipo_min) == {"IT", "TEC", "DEV"}
+
+
+def test_replicaciones_invalidas():
+    with pytest.raises(ValueError):
+        correr_replicaciones(crear_config(), replicaciones=0)
+
+
+def test_precision_se_alcanza_y_coincide_con_replicas_fijas():
+    config = crear_config()
+    res = correr_hasta_precision(config, precision_relativa=0.15, replicaciones_iniciales=4, workers=1, semilla_maestra=3)
+
+    assert res.alcanzada
+    for ic in res.intervalos.values():
+        assert ic.semi_ancho_relativo <= 0.15
+    fijas = correr_replicaciones(config, replicaciones=res.replicaciones, workers=1, semilla_maestra=3)
+    assert fijas.resultados == res.resumen.resultados
+    assert res.intervalos[("perdidos_por_tipo", "IT")] == fijas.perdidos_por_tipo["IT"]
+
+
+def test_precision_inalcanzable_corta_en_maximo():
+    res = correr_hasta_precision(
+        crear_config(), precision_relativa=1e-6, replicaciones_iniciales=3, replicaciones_maximas=7, workers=2
+    )
+    assert not res.alcanzada
+    assert res.replicaciones == 7
+
+
+def test_precision_parametros_invalidos():
+    with pytest.raises(ValueError):
+        correr_hasta_precision(crear_config(), precision_relativa=0)
+    with pytest.raises(ValueError):
+        correr_hasta_precision(crear_config(), metricas=[("perdidos_por_tipo", "XX")])
@@ -0,0 +1,22 @@
+import pickle
+import sys
+import pytest
+from simulacion import Trabajo
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass(slots=True) requiere 3.10")
+
+
+def test_trabajo_no_tiene_dict_por_instancia():
+    trabajo = Trabajo(tiempo_arribo_minutos=540.0, tipo_servicio="IT", duracion_servicio_minutos=10.0)
+    assert not hasattr(trabajo, "__dict__")
+    with pytest.raises(AttributeError):
+        trabajo.otro_campo = 1
+
+
+def test_trabajo_sigue_siendo_un_dataclass_mutable_y_serializable():
+    trabajo = Trabajo(tiempo_arribo_minutos=540.0, tipo_servicio="IT", duracion_servicio_minutos=10.0)
+    trabajo.tipo_servicio = "TEC"
+    trabajo.tomadoPorDev = True
+    copia = pickle.loads(pickle.dumps(trabajo))
+    assert copia == trabajo
+    assert copia == Trabajo(540.0, "TEC", 10.0, tomadoPorDev=True)
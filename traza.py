@@ -0,0 +1,166 @@
+# traza.py
+"""
+Traza binaria de eventos del simulador (alternativa a debug=True).
+- Registros de ancho fijo (REGISTRO.size bytes) en orden de evento: el tiempo
+  nunca decrece a lo largo del archivo.
+- Se escriben con struct.pack_into sobre un buffer y se vuelcan al archivo al
+  llenarse; el texto ("Día X HH:MM") se arma recién al leer.
+- LectorTraza mapea el archivo en memoria y filtra por día (búsqueda binaria)
+  o por tipo de evento sin cargarlo entero.
+"""
+from __future__ import annotations
+
+import math
+import mmap
+import struct
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from simulacion import MINUTOS_POR_DIA, POOLS, formatear_tiempo
+
+# tiempo, espera, operador, evento, pool, tipo, relleno
+REGISTRO = struct.Struct("<ddibbbx")
+
+EVENTO_INICIO = 1
+EVENTO_AGENDA = 2
+EVENTO_FIN = 3
+EVENTO_PERDIDO = 4
+EVENTO_PENDIENTE = 5  # entra a la cola (cola_pendientes=True)
+NOMBRES_EVENTO = {
+    EVENTO_INICIO: "INICIO", EVENTO_AGENDA: "AGENDA", EVENTO_FIN: "FIN", EVENTO_PERDIDO: "PERDIDO",
+    EVENTO_PENDIENTE: "PENDIENTE",
+}
+
+SIN_DATO = -1  # pool/operador/tipo que no aplican al evento
+
+
+class EscritorTraza:
+    """
+    Uso:
+        with EscritorTraza("corrida.traza") as traza:
+            SimuladorMesaAyuda(..., traza=traza).correr(dias)
+    """
+
+    def __init__(self, ruta: str, registros_por_buffer: int = 65536):
+        self.ruta = ruta
+        self._archivo = open(ruta, "wb")
+        self._buffer = bytearray(REGISTRO.size * registros_por_buffer)
+        self._desplazamiento = 0
+        self.registros = 0
+
+    def _registrar(self, evento: int, tiempo: float, pool: int, operador: int, tipo: int, espera: float):
+        if self._desplazamiento == len(self._buffer):
+            self.vaciar()
+        REGISTRO.pack_into(self._buffer, self._desplazamiento, tiempo, espera, operador, evento, pool, tipo)
+        self._desplazamiento += REGISTRO.size
+        self.registros += 1
+
+    # pool y tipo son códigos de simulacion (TIPO_IT, TIPO_TEC, TIPO_DEV)
+    def inicio(self, tiempo: float, pool: int, operador: int, tipo: int, espera: float):
+        self._registrar(EVENTO_INICIO, tiempo, pool, operador, tipo, espera)
+
+    def agenda(self, tiempo: float, pool: int, operador: int, tipo: int):
+        self._registrar(EVENTO_AGENDA, tiempo, pool, operador, tipo, math.nan)
+
+    def fin(self, tiempo: float, pool: int, operador: int, tipo: int):
+        self._registrar(EVENTO_FIN, tiempo, pool, operador, tipo, math.nan)
+
+    def perdido(self, tiempo: float, tipo: int):
+        self._registrar(EVENTO_PERDIDO, tiempo, SIN_DATO, SIN_DATO, tipo, math.nan)
+
+    def pendiente(self, tiempo: float, tipo: int):
+        self._registrar(EVENTO_PENDIENTE, tiempo, SIN_DATO, SIN_DATO, tipo, math.nan)
+
+    def vaciar(self):
+        self._archivo.write(memoryview(self._buffer)[:self._desplazamiento])
+        self._archivo.flush()
+        self._desplazamiento = 0
+
+    def cerrar(self):
+        if not self._archivo.closed:
+            self.vaciar()
+            self._archivo.close()
+
+    def __enter__(self) -> EscritorTraza:
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class RegistroTraza(NamedTuple):
+    tiempo: float
+    espera: float
+    operador: int
+    evento: int
+    pool: int
+    tipo: int
+
+    def texto(self) -> str:
+        """Mismo formato que las líneas de debug."""
+        nombre = NOMBRES_EVENTO[self.evento]
+        tipo = POOLS[self.tipo] if self.tipo != SIN_DATO else "?"
+        if self.evento in (EVENTO_PERDIDO, EVENTO_PENDIENTE):
+            return f"[{nombre}] {tipo} arribo={formatear_tiempo(self.tiempo)}"
+        texto = f"[{nombre}] pool={POOLS[self.pool]} op={self.operador} tipo={tipo} t={formatear_tiempo(self.tiempo)}"
+        if self.evento == EVENTO_INICIO:
+            texto += f" espera={self.espera:.2f}"
+        return texto
+
+
+class LectorTraza:
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, "rb")
+        tamano = self._archivo.seek(0, 2)
+        # mmap no acepta archivos vacíos
+        self._mm = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ) if tamano else b""
+        self._cantidad = tamano // REGISTRO.size
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def _tiempo(self, i: int) -> float:
+        return REGISTRO.unpack_from(self._mm, i * REGISTRO.size)[0]
+
+    def _primer_indice_desde(self, tiempo: float) -> int:
+        bajo, alto = 0, self._cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if self._tiempo(medio) < tiempo:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    def registros(self, desde: int = 0, hasta: Optional[int] = None) -> Iterator[RegistroTraza]:
+        hasta = self._cantidad if hasta is None else hasta
+        vista = memoryview(self._mm)[desde * REGISTRO.size:hasta * REGISTRO.size]
+        try:
+            for campos in REGISTRO.iter_unpack(vista):
+                yield RegistroTraza(*campos)
+        finally:
+            vista.release()
+
+    def filtrar(self, dia: Optional[int] = None, eventos: Optional[Sequence[int]] = None) -> Iterator[RegistroTraza]:
+        """
+        Registros de un día (0, 1, ...) y/o de ciertos eventos (EVENTO_*).
+        El día se ubica con búsqueda binaria: solo se decodifica ese tramo.
+        """
+        desde, hasta = 0, self._cantidad
+        if dia is not None:
+            desde = self._primer_indice_desde(dia * MINUTOS_POR_DIA)
+            hasta = self._primer_indice_desde((dia + 1) * MINUTOS_POR_DIA)
+        eventos = set(eventos) if eventos is not None else None
+        for registro in self.registros(desde, hasta):
+            if eventos is None or registro.evento in eventos:
+                yield registro
+
+    def cerrar(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._archivo.close()
+
+    def __enter__(self) -> LectorTraza:
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()